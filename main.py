@@ -1,8 +1,33 @@
 # standard library imports
+import logging
 import subprocess
 import sys
 import os
 
+# local/custom imports
+from src.data_models import PipelineStatus
+import src.utils as utils
+
+# ------------------------------------------------------------------------------
+# pipeline stage definitions
+# ------------------------------------------------------------------------------
+
+# each stage is paired with the pipeline_status values it consumes; stages
+#   paired with None depend on external state (rss feeds, transmission) and
+#   always run
+PIPELINE_STAGES = [
+    ("src/core/_01_rss_ingest.py", None),
+    ("src/core/_02_collect.py", None),
+    ("src/core/_03_parse.py", [PipelineStatus.INGESTED]),
+    ("src/core/_04_file_filtration.py", [PipelineStatus.PARSED]),
+    ("src/core/_05_metadata_collection.py", [PipelineStatus.FILE_ACCEPTED]),
+    ("src/core/_06_media_filtration.py", [PipelineStatus.METADATA_COLLECTED]),
+    ("src/core/_07_initiation.py", [PipelineStatus.MEDIA_ACCEPTED]),
+    ("src/core/_08_download_check.py", None),
+    ("src/core/_09_transfer.py", [PipelineStatus.DOWNLOADED]),
+    ("src/core/_10_cleanup.py", None),
+]
+
 # ------------------------------------------------------------------------------
 # end-to-end pipeline for downloading all media
 # ------------------------------------------------------------------------------
@@ -12,16 +37,14 @@ def full_pipeline():
     env = os.environ.copy()
     env['PYTHONPATH'] = os.getcwd()
 
-    subprocess.run([sys.executable, "src/core/_01_rss_ingest.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_02_collect.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_03_parse.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_04_file_filtration.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_05_metadata_collection.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_06_media_filtration.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_07_initiation.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_08_download_check.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_09_transfer.py"], cwd=os.getcwd(), env=env, check=True)
-    subprocess.run([sys.executable, "src/core/_10_cleanup.py"], cwd=os.getcwd(), env=env, check=True)
+    for script, pipeline_statuses in PIPELINE_STAGES:
+        # probe status counts before each stage, as earlier stages advance
+        #   items; skip spawning stages with no pending work
+        if pipeline_statuses is not None and not utils.has_pending_media(pipeline_statuses):
+            logging.debug(f"skipping {script} - no pending media")
+            continue
+
+        subprocess.run([sys.executable, script], cwd=os.getcwd(), env=env, check=True)
 
 # -------------------------------------------------------------------------------
 # main guard
@@ -31,6 +54,7 @@ def main():
     """
     Main function for command-line interface
     """
+    utils.setup_logging()
     full_pipeline()
 
 
@@ -39,4 +63,4 @@ if __name__ == "__main__":
 
 # ------------------------------------------------------------------------------
 # end of main.py
-# ------------------------------------------------------------------------------
\ No newline at end of file
+# ------------------------------------------------------------------------------
@@ -1,6 +1,8 @@
 # standard library imports
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+import urllib.request
 
 # third-party imports
 import feedparser
@@ -15,22 +17,57 @@ from src.data_models import MediaSchema
 # rss ingest helper functions
 # ------------------------------------------------------------------------------
 
+class _FeedTimeoutHandler(urllib.request.BaseHandler):
+    """
+    urllib handler setting the timeout of feed requests, which feedparser
+        otherwise opens without one
+    """
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+
+    def http_request(self, request: urllib.request.Request) -> urllib.request.Request:
+        request.timeout = self.timeout
+        return request
+
+    https_request = http_request
+
+
 def rss_feed_ingest(
     rss_url: str,
-    rss_source: str
+    rss_source: str,
+    timeout: float | None = None,
+    validators: dict | None = None
 ) -> list:
     """
     ping rss feed and store the input
     :param rss_url: url of rss feed
     :param rss_source: source of rss feed as a base url
-    :return: list of rss entries (empty list if feed fails)
+    :param timeout: seconds the feed request may wait to connect or for data
+        (default: AT_RSS_TIMEOUT)
+    :param validators: etag and modified values of the feed's last poll, sent
+        so an unchanged feed answers 304 not modified; updated in place from
+        the response (default: no conditional request)
+    :return: list of rss entries (empty list if feed fails or is unchanged)
     """
+    timeout = timeout or float(os.getenv('AT_RSS_TIMEOUT') or "30")
+
     try:
         # call rss feed
-        feed = feedparser.parse(rss_url)
+        feed = feedparser.parse(
+            rss_url,
+            etag=(validators or {}).get('etag'),
+            modified=(validators or {}).get('modified'),
+            handlers=[_FeedTimeoutHandler(timeout)]
+        )
+
+        # an unchanged feed has no entries to parse or compare to the db
+        if feed.get('status') == 304:
+            logging.debug(f"RSS feed not modified for {rss_source} ({rss_url})")
+            return []
 
         # check if feed parsing failed (bozo bit indicates malformed/failed feed)
-        if hasattr(feed, 'bozo') and feed.bozo:
+        malformed = hasattr(feed, 'bozo') and feed.bozo
+        if malformed:
             if hasattr(feed, 'bozo_exception'):
                 logging.error(f"RSS feed parsing failed for {rss_source} ({rss_url}): {feed.bozo_exception}")
             else:
@@ -56,6 +93,10 @@ def rss_feed_ingest(
         for entry in entries:
             entry['rss_source'] = rss_source
 
+        # keep the validators of a well formed response for the next poll
+        if validators is not None and not malformed:
+            validators.update({key: feed.get(key) for key in ('etag', 'modified')})
+
         return entries
 
     except Exception as e:
@@ -63,6 +104,43 @@ def rss_feed_ingest(
         return []
 
 
+def fetch_rss_feeds(
+    rss_urls: list,
+    rss_sources: list,
+    timeout: float | None = None,
+    validators: dict | None = None
+) -> list:
+    """
+    ping all rss feeds concurrently, so a slow feed only delays ingest by its
+        own response time
+    :param rss_urls: urls of rss feeds
+    :param rss_sources: source of each rss feed as a base url
+    :param timeout: seconds each feed request may wait to connect or for data
+        (default: AT_RSS_TIMEOUT)
+    :param validators: dict of rss url to the validators of its last poll,
+        updated in place from the responses (default: no conditional requests)
+    :return: list of rss entries of all feeds, in feed order
+    """
+    if not rss_urls:
+        return []
+
+    # each feed updates only its own validators
+    feed_validators = [
+        None if validators is None else validators.setdefault(rss_url, {})
+        for rss_url in rss_urls
+    ]
+
+    # map returns each feed's entries in feed order, whichever finishes first
+    with ThreadPoolExecutor(max_workers=len(rss_urls)) as executor:
+        feed_entries = executor.map(
+            lambda rss_url, rss_source, validators: rss_feed_ingest(rss_url, rss_source, timeout, validators),
+            rss_urls,
+            rss_sources,
+            feed_validators
+        )
+        return [entry for entries in feed_entries for entry in entries]
+
+
 def format_entries(entry: FeedParserDict) -> dict:
     """
     converts raw rss entries into dicts suitable for ingestion into a MediaDataFrame
@@ -125,14 +203,14 @@ def rss_ingest():
         logging.error("env var rss_sources does not match length of rss_urls")
         return
 
-    # retrieve entries from all rss feeds
-    all_entries = []
-    for i in range(len(rss_sources)):
-        new_entries = rss_feed_ingest(
-            rss_url=rss_urls[i],
-            rss_source=rss_sources[i]
-        )
-        all_entries.extend(new_entries)
+    # validators from the last poll of each configured feed, if conditional
+    #   requests are enabled
+    validators = utils.load_rss_validators()
+    if validators is not None:
+        validators = {rss_url: validators.get(rss_url, {}) for rss_url in rss_urls}
+
+    # retrieve entries from all rss feeds; unchanged feeds return no entries
+    all_entries = fetch_rss_feeds(rss_urls=rss_urls, rss_sources=rss_sources, validators=validators)
 
     # format each entry for conversion to MediaDataFrame
     formatted_entries = [format_entries(entry=entry) for entry in all_entries]
@@ -148,22 +226,24 @@ def rss_ingest():
             seen_hashes.add(entry['hash'])
             unique_entries.append(entry)
 
-    # early return if no entries
-    if not unique_entries:
-        return
+    # skip the db if no entries, e.g. when every feed is unchanged
+    if unique_entries:
+        # convert to DataFrame
+        media = pl.DataFrame(unique_entries)
 
-    # convert to DataFrame
-    media = pl.DataFrame(unique_entries)
+        # determine which feed entries are new entries
+        new_hashes = utils.compare_hashes_to_db(hashes=media['hash'].to_list())
+        media = media.filter(pl.col('hash').is_in(new_hashes))
 
-    # determine which feed entries are new entries
-    new_hashes = utils.compare_hashes_to_db(hashes=media['hash'].to_list())
-    media = media.filter(pl.col('hash').is_in(new_hashes))
+        if media.height > 0:
+            # validate and write new items to the database
+            media = MediaSchema.validate(media)
+            utils.insert_items_to_db(media=media)
+            log_status(media)
 
-    if media.height > 0:
-        # validate and write new items to the database
-        media = MediaSchema.validate(media)
-        utils.insert_items_to_db(media=media)
-        log_status(media)
+    # store validators only once entries are in the db, so a failed insert
+    #   fetches the feeds in full again on the next poll
+    utils.save_rss_validators(validators)
 
 
 # ------------------------------------------------------------------------------
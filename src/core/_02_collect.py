@@ -10,23 +10,22 @@ import src.utils as utils
 # supporting functions
 # ------------------------------------------------------------------------------
 
-def process_new_items(new_transmission_items: dict) -> pl.DataFrame | None:
+def process_new_items(new_transmission_items: pl.DataFrame) -> pl.DataFrame | None:
     """
     process new media items and return as formatted DataFrame; if the
         name has not processed yet, and the hash == name, then the item will
         be skipped
 
-    :param new_transmission_items: items with new hashes currently in
-        transmission
+    :param new_transmission_items: DataFrame of items with new hashes
+        currently in transmission
     :return: DataFrame with all necessary elements
     """
-    new_media = pl.DataFrame({
-        'hash': new_transmission_items.keys(),
-        'original_title': [inner_values['name'] for inner_values in new_transmission_items.values()],
-        'rejection_status': RejectionStatus.OVERRIDE.value
-    }).with_columns(
-        media_type=pl.col("original_title")
-            .map_elements(utils.classify_media_type, return_dtype=pl.Utf8)
+    new_media = new_transmission_items.select(
+        'hash',
+        original_title = pl.col('name'),
+        rejection_status = pl.lit(RejectionStatus.OVERRIDE.value)
+    ).with_columns(
+        media_type=utils.classify_media_type_expr("original_title")
     ).with_columns(
         error_condition = pl.when(pl.col('media_type') == MediaType.UNKNOWN.value)
             .then(pl.lit("media_type is unknown"))
@@ -76,20 +75,22 @@ def collect_media():
     into automatic-transmission pipeline
     """
     # get media items currently in transmission
-    current_transmission_items = utils.return_current_media_items()
+    current_transmission_items = utils.return_current_media_frame()
 
     # if no torrents in transmission, return
-    if current_transmission_items is None:
+    if current_transmission_items.height == 0:
         return
 
     # get current hashes
-    current_hashes = list(current_transmission_items.keys())
+    current_hashes = current_transmission_items['hash'].to_list()
 
     # process new hashes
     new_hashes = utils.compare_hashes_to_db(current_hashes)
 
     if len(new_hashes) > 0:
-        new_transmission_items = {k: current_transmission_items[k] for k in new_hashes if k in current_transmission_items}
+        new_transmission_items = current_transmission_items.filter(
+            pl.col('hash').is_in(new_hashes)
+        )
         new_media = process_new_items(new_transmission_items)
         if new_media.height > 0:
             new_media = MediaSchema.validate(new_media)
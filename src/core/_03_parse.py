@@ -1,12 +1,14 @@
 # standard library imports
 import logging
+import math
+import os
 from pathlib import Path
 
 # third-party imports
 import yaml
 
 # local/custom imports
-from src.data_models import MediaSchema, PipelineStatus
+from src.data_models import MediaSchema, PipelineStatus, missing_fields_expr
 import src.utils as utils
 import polars as pl
 
@@ -14,24 +16,129 @@ import polars as pl
 # title parse helper functions
 # ------------------------------------------------------------------------------
 
-def parse_media_items(media: pl.DataFrame) -> pl.DataFrame:
+# columns produced by parsing a title, with the dtypes parse_titles returns
+PARSED_TITLE_SCHEMA = {
+    'resolution': pl.Utf8,
+    'video_codec': pl.Utf8,
+    'audio_codec': pl.Utf8,
+    'upload_type': pl.Utf8,
+    'uploader': pl.Utf8,
+    'release_year': pl.Int32,
+    'season': pl.Int32,
+    'episode': pl.Int32,
+    'media_title': pl.Utf8
+}
+
+
+# string-special-conditions.yaml contents by path, with the mtime they were
+#   loaded at, so the file is only read again once it changes
+_special_conditions_cache = {}
+
+
+def load_special_conditions(config_path: str | Path) -> dict:
+    """
+    Load string-special-conditions.yaml once per process, reloading it when the
+        file is modified
+    :param config_path: path of string-special-conditions.yaml
+    :returns: contents of string-special-conditions.yaml
+    """
+    mtime = os.stat(config_path).st_mtime_ns
+    cached = _special_conditions_cache.get(str(config_path))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(config_path, 'r') as file:
+        special_conditions = yaml.safe_load(file)
+    _special_conditions_cache[str(config_path)] = (mtime, special_conditions)
+
+    return special_conditions
+
+
+def parse_titles(
+    titles: pl.DataFrame | pl.LazyFrame,
+    special_conditions: dict
+) -> pl.DataFrame | pl.LazyFrame:
+    """
+    Parse the elements of each title for its media type
+    :param titles: DataFrame, or LazyFrame, of distinct original_title and
+        media_type pairs
+    :param special_conditions: contents of string-special-conditions.yaml
+    :returns: DataFrame, or LazyFrame, of original_title, media_type, and the
+        parsed elements
+    """
+    # Apply pre-processing replacements as literals, all in a single pass
+    replacements = special_conditions['pre_processing_replacements'] or []
+    cleaned_title = pl.col("original_title")
+    if replacements:
+        cleaned_title = cleaned_title.str.replace_many(
+            [old_str for old_str, _ in replacements],
+            [new_str for _, new_str in replacements]
+        )
+    parsed_titles = titles.with_columns(cleaned_title=cleaned_title)
+
+    # Extract every element in a single native polars expression
+    return parsed_titles.select(
+        'original_title',
+        'media_type',
+        utils.parse_release_title_expr("cleaned_title", "media_type").struct.unnest()
+    ).cast(PARSED_TITLE_SCHEMA)
+
+
+def parse_titles_in_chunks(
+    titles: pl.DataFrame,
+    special_conditions: dict,
+    workers: int | None = None,
+    threshold: int | None = None
+) -> pl.DataFrame:
+    """
+    Parse titles in chunks that run concurrently, for large backlogs; smaller
+        batches are parsed in a single pass
+    :param titles: DataFrame of distinct original_title and media_type pairs
+    :param special_conditions: contents of string-special-conditions.yaml
+    :param workers: number of chunks parsed concurrently (default:
+        AT_PARSE_WORKERS, 1 to disable)
+    :param threshold: minimum number of titles to split into chunks (default:
+        AT_PARSE_PARALLEL_THRESHOLD)
+    :returns: DataFrame of original_title, media_type, and the parsed elements
+    """
+    workers = workers or int(os.getenv('AT_PARSE_WORKERS') or "1")
+    threshold = threshold if threshold is not None else int(os.getenv('AT_PARSE_PARALLEL_THRESHOLD') or "10000")
+
+    if workers <= 1 or titles.height < max(threshold, 2):
+        return parse_titles(titles, special_conditions)
+
+    # collect_all runs the chunk queries concurrently on the polars thread
+    #   pool; concatenating them in slice order keeps the result deterministic
+    chunk_size = math.ceil(titles.height / workers)
+    chunks = [
+        parse_titles(chunk.lazy(), special_conditions)
+        for chunk in titles.iter_slices(n_rows=chunk_size)
+    ]
+    logging.debug(f"parsing {titles.height} titles in {len(chunks)} chunks")
+
+    return pl.concat(pl.collect_all(chunks))
+
+
+def parse_media_items(media: pl.DataFrame, use_cache: bool = True) -> pl.DataFrame:
     """
     Parse the title of media items to extract relevant information
     :param media: DataFrame contain all elements to be parsed
+    :param use_cache: read and write the parse cache, if one is configured;
+        disabled to time the parser itself
     :returns: DataFrame with parsed elements
     """
     # For normal execution
     try:
         config_path = Path(__file__).parent.parent.parent / 'config' / 'string-special-conditions.yaml'
+        parser_path = Path(__file__)
     # For IDE/interactive execution
     except NameError:
         config_path = './config/string-special-conditions.yaml'
+        parser_path = './src/core/_03_parse.py'
 
-    with open(config_path, 'r') as file:
-        special_conditions = yaml.safe_load(file)
+    special_conditions = load_special_conditions(config_path)
 
-    # Create a copy of the input DataFrame
-    parsed_media = media.clone()
+    parsed_media = media
 
     # Add missing columns with null values (these columns will be populated during parsing)
     optional_cols = ['release_year', 'season', 'episode']
@@ -39,212 +146,88 @@ def parse_media_items(media: pl.DataFrame) -> pl.DataFrame:
         if col not in parsed_media.columns:
             parsed_media = parsed_media.with_columns(pl.lit(None).cast(pl.Int64).alias(col))
 
-    # Apply pre-processing replacements
-    parsed_media = parsed_media.with_columns(
-        cleaned_title = pl.col("original_title")
+    # parse each distinct title once, reusing results cached by earlier runs
+    #   of the same parser version
+    version = utils.parser_version(
+        parser_path, config_path, utils.parse_element.__file__, utils.VOCABULARIES_PATH
     )
+    titles = parsed_media.select(utils.PARSE_CACHE_KEYS).unique(maintain_order=True)
+    cached_titles = utils.get_cached_parses(titles if use_cache else titles.clear(), version, PARSED_TITLE_SCHEMA)
+    new_titles = parse_titles_in_chunks(
+        titles.join(cached_titles, on=utils.PARSE_CACHE_KEYS, how='anti', nulls_equal=True),
+        special_conditions
+    )
+    if use_cache:
+        utils.cache_parses(new_titles, version)
+    logging.debug(f"parse cache hits {cached_titles.height}/{titles.height}")
 
-    for old_str, new_str in special_conditions['pre_processing_replacements']:
-        parsed_media = parsed_media.with_columns(
-            cleaned_title = pl.col("cleaned_title").str.replace(old_str, new_str)
-        )
-
-    # Extract common patterns using vectorized operations
-    parsed_media = parsed_media.with_columns(
-        resolution=pl.col("cleaned_title").map_elements(utils.extract_resolution, return_dtype=pl.Utf8),
-        video_codec=pl.col("cleaned_title").map_elements(utils.extract_video_codec, return_dtype=pl.Utf8),
-        audio_codec=pl.col("cleaned_title").map_elements(utils.extract_audio_codec, return_dtype=pl.Utf8),
-        upload_type=pl.col("cleaned_title").map_elements(utils.extract_upload_type, return_dtype=pl.Utf8),
-        uploader=pl.col("cleaned_title").map_elements(utils.extract_uploader, return_dtype=pl.Utf8)
+    parsed_titles = pl.concat([cached_titles, new_titles]).rename(
+        {col: f"parsed_{col}" for col in PARSED_TITLE_SCHEMA}
+    )
+    parsed_media = parsed_media.join(
+        parsed_titles,
+        on=utils.PARSE_CACHE_KEYS,
+        how='left',
+        nulls_equal=True,
+        maintain_order='left'
     )
 
     # process based on media type
-    movie_mask = parsed_media['media_type'] == "movie"
-    if movie_mask.any():
-        parsed_media = parsed_media.with_columns(
-            release_year = pl.when(movie_mask)
-                .then(pl.col('cleaned_title').map_elements(
-                    utils.extract_year,
-                    return_dtype=pl.Int32
-                )).otherwise(pl.col('release_year'))
-        )
-
-    tv_show_mask = parsed_media['media_type'] == "tv_show"
-    if tv_show_mask.any():
-        parsed_media = parsed_media.with_columns(
-            season = pl.when(tv_show_mask)
-                .then(pl.col('cleaned_title').map_elements(
-                    utils.extract_season_from_episode,
-                    return_dtype=pl.Int32
-                )).otherwise(pl.col('season')),
-            episode = pl.when(tv_show_mask)
-                .then(pl.col('cleaned_title').map_elements(
-                    utils.extract_episode_from_episode,
-                    return_dtype=pl.Int32
-                )).otherwise(pl.col('episode'))
-        )
-
-    tv_season_mask = parsed_media['media_type'] == "tv_season"
-    if tv_season_mask.any():
-        parsed_media = parsed_media.with_columns(
-            season=pl.when(tv_season_mask)
-                .then(pl.col('cleaned_title').map_elements(
-                    utils.extract_season_from_season,
-                    return_dtype=pl.Int32
-                )).otherwise(pl.col('season'))
-        )
-
-    tv_episode_pack_mask = parsed_media['media_type'] == "tv_episode_pack"
-    if tv_episode_pack_mask.any():
-        parsed_media = parsed_media.with_columns(
-            season=pl.when(tv_episode_pack_mask)
-                .then(pl.col('cleaned_title').map_elements(
-                    utils.extract_season_from_episode_pack,
-                    return_dtype=pl.Int32
-                )).otherwise(pl.col('season'))
-        )
-
-    # extract media_title
+    media_type = pl.col('media_type')
     parsed_media = parsed_media.with_columns(
-        media_title=pl.struct(["cleaned_title", "media_type"]).map_elements(
-                lambda x: utils.extract_title(x["cleaned_title"], x["media_type"]),
-                return_dtype=pl.Utf8
-        )
+        resolution=pl.col('parsed_resolution'),
+        video_codec=pl.col('parsed_video_codec'),
+        audio_codec=pl.col('parsed_audio_codec'),
+        upload_type=pl.col('parsed_upload_type'),
+        uploader=pl.col('parsed_uploader'),
+        release_year = pl.when(media_type == "movie")
+            .then(pl.col('parsed_release_year'))
+            .otherwise(pl.col('release_year')),
+        season = pl.when(media_type.is_in(["tv_show", "tv_season", "tv_episode_pack"]))
+            .then(pl.col('parsed_season'))
+            .otherwise(pl.col('season')),
+        episode = pl.when(media_type == "tv_show")
+            .then(pl.col('parsed_episode'))
+            .otherwise(pl.col('episode')),
+        media_title = pl.col('parsed_media_title')
     )
 
-    # drop the cleaned title
-    parsed_media.drop_in_place('cleaned_title')
-
-    return parsed_media
+    # drop the parsed columns
+    return parsed_media.drop([f"parsed_{col}" for col in PARSED_TITLE_SCHEMA])
 
 
-def validate_parsed_media(media: pl.DataFrame) -> pl.DataFrame:
+def validate_parsed_media(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     validates media data based on the media type and update error status columns.
-    :param media : DataFrame containing parsed elements
-    :returns verified_media: DataFrame with verification check elements
-        contained within
+    :param media : DataFrame, or LazyFrame, containing parsed elements
+    :returns verified_media: DataFrame, or LazyFrame, with verification check
+        elements contained within
     """
-    verified_media = media.clone()
+    columns = media.collect_schema().names()
 
     # Add error_condition column if missing
-    if 'error_condition' not in verified_media.columns:
+    verified_media = media
+    if 'error_condition' not in columns:
         verified_media = verified_media.with_columns(pl.lit(None).cast(pl.Utf8).alias('error_condition'))
 
-    # Define mandatory fields for each media type
-    mandatory_fields = {
-        'all_media': ['media_title'],
-        'movie': ['release_year'],
-        'tv_show': ['season', 'episode'],
-        'tv_season': ['season'],
-        'tv_episode_pack': ['season']
-    }
-
-    # verify mandatory fields for all media types
-    for field in mandatory_fields['all_media']:
-        verified_media = verified_media.with_columns(
-            error_condition = pl.when(pl.col(field).is_null())
-                .then(
-                    pl.when(pl.col('error_condition').is_null())
-                    .then(pl.lit(f"{field} is null"))
-                    .otherwise(pl.concat_str(
-                        pl.col('error_condition'),
-                        pl.lit(f"; {field} is null")
-                    ))
-                )
-                .otherwise(pl.col('error_condition'))
-        )
-
-    # verify mandatory fields for specific media types
-    movie_mask = verified_media['media_type'] == "movie"
-    if movie_mask.any():
-        for field in mandatory_fields['movie']:
-            null_mask = pl.col(field).is_null()
-            verified_media = verified_media.with_columns(
-                error_condition=pl.when(movie_mask).then(
-                    pl.when(null_mask)
-                        .then(
-                            pl.when(pl.col('error_condition').is_null())
-                            .then(pl.lit(f"{field} is null"))
-                            .otherwise(pl.concat_str(
-                                pl.col('error_condition'),
-                                pl.lit(f"; {field} is null")
-                            ))
-                        )
-                        .otherwise(pl.col('error_condition'))
-                ).otherwise('error_condition')
-            )
-
-    tv_show_mask = verified_media['media_type'] == "tv_show"
-    if tv_show_mask.any():
-        for field in mandatory_fields['tv_show']:
-            null_mask = pl.col(field).is_null()
-            verified_media = verified_media.with_columns(
-                error_condition=pl.when(tv_show_mask).then(
-                    pl.when(null_mask)
-                        .then(
-                            pl.when(pl.col('error_condition').is_null())
-                            .then(pl.lit(f"{field} is null"))
-                            .otherwise(pl.concat_str(
-                                pl.col('error_condition'),
-                                pl.lit(f"; {field} is null")
-                            ))
-                        )
-                        .otherwise(pl.col('error_condition'))
-                ).otherwise('error_condition')
-            )
-
-    tv_season_mask = verified_media['media_type'] == "tv_season"
-    if tv_season_mask.any():
-        for field in mandatory_fields['tv_season']:
-            null_mask = pl.col(field).is_null()
-            verified_media = verified_media.with_columns(
-                error_condition=pl.when(tv_season_mask).then(
-                    pl.when(null_mask)
-                        .then(
-                            pl.when(pl.col('error_condition').is_null())
-                            .then(pl.lit(f"{field} is null"))
-                            .otherwise(pl.concat_str(
-                                pl.col('error_condition'),
-                                pl.lit(f"; {field} is null")
-                            ))
-                        )
-                        .otherwise(pl.col('error_condition'))
-                ).otherwise('error_condition')
-            )
-
-    tv_episode_pack_mask = verified_media['media_type'] == "tv_episode_pack"
-    if tv_episode_pack_mask.any():
-        for field in mandatory_fields['tv_episode_pack']:
-            null_mask = pl.col(field).is_null()
-            verified_media = verified_media.with_columns(
-                error_condition=pl.when(tv_episode_pack_mask).then(
-                    pl.when(null_mask)
-                        .then(
-                            pl.when(pl.col('error_condition').is_null())
-                            .then(pl.lit(f"{field} is null"))
-                            .otherwise(pl.concat_str(
-                                pl.col('error_condition'),
-                                pl.lit(f"; {field} is null")
-                            ))
-                        )
-                        .otherwise(pl.col('error_condition'))
-                ).otherwise('error_condition')
-            )
+    # check the mandatory fields of every media type in one pass
+    verified_media = verified_media.with_columns(
+        missing_fields_expr(columns=columns)
+    )
 
     return verified_media
 
 
-def update_status(media: pl.DataFrame) -> pl.DataFrame:
+def update_status(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     updates status flags based off of conditions
 
-    :param media: DataFrame with old status flags
-    :return: updated DataFrame with correct status flags
+    :param media: DataFrame, or LazyFrame, with old status flags
+    :return: updated DataFrame, or LazyFrame, with correct status flags
     """
     # Add error_condition column if missing
-    updated_media = media.clone()
-    if 'error_condition' not in updated_media.columns:
+    updated_media = media
+    if 'error_condition' not in media.collect_schema().names():
         updated_media = updated_media.with_columns(pl.lit(None).cast(pl.Utf8).alias('error_condition'))
 
     # update status of successfully parsed items (check error_condition directly
@@ -278,6 +261,10 @@ def parse_media():
     """
     full ingest pipeline for either movies or tv shows
     """
+    # exit early if no items are waiting to be parsed
+    if not utils.has_pending_media([PipelineStatus.INGESTED]):
+        return
+
     # read in existing data based on ingest_type
     media = utils.get_media_from_db(pipeline_status=PipelineStatus.INGESTED)
 
@@ -285,12 +272,11 @@ def parse_media():
     if media is None:
         return
 
-    # parse and validate media items
+    # parse media items, then validate them and update status in one query
     media = parse_media_items(media)
-    media = validate_parsed_media(media)
+    media = update_status(validate_parsed_media(media.lazy())).collect()
 
-    # write to db and update status
-    media = update_status(media)
+    # write to db
     media = MediaSchema.validate(media)
     utils.media_db_update(media=media)
     log_status(media)
@@ -68,17 +68,17 @@ def filter_by_file_metadata(media_item: dict) -> dict:
     return media_item
 
 
-def update_status(media: pl.DataFrame) -> pl.DataFrame:
+def update_status(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     updates status flags based off of conditions
 
-    :param media: DataFrame with old status flags
-    :return: updated DataFrame with correct status flags
+    :param media: DataFrame, or LazyFrame, with old status flags
+    :return: updated DataFrame, or LazyFrame, with correct status flags
     """
-    media_with_updated_status = media.clone()
+    media_with_updated_status = media
 
     # Add rejection_reason column if missing
-    if 'rejection_reason' not in media_with_updated_status.columns:
+    if 'rejection_reason' not in media.collect_schema().names():
         media_with_updated_status = media_with_updated_status.with_columns(
             pl.lit(None).cast(pl.Utf8).alias('rejection_reason')
         )
@@ -127,6 +127,10 @@ def filter_files():
     full pipeline for filtering all media items based off of the file metadata,
     	e.g. resolution, codec, media_type, etc.
     """
+    # exit early if no items are waiting to be filtered
+    if not utils.has_pending_media([PipelineStatus.PARSED]):
+        return
+
     # read in existing data based on ingest_type
     media = utils.get_media_from_db(pipeline_status='parsed')
 
@@ -161,7 +165,7 @@ def filter_files():
         return
 
     # update status
-    media = update_status(media)
+    media = update_status(media.lazy()).collect()
 
     # commit to db
     media = MediaSchema.validate(media)
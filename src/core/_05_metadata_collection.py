@@ -342,11 +342,10 @@ def process_media_with_existing_metadata(
     :param existing_metadata: existing metadata indexed IMDB
     :return: DataFrame with metadata attached and ready for upload
     """
-    media_with_metadata = media.clone()
-    metadata_to_join = existing_metadata.clone()
+    media_with_metadata = media
 
     # select which fields to not join
-    metadata_to_join = metadata_to_join.drop([
+    metadata_to_join = existing_metadata.drop([
         'media_type',
         'media_title'
     ])
@@ -380,16 +379,14 @@ def process_media_with_existing_metadata(
 # update and log status functions
 # ------------------------------------------------------------------------------
 
-def update_status(media: pl.DataFrame) -> pl.DataFrame:
+def update_status(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     updates status flags based off of conditions
 
-    :param media: DataFrame with old status flags
-    :return: updated DataFrame with correct status flags
+    :param media: DataFrame, or LazyFrame, with old status flags
+    :return: updated DataFrame, or LazyFrame, with correct status flags
     """
-    media_with_updated_status = media.clone()
-
-    media_with_updated_status = media_with_updated_status.with_columns(
+    media_with_updated_status = media.with_columns(
         pipeline_status = pl.when(
             (pl.col('rejection_status').is_in([RejectionStatus.ACCEPTED.value, RejectionStatus.OVERRIDE.value])) &
             (pl.col('error_status') == False)
@@ -486,6 +483,10 @@ def collect_metadata():
     batch_size = int(os.getenv('AT_BATCH_SIZE') or "50")
     stale_metadata_threshold = int(os.getenv('AT_STALE_METADATA_THRESHOLD') or "30")
 
+    # exit early if no items are waiting for metadata
+    if not utils.has_pending_media([PipelineStatus.FILE_ACCEPTED]):
+        return
+
     # read in existing data
     media = utils.get_media_from_db(pipeline_status='file_accepted')
 
@@ -101,40 +101,36 @@ def get_prediction(media_item: dict) -> dict:
 # support functions that operate on multiple items as a DataFrame
 # -----------------------------------------------------------------------------
 
-def process_exempt_items(media: pl.DataFrame) -> pl.DataFrame:
+def process_exempt_items(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     processes items that do not need media filtering
 
-    :param media: unprocessed DataFrame
-    :return: updated DataFrame with the status updated to correspond
-        with the label
+    :param media: unprocessed DataFrame, or LazyFrame
+    :return: updated DataFrame, or LazyFrame, with the status updated to
+        correspond with the label
     """
-    if media.height == 0:
+    if isinstance(media, pl.DataFrame) and media.height == 0:
         return media
 
-    media_exempt = media.clone()
-
-    media_exempt = media_exempt.filter(
+    media_exempt = media.filter(
         pl.col('media_type').is_in([MediaType.TV_SHOW.value, MediaType.TV_SEASON.value])
     )
 
     return media_exempt
 
 
-def reject_media_without_imdb_id(media: pl.DataFrame) -> pl.DataFrame:
+def reject_media_without_imdb_id(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     set rejection_reason for items with no imdb_id
 
-    :param media: DataFrame that contains elements potentially with
-        and without imdb_id's
-    :return: DataFrame of elements with no imdb_id
+    :param media: DataFrame, or LazyFrame, that contains elements potentially
+        with and without imdb_id's
+    :return: DataFrame, or LazyFrame, of elements with no imdb_id
     """
-    if media.height == 0:
+    if isinstance(media, pl.DataFrame) and media.height == 0:
         return media
 
-    media_without_imdb_id = media.clone()
-
-    media_without_imdb_id = media_without_imdb_id.filter(
+    media_without_imdb_id = media.filter(
         pl.col('imdb_id').is_null()
     ).with_columns(
         rejection_reason = pl.lit("no imdb_id for media filtration")
@@ -163,7 +159,7 @@ def process_prelabeled_items(
     if anomalous_items.height == 0:
         return pl.DataFrame()  # No anomalous items to process
 
-    media_prelabeled = media.clone()
+    media_prelabeled = media
 
     # Add rejection_reason column if missing
     if 'rejection_reason' not in media_prelabeled.columns:
@@ -211,7 +207,7 @@ def get_predictions(media: pl.DataFrame) -> pl.DataFrame:
     api_port = os.getenv('REEL_DRIVER_PORT')
     api_prefix = os.getenv('REEL_DRIVER_PREFIX')
 
-    media_with_predictions = media.clone()
+    media_with_predictions = media
 
     # Get unique imdb_ids for metadata lookup
     imdb_ids = media_with_predictions.filter(
@@ -276,13 +272,13 @@ def get_predictions(media: pl.DataFrame) -> pl.DataFrame:
 # support logic for updating status and displaying log output
 # -----------------------------------------------------------------------------
 
-def update_status(media: pl.DataFrame) -> pl.DataFrame:
+def update_status(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     properly updates all relevant status using the filtered DataFrame
 
-    :param media: DataFrame with the probability attached or the
-        error_condition if the probability could not be obtained
-    :return: updated DataFrame with all errors properly tagged
+    :param media: DataFrame, or LazyFrame, with the probability attached or
+        the error_condition if the probability could not be obtained
+    :return: updated DataFrame, or LazyFrame, with all errors properly tagged
 
     :debug: media = media_batch
     media_with_updated_status = pl.DataFrame(
@@ -303,16 +299,17 @@ def update_status(media: pl.DataFrame) -> pl.DataFrame:
     # load pipeline env vars
     acceptance_threshold = float(os.getenv('AT_REEL_DRIVER_THRESHOLD') or "0.35")
 
-    media_with_updated_status = media.clone()
+    media_with_updated_status = media
+    columns = media.collect_schema().names()
 
     # Add error_condition column if missing
-    if 'error_condition' not in media_with_updated_status.columns:
+    if 'error_condition' not in columns:
         media_with_updated_status = media_with_updated_status.with_columns(
             pl.lit(None).cast(pl.Utf8).alias('error_condition')
         )
 
     # perform updates on items with predictions
-    if 'probability' in media_with_updated_status.columns:
+    if 'probability' in columns:
         # First ensure probability is Float64 for comparison
         media_with_updated_status = media_with_updated_status.with_columns(
             pl.col('probability').cast(pl.Float64)
@@ -426,18 +423,21 @@ def filter_media():
     # pipeline env vars
     batch_size = int(os.getenv('AT_BATCH_SIZE') or "50")
 
+    # exit early if no items are waiting to be filtered
+    if not utils.has_pending_media([PipelineStatus.METADATA_COLLECTED]):
+        return
+
     # read in existing data based on ingest_type
     media = utils.get_media_from_db(pipeline_status=PipelineStatus.METADATA_COLLECTED)
 
     if media is None:
         return
 
-    # process items that do not need media filtering
-    media_exempt = process_exempt_items(media)
+    # process items that do not need media filtering, and update their status
+    media_exempt = update_status(process_exempt_items(media.lazy())).collect()
 
     if media_exempt.height > 0:
-        # update status, commit to db, and log
-        media_exempt = update_status(media_exempt)
+        # commit to db, and log
         update_training_labels(media_exempt)
         utils.media_db_update(media=MediaSchema.validate(media_exempt))
         log_status(media_exempt)
@@ -449,12 +449,11 @@ def filter_media():
     if media.height == 0:
         return
 
-    # reject items with no valid imdb_id
-    media_without_imdb_id = reject_media_without_imdb_id(media)
+    # reject items with no valid imdb_id, and update their status
+    media_without_imdb_id = update_status(reject_media_without_imdb_id(media.lazy())).collect()
 
     if media_without_imdb_id.height > 0:
-        # update status, commit to db, and log
-        media_without_imdb_id = update_status(media_without_imdb_id)
+        # commit to db, and log
         update_training_labels(media_without_imdb_id)
         utils.media_db_update(media=MediaSchema.validate(media_without_imdb_id))
         log_status(media_without_imdb_id)
@@ -517,7 +516,7 @@ def filter_media():
             batch_end_index = min((batch + 1) * batch_size, media.height)
 
             # create media batch
-            media_batch = media[batch_start_index:batch_end_index].clone()
+            media_batch = media[batch_start_index:batch_end_index]
 
             try:
                 # attempt to hit the prediction batch API
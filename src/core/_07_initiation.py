@@ -14,35 +14,52 @@ import src.utils as utils
 # utility functions
 # ------------------------------------------------------------------------------
 
-def initiate_media_item(media_item: dict) -> dict:
+def initiate_media_items(media: pl.DataFrame) -> pl.DataFrame:
     """
-    attempts to initiate media items, and if collects error information if
-        initiation fails
-    :param media_item: contains data of individual
-    :return media_item: updated dict containing status and/or error data
+    attempts to initiate all media items concurrently, and collects error
+        information for each item where initiation fails
+    :param media: DataFrame containing items to initiate
+    :return: updated DataFrame containing error data for failed items
 
     :debug:
     """
-    # attempt to initiate each item
-    try:
-        utils.add_media_item(media_item['hash'])
-    except Exception as e:
-        media_item['error_condition'] = f"initiate_item error: {e}"
+    media_initiated = media
 
-    return media_item
+    # Add error_condition column if missing
+    if 'error_condition' not in media_initiated.columns:
+        media_initiated = media_initiated.with_columns(
+            pl.lit(None).cast(pl.Utf8).alias('error_condition')
+        )
 
+    # attempt to initiate all items
+    initiation_errors = utils.add_media_items(media_initiated['hash'].to_list())
 
-def update_status(media: pl.DataFrame) -> pl.DataFrame:
+    error_conditions = {
+        hash: f"initiate_item error: {error}"
+        for hash, error in initiation_errors.items()
+        if error is not None
+    }
+
+    return media_initiated.with_columns(
+        error_condition = pl.col('hash').replace_strict(
+            error_conditions,
+            default=pl.col('error_condition'),
+            return_dtype=pl.Utf8
+        )
+    )
+
+
+def update_status(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     updates status flags based off of conditions
 
-    :param media: DataFrame with old status flags
-    :return: updated DataFrame with correct status flags
+    :param media: DataFrame, or LazyFrame, with old status flags
+    :return: updated DataFrame, or LazyFrame, with correct status flags
     """
-    media_with_updated_status = media.clone()
+    media_with_updated_status = media
 
     # Add error_condition column if missing
-    if 'error_condition' not in media_with_updated_status.columns:
+    if 'error_condition' not in media.collect_schema().names():
         media_with_updated_status = media_with_updated_status.with_columns(
             pl.lit(None).cast(pl.Utf8).alias('error_condition')
         )
@@ -89,6 +106,10 @@ def initiate_media_download():
     # pipeline env vars
     batch_size = int(os.getenv('AT_BATCH_SIZE') or "50")
 
+    # exit early if no items are waiting to be initiated
+    if not utils.has_pending_media([PipelineStatus.MEDIA_ACCEPTED]):
+        return
+
     # read in existing data based
     media = utils.get_media_from_db(pipeline_status=PipelineStatus.MEDIA_ACCEPTED)
 
@@ -107,16 +128,11 @@ def initiate_media_download():
         batch_end_index = min((batch + 1) * batch_size, media.height)
 
         # create media batch
-        media_batch = media[batch_start_index:batch_end_index].clone()
+        media_batch = media[batch_start_index:batch_end_index]
 
         try:
             # initiate all queued downloads
-            updated_rows = []
-            for idx, row in enumerate(media_batch.iter_rows(named=True)):
-                updated_row = initiate_media_item(row)
-                updated_rows.append(updated_row)
-
-            media_batch = pl.DataFrame(updated_rows)
+            media_batch = initiate_media_items(media_batch)
 
             logging.debug(f"completed initiation batch {batch+1}/{number_of_batches}")
 
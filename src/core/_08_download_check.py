@@ -13,72 +13,64 @@ import src.utils as utils
 # ------------------------------------------------------------------------------
 
 def confirm_downloading_status(
-    media: pl.DataFrame,
-    current_media_items: dict | None
-) -> pl.DataFrame:
+    media: pl.DataFrame | pl.LazyFrame,
+    current_media_items: pl.DataFrame
+) -> pl.DataFrame | pl.LazyFrame:
     """
     determine if items tagged as pipeline_status = 'downloading' are in fact
         downloading
 
-    :param media: DataFrame are all 'downloading' items
-    :param current_media_items: dict of media current items in transmission
-    :return:
+    :param media: DataFrame, or LazyFrame, are all 'downloading' items
+    :param current_media_items: DataFrame of current items in transmission
+    :return: DataFrame, or LazyFrame, of items not found within transmission
     """
-    if media.height == 0:
+    if isinstance(media, pl.DataFrame) and media.height == 0:
         return media
 
-    media_not_downloading = media.clone()
-
-    # if database items in downloading state, but no items with transmission
-    #   label error condition, which will trigger re-ingest
-    if current_media_items is None:
-        media_not_downloading = media_not_downloading.with_columns(
-            error_condition=pl.lit("not found within transmission")
-        )
-    # if only some items missing from transmission, label only the items
-    #   missing
-    else:
-        current_hashes = list(current_media_items.keys())
-
-        media_not_downloading = media_not_downloading.filter(
-            ~pl.col('hash').is_in(current_hashes)
-        ).with_columns(
-            error_condition = pl.lit("not found within transmission")
-        )
+    # label database items missing from transmission with an error condition,
+    #   which will trigger re-ingest; if transmission is empty all items are
+    #   labeled
+    media_not_downloading = media.filter(
+        ~pl.col('hash').is_in(current_media_items['hash'].to_list())
+    ).with_columns(
+        error_condition = pl.lit("not found within transmission")
+    )
 
     return media_not_downloading
 
 
 def extract_and_verify_filename(
-    media: pl.DataFrame,
-    downloaded_media_items: dict
-) -> pl.DataFrame:
+    media: pl.DataFrame | pl.LazyFrame,
+    downloaded_media_items: pl.DataFrame
+) -> pl.DataFrame | pl.LazyFrame:
     """
     extracts, verifies, and inserts original_path to DataFrame
 
-    :param media: DataFrame without original_path
+    :param media: DataFrame, or LazyFrame, without original_path
     :param downloaded_media_items: metadata for items in transmission
-    :return: dict with updated file_name or error information
+    :return: DataFrame, or LazyFrame, with updated file_name or error
+        information
     """
-    media_with_paths = media.clone()
+    media_with_paths = media
+    columns = media.collect_schema().names()
 
     # Add original_path column if missing
-    if 'original_path' not in media_with_paths.columns:
+    if 'original_path' not in columns:
         media_with_paths = media_with_paths.with_columns(
             pl.lit(None).cast(pl.Utf8).alias('original_path')
         )
 
     # Add error_condition column if missing
-    if 'error_condition' not in media_with_paths.columns:
+    if 'error_condition' not in columns:
         media_with_paths = media_with_paths.with_columns(
             pl.lit(None).cast(pl.Utf8).alias('error_condition')
         )
 
     # get file paths
-    original_file_paths = pl.DataFrame([
-        {'hash': k, 'original_path': v['name']}
-        for k, v in downloaded_media_items.items()
-    ]).with_columns(
+    original_file_paths = downloaded_media_items.select(
+        'hash',
+        original_path = pl.col('name')
+    ).with_columns(
         original_path = pl.col("original_path").fill_null("None")
     ).with_columns(
         error_condition = pl.when(
@@ -96,6 +88,10 @@ def extract_and_verify_filename(
             .otherwise(pl.col('original_path'))
     )
 
+    # LazyFrame.update takes another LazyFrame
+    if isinstance(media_with_paths, pl.LazyFrame):
+        original_file_paths = original_file_paths.lazy()
+
     media_with_paths = media_with_paths.update(
         original_file_paths,
         on='hash'
@@ -104,23 +100,24 @@ def extract_and_verify_filename(
     return media_with_paths
 
 
-def update_status(media: pl.DataFrame) -> pl.DataFrame:
+def update_status(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     updates status flags based off of conditions
 
-    :param media: DataFrame with old status flags
-    :return: updated DataFrame with correct status flags
+    :param media: DataFrame, or LazyFrame, with old status flags
+    :return: updated DataFrame, or LazyFrame, with correct status flags
     """
-    media_with_updated_status = media.clone()
+    media_with_updated_status = media
+    columns = media.collect_schema().names()
 
     # Add error_condition column if missing
-    if 'error_condition' not in media_with_updated_status.columns:
+    if 'error_condition' not in columns:
         media_with_updated_status = media_with_updated_status.with_columns(
             pl.lit(None).cast(pl.Utf8).alias('error_condition')
         )
 
     # Add rejection_reason column if missing
-    if 'rejection_reason' not in media_with_updated_status.columns:
+    if 'rejection_reason' not in columns:
         media_with_updated_status = media_with_updated_status.with_columns(
             pl.lit(None).cast(pl.Utf8).alias('rejection_reason')
         )
@@ -185,9 +182,14 @@ def check_downloads():
         if download is complete
     """
     # read in existing data based on ingest_type
-    #   check for orphaned transferred items as well
-    media_downloading = utils.get_media_from_db(pipeline_status='downloading')
-    media_transferred = utils.get_media_from_db(pipeline_status='transferred')
+    #   check for orphaned transferred items as well; skip both reads if the
+    #   status probe shows nothing in either state
+    if utils.has_pending_media([PipelineStatus.DOWNLOADING, PipelineStatus.TRANSFERRED]):
+        media_downloading = utils.get_media_from_db(pipeline_status='downloading')
+        media_transferred = utils.get_media_from_db(pipeline_status='transferred')
+    else:
+        media_downloading = None
+        media_transferred = None
 
     if media_downloading is None and media_transferred is None:
          media = None
@@ -201,54 +203,61 @@ def check_downloads():
             media_transferred
         ], how="diagonal_relaxed")
 
-    # get current media item info
-    current_media_items = utils.return_current_media_items()
+    # get current media item info, and the daemons that could not be reached
+    current_media_items, unreachable_endpoints = utils.return_current_media_state()
 
     # if no media items and no transmission items, return
-    if media is None and current_media_items is None:
+    if media is None and current_media_items.height == 0:
         return
 
     # if not items in downloading or transferred state, but items exist in
     #   current_media_items, retrieve them by hash
-    if media is None and current_media_items is not None:
-        media = utils.get_media_by_hash(list(current_media_items.keys()))
-
-    # process items for re-ingestion
-    media_not_downloading = confirm_downloading_status(
-        media,
-        current_media_items
-    )
+    if media is None:
+        media = utils.get_media_by_hash(current_media_items['hash'].to_list())
+
+    # items are not tracked per daemon, so any item missing from the listing
+    #   may be held by a daemon that did not answer; only check for items not
+    #   downloading when every daemon answered
+    if unreachable_endpoints:
+        logging.warning(
+            f"skipping re-ingest check, transmission daemons unreachable - "
+            f"{', '.join(f'{host}:{port}' for host, port in unreachable_endpoints)}"
+        )
+    else:
+        # process items for re-ingestion, and update their status
+        media_not_downloading = update_status(confirm_downloading_status(
+            media.lazy(),
+            current_media_items
+        )).collect()
 
-    # re-ingest items not downloading if needed
-    if media_not_downloading.height > 0:
-        media_not_downloading = update_status(media_not_downloading)
-        utils.media_db_update(media=MediaSchema.validate(media_not_downloading))
-        log_status(media_not_downloading)
+        # re-ingest items not downloading if needed
+        if media_not_downloading.height > 0:
+            utils.media_db_update(media=MediaSchema.validate(media_not_downloading))
+            log_status(media_not_downloading)
 
-        # remove reingested items from processing
-        media = media.join(media_not_downloading.select('hash'), on='hash', how='anti')
+            # remove reingested items from processing
+            media = media.join(media_not_downloading.select('hash'), on='hash', how='anti')
 
     # remove transferred items from processing
     media = media.filter(pl.col('pipeline_status') != PipelineStatus.TRANSFERRED.value)
 
     # if no current_media_items, return
-    if current_media_items is None:
+    if current_media_items.height == 0:
         return
 
     # filter by items with download complete
-    downloaded_media_items = {k: v for k, v in current_media_items.items() if v['progress'] == 100.0}
+    downloaded_media_items = current_media_items.filter(pl.col('progress') == 100.0)
 
-    media = media.filter(pl.col('hash').is_in(downloaded_media_items))
+    media = media.filter(pl.col('hash').is_in(downloaded_media_items['hash'].to_list()))
 
     # if no items downloaded, return
     if media.height == 0:
         return
 
-    # extract file names from completed downloads
-    media = extract_and_verify_filename(media, downloaded_media_items)
+    # extract file names from completed downloads, and update status
+    media = update_status(extract_and_verify_filename(media.lazy(), downloaded_media_items)).collect()
 
-    # update status, commit to db, and log
-    media = update_status(media)
+    # commit to db, and log
     utils.media_db_update(media=MediaSchema.validate(media))
     log_status(media)
 
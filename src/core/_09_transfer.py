@@ -89,14 +89,16 @@ def generate_file_paths(media_item: dict) -> dict:
     return media_item
 
 
-def transfer_item(media_item: dict) -> dict:
+def transfer_item(media_item: dict, download_dir: str | None = None) -> dict:
     """
     Transfer downloaded media items to the appropriate directory
     :param media_item: media dict containing one row of media.df
+    :param download_dir: local mount of the download dir of the daemon
+        holding the item; AT_DOWNLOAD_DIR if None
     :return: updated media dict that contains error info if applicable
     """
     # set directory env vars
-    download_dir = os.getenv('AT_DOWNLOAD_DIR')
+    download_dir = download_dir or os.getenv('AT_DOWNLOAD_DIR')
 
     # Use merge mode for episode packs (add to existing season folder)
     # Use overwrite mode for seasons (full replacement)
@@ -118,17 +120,17 @@ def transfer_item(media_item: dict) -> dict:
     return media_item
 
 
-def update_status(media: pl.DataFrame) -> pl.DataFrame:
+def update_status(media: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
     """
     updates status flags based off of conditions
 
-    :param media: DataFrame with old status flags
-    :return: updated DataFrame with correct status flags
+    :param media: DataFrame, or LazyFrame, with old status flags
+    :return: updated DataFrame, or LazyFrame, with correct status flags
     """
-    media_with_updated_status = media.clone()
+    media_with_updated_status = media
 
     # Add error_condition column if missing
-    if 'error_condition' not in media_with_updated_status.columns:
+    if 'error_condition' not in media.collect_schema().names():
         media_with_updated_status = media_with_updated_status.with_columns(
             pl.lit(None).cast(pl.Utf8).alias('error_condition')
         )
@@ -174,6 +176,10 @@ def transfer_media():
 
     :debug: media_item = media[0].to_dicts()[0]
     """
+    # exit early if no items are waiting to be transferred
+    if not utils.has_pending_media([PipelineStatus.DOWNLOADED]):
+        return
+
     # read in existing data based on ingest_type
     media = utils.get_media_from_db(pipeline_status='downloaded')
 
@@ -204,38 +210,53 @@ def transfer_media():
     if media.height == 0:
         return
 
-    # iterate through each transfer and update individually
-    for media_item in media.iter_rows(named=True):
+    # find the download dir of the daemon holding each item; items that may be
+    #   held by a daemon that did not answer are left for the next run rather
+    #   than moved from a guessed dir
+    download_dirs, unknown_dirs = utils.get_download_dirs(media['hash'].to_list())
+    if unknown_dirs:
+        logging.warning(f"skipping {len(unknown_dirs)} items held by unreachable transmission daemons")
+        media = media.filter(~pl.col('hash').is_in(unknown_dirs))
+
+    # iterate through each transfer and update individually; status updates
+    #   are validated as they are buffered, so an invalid item is stored with
+    #   its error condition, and committed to the db in bulk
+    with utils.MediaWriteBuffer(validator=MediaSchema.validate) as write_buffer:
+        for media_item in media.iter_rows(named=True):
+
+            # transfer media
+            try:
+                media_item = transfer_item(media_item, download_dirs.get(media_item['hash']))
 
-        # transfer media
-        try:
-            media_item = transfer_item(media_item)
+                # cast to DataFrame to update status
+                media_singular = pl.DataFrame([media_item])
 
-            # cast to DataFrame to perform validation
-            media_singular = pl.DataFrame([media_item])
+                # update log and buffer db commit
+                media_singular = update_status(media_singular)
+                write_buffer.add(media_singular)
+                log_status(media_singular)
 
-            # update log and commit to db
-            media_singular = update_status(media_singular)
-            utils.media_db_update(media=MediaSchema.validate(media_singular))
-            log_status(media_singular)
+            except Exception as outer_e:
 
-        except Exception as outer_e:
+                # attempt to store and log error condition
+                try:
+                    media_item['error_condition'] = f"{outer_e}"
 
-            # attempt to store and log error condition
-            try:
-                media_item['error_condition'] = f"{outer_e}"
+                    # cast to DataFrame to update status
+                    media_singular = pl.DataFrame([media_item])
 
-                # cast to DataFrame to perform validation
-                media_singular = pl.DataFrame([media_item])
+                    # update log and buffer db commit
+                    media_singular = update_status(media_singular)
+                    write_buffer.add(media_singular)
+                    log_status(media_singular)
 
-                # update log and commit to db
-                media_singular = update_status(media_singular)
-                utils.media_db_update(media=MediaSchema.validate(media_singular))
-                log_status(media_singular)
+                # if attempt to store error to element fails, output error to logs
+                except Exception as inner_e:
+                    logging.error(f"media transfer error - {media_item['hash']} - {inner_e}")
 
-            # if attempt to store error to element fails, output error to logs
-            except Exception as inner_e:
-                logging.error(f"media transfer error - {media_item['hash']} - {inner_e}")
+    # items whose status could not be committed stay downloaded in the db
+    for hash in write_buffer.failed_hashes:
+        logging.error(f"media transfer status not stored - {hash}")
 
 
 # ------------------------------------------------------------------------------
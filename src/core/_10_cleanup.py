@@ -8,7 +8,7 @@ from dotenv import load_dotenv
 import polars as pl
 
 # local/custom imports
-from src.data_models import MediaSchema
+from src.data_models import MediaSchema, RejectionStatus, PipelineStatus
 import src.utils as utils
 
 # ------------------------------------------------------------------------------
@@ -43,6 +43,49 @@ def get_delay_multiple() -> float:
     return  delay_multiple
 
 
+def update_removed_items(
+    media: pl.DataFrame | pl.LazyFrame,
+    removal_results: dict,
+    **removed_values
+) -> pl.DataFrame | pl.LazyFrame:
+    """
+    updates items after a removal attempt from the daemon; items removed
+        successfully are assigned removed_values, and items that failed are
+        assigned their removal error as error_condition
+
+    :param media: DataFrame, or LazyFrame, of items that removal was attempted
+        for
+    :param removal_results: dict of hash to None if removed, or error message
+    :param removed_values: column values to set for removed items
+    :return: updated DataFrame, or LazyFrame
+    """
+    media_removed = media
+    columns = media.collect_schema().names()
+
+    # Add error_condition and any other missing target columns
+    for col in ['error_condition', *removed_values]:
+        if col not in columns:
+            media_removed = media_removed.with_columns(
+                pl.lit(None).cast(pl.Utf8).alias(col)
+            )
+
+    removed_hashes = [hash for hash, error in removal_results.items() if error is None]
+    removal_errors = {hash: error for hash, error in removal_results.items() if error is not None}
+    removed_mask = pl.col('hash').is_in(removed_hashes)
+
+    return media_removed.with_columns(
+        error_condition = pl.col('hash').replace_strict(
+            removal_errors,
+            default=pl.col('error_condition'),
+            return_dtype=pl.Utf8
+        ),
+        **{
+            col: pl.when(removed_mask).then(pl.lit(value)).otherwise(pl.col(col))
+            for col, value in removed_values.items()
+        }
+    )
+
+
 def cleanup_transferred_media(modulated_transferred_item_cleanup_delay: float):
     """
     remove items from the daemon, after set time period after which they
@@ -50,6 +93,10 @@ def cleanup_transferred_media(modulated_transferred_item_cleanup_delay: float):
 
     :param modulated_transferred_item_cleanup_delay: delay time in seconds
     """
+    # exit early if no transferred items exist
+    if not utils.has_pending_media([PipelineStatus.TRANSFERRED]):
+        return
+
     # read in existing data based on ingest_type
     media = utils.get_media_from_db(
         pipeline_status='transferred',
@@ -74,36 +121,27 @@ def cleanup_transferred_media(modulated_transferred_item_cleanup_delay: float):
         pl.col('seconds_since_transfer') > modulated_transferred_item_cleanup_delay
     )
 
-    # remove items that have exceeded time limit
-    updated_rows = []
-
-    for row in media_exceeded.iter_rows(named=True):
-        try:
-            updated_row = row
-            try:
-                utils.remove_media_item(row['hash'])
-                updated_row['pipeline_status'] = "complete"
-                logging.info(
-                    f"removed transferred item - {updated_row['hash']} - {updated_row['seconds_since_transfer']}s after transfer")
-                updated_rows.append(updated_row)
-            except Exception as e:
-                updated_row['error_condition'] = f"{e}"
-                logging.error(
-                    f"could not remove{updated_row['hash']} - {updated_row['error_condition']}")
-                updated_rows.append(updated_row)
-        except TypeError as e:
-            # Skip rows with naive/aware datetime mismatch
-            logging.warning(f"could not remove {row['hash']} - {e}")
-            continue
-
-    # if no items have successfully been removed, return
-    if len(updated_rows) < 1:
+    # if no items have exceeded time limit, return
+    if media_exceeded.height == 0:
         return
 
-    # create DataFrame from updated rows and drop temp column
-    media = pl.DataFrame(updated_rows).drop('seconds_since_transfer')
+    # remove all items that have exceeded time limit in a single request
+    removal_results = utils.remove_media_items(media_exceeded['hash'].to_list())
 
-    # update status of successfully cleaned items
+    for row in media_exceeded.iter_rows(named=True):
+        if removal_results.get(row['hash']) is None:
+            logging.info(
+                f"removed transferred item - {row['hash']} - {row['seconds_since_transfer']}s after transfer")
+        else:
+            logging.error(
+                f"could not remove {row['hash']} - {removal_results[row['hash']]}")
+
+    # update status of all cleaned items and commit to db in one upsert
+    media = update_removed_items(
+        media_exceeded.drop('seconds_since_transfer'),
+        removal_results,
+        pipeline_status=PipelineStatus.COMPLETE.value
+    )
     utils.media_db_update(media=MediaSchema.validate(media))
 
 
@@ -150,38 +188,25 @@ def cleanup_hung_items(modulated_hung_item_cleanup_delay: float):
     if len(media_exceeded) < 1:
         return
 
-    # remove items that have exceeded time limit
-    updated_rows = []
+    # remove all items that have exceeded time limit in a single request
+    removal_results = utils.remove_media_items(media_exceeded['hash'].to_list())
 
     for row in media_exceeded.iter_rows(named=True):
-        try:
-            updated_row = row
-            try:
-                utils.remove_media_item(row['hash'])
-                updated_row['pipeline_status'] = "rejected"
-                updated_row['rejection_status'] = "rejected"
-                updated_row['rejection_reason'] = "exceeded time limit"
-                logging.info(
-                    f"removed hung item: {updated_row['hash']} - {updated_row['seconds_since_transfer']}s after last status update")
-                updated_rows.append(updated_row)
-            except Exception as e:
-                updated_row['error_condition'] = f"{e}"
-                logging.error(
-                    f"could not remove{updated_row['hash']} - {updated_row['error_condition']}")
-                updated_rows.append(updated_row)
-        except TypeError as e:
-            # Skip rows with naive/aware datetime mismatch
-            logging.warning(f"could not remove {row['hash']} - {e}")
-            continue
-
-    # if no items have successfully been removed, return
-    if len(updated_rows) < 1:
-        return
-
-    # create DataFrame from updated rows and drop temp column
-    media = pl.DataFrame(updated_rows).drop('seconds_since_transfer')
-
-    # update status of successfully cleaned items
+        if removal_results.get(row['hash']) is None:
+            logging.info(
+                f"removed hung item: {row['hash']} - {row['seconds_since_transfer']}s after last status update")
+        else:
+            logging.error(
+                f"could not remove {row['hash']} - {removal_results[row['hash']]}")
+
+    # update status of all cleaned items and commit to db in one upsert
+    media = update_removed_items(
+        media_exceeded.drop('seconds_since_transfer'),
+        removal_results,
+        pipeline_status=PipelineStatus.REJECTED.value,
+        rejection_status=RejectionStatus.REJECTED.value,
+        rejection_reason="exceeded time limit"
+    )
     utils.media_db_update(media=MediaSchema.validate(media))
 
 
@@ -11,5 +11,8 @@ from .media_schema import (
     DEFAULT_VALUES,
     TRAINING_SCHEMA_COLUMNS,
     TRAINING_POLARS_SCHEMA,
-    TRAINING_DEFAULT_VALUES
+    TRAINING_DEFAULT_VALUES,
+    MANDATORY_FIELDS,
+    MANDATORY_FIELDS_BY_TYPE,
+    missing_fields_expr
 )
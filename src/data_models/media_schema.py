@@ -102,6 +102,76 @@ DEFAULT_VALUES = {
 }
 
 
+# -----------------------------------------------------------------------------
+# Mandatory field rules
+# -----------------------------------------------------------------------------
+
+# fields every media item must have, then the fields each media type must
+#   have; missing fields are reported in this order
+MANDATORY_FIELDS = ['media_title']
+
+MANDATORY_FIELDS_BY_TYPE = {
+    MediaType.MOVIE: ['release_year'],
+    MediaType.TV_SHOW: ['season', 'episode'],
+    MediaType.TV_SEASON: ['season'],
+    MediaType.TV_EPISODE_PACK: ['season']
+}
+
+
+def _join_messages(messages: List[pl.Expr]) -> pl.Expr:
+    # concat_str of only nulls is an empty string, which means no messages
+    joined = pl.concat_str(messages, separator="; ", ignore_nulls=True)
+    return pl.when(joined != "").then(joined)
+
+
+def _missing_field_messages(
+    fields: List[str],
+    columns: Optional[List[str]]
+) -> List[pl.Expr]:
+    return [
+        pl.lit(f"{field} is null") if columns is not None and field not in columns
+        else pl.when(pl.col(field).is_null()).then(pl.lit(f"{field} is null"))
+        for field in fields
+    ]
+
+
+def missing_fields_expr(
+    fields: List[str] = MANDATORY_FIELDS,
+    fields_by_type: dict = MANDATORY_FIELDS_BY_TYPE,
+    columns: Optional[List[str]] = None
+) -> pl.Expr:
+    """
+    Build one expression appending "<field> is null" to error_condition for
+    every mandatory field a media item is missing, separated by "; "
+
+    :param fields: fields every media item must have
+    :param fields_by_type: dict of media type to the fields it must have
+    :param columns: columns of the frame checked, if known; mandatory fields
+        without a column are null for every item, rather than an error
+    :return: error_condition expression
+    """
+    media_type = pl.col('media_type')
+    missing = _missing_field_messages(fields, columns)
+
+    type_missing = None
+    for type_, type_fields in fields_by_type.items():
+        type_value = type_.value if isinstance(type_, Enum) else type_
+        type_missing = (pl.when if type_missing is None else type_missing.when)(
+            media_type == type_value
+        ).then(_join_messages(_missing_field_messages(type_fields, columns)))
+    if type_missing is not None:
+        missing.append(type_missing)
+
+    new_errors = _join_messages(missing)
+
+    return (
+        pl.when(new_errors.is_null()).then(pl.col('error_condition'))
+        .when(pl.col('error_condition').is_null()).then(new_errors)
+        .otherwise(pl.concat_str(pl.col('error_condition'), pl.lit("; "), new_errors))
+        .alias('error_condition')
+    )
+
+
 # -----------------------------------------------------------------------------
 # Pandera Schema
 # -----------------------------------------------------------------------------
@@ -4,9 +4,13 @@ from .rpcf import *
 from .sqlf import *
 # import all function from parse_element
 from .parse_element import *
+# import all functions from parse cache
+from .parse_cache import *
+# import all functions from rss validators
+from .rss_validators import *
 # import all function from local file operations
 from .local_file_operations import *
 # import setup_logging
 from .log_config import setup_logging
-
-
+# import pipeline status report functions
+from .status_report import build_status_report, get_status_report, serve_status_report
@@ -0,0 +1,132 @@
+# standard library imports
+from contextlib import closing
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+
+# third-party imports
+import polars as pl
+
+# ------------------------------------------------------------------------------
+# parse cache config
+# ------------------------------------------------------------------------------
+
+# optional sqlite file caching parse results across runs and stage processes;
+#   the cache is disabled when unset
+parse_cache_path = os.getenv('AT_PARSE_CACHE_PATH') or None
+
+# columns identifying a parsed title; parsed values depend on the media type
+#   as well as the title itself
+PARSE_CACHE_KEYS = ['original_title', 'media_type']
+
+# titles per query, below sqlite's bound parameter limit
+PARSE_CACHE_QUERY_SIZE = 500
+
+# ------------------------------------------------------------------------------
+# parse cache functions
+# ------------------------------------------------------------------------------
+
+def parser_version(*paths: str | Path) -> str:
+    """
+    digest of the files that define the parser, so any change to the parser
+        source or its configuration produces a new version
+
+    :param paths: paths of the parser source and configuration files
+    :return: hex digest identifying the parser version
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+
+    return digest.hexdigest()[:16]
+
+
+def _connect_parse_cache() -> sqlite3.Connection:
+    connection = sqlite3.connect(parse_cache_path, timeout=30)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS parse_cache ("
+        "parser_version TEXT NOT NULL, "
+        "original_title TEXT NOT NULL, "
+        "media_type TEXT NOT NULL, "
+        "parsed TEXT NOT NULL, "
+        "PRIMARY KEY (parser_version, original_title, media_type))"
+    )
+    return connection
+
+
+def get_cached_parses(titles: pl.DataFrame, version: str, schema: dict) -> pl.DataFrame:
+    """
+    look up the cached parse results of titles in bulk
+
+    :param titles: DataFrame of original_title and media_type to look up
+    :param version: parser version the results must have been parsed with
+    :param schema: dict of parsed column name to polars dtype
+    :return: DataFrame of the cached titles with their parsed columns; empty if
+        the cache is disabled or unreadable
+    """
+    key_schema = {key: pl.Utf8 for key in PARSE_CACHE_KEYS}
+    empty = pl.DataFrame(schema={**key_schema, **schema})
+
+    if parse_cache_path is None or titles.height == 0:
+        return empty
+
+    original_titles = titles['original_title'].drop_nulls().unique().to_list()
+    rows = []
+    try:
+        with closing(_connect_parse_cache()) as connection:
+            for i in range(0, len(original_titles), PARSE_CACHE_QUERY_SIZE):
+                batch = original_titles[i:i + PARSE_CACHE_QUERY_SIZE]
+                rows.extend(connection.execute(
+                    "SELECT original_title, media_type, parsed FROM parse_cache "
+                    f"WHERE parser_version = ? AND original_title IN ({', '.join('?' * len(batch))})",
+                    [version, *batch]
+                ))
+    except sqlite3.Error as e:
+        logging.warning(f"could not read parse cache - {e}")
+        return empty
+
+    if not rows:
+        return empty
+
+    cached = pl.DataFrame(
+        [
+            {'original_title': original_title, 'media_type': media_type, **json.loads(parsed)}
+            for original_title, media_type, parsed in rows
+        ],
+        schema={**key_schema, **schema}
+    )
+
+    # keep only the requested media type of each title
+    return cached.join(titles.select(PARSE_CACHE_KEYS), on=PARSE_CACHE_KEYS, how='semi')
+
+
+def cache_parses(parsed: pl.DataFrame, version: str) -> None:
+    """
+    store parse results, and drop the results of any other parser version
+
+    :param parsed: DataFrame of original_title, media_type, and parsed columns
+    :param version: parser version the results were parsed with
+    """
+    if parse_cache_path is None or parsed.height == 0:
+        return
+
+    values = [key for key in parsed.columns if key not in PARSE_CACHE_KEYS]
+    rows = [
+        (version, row['original_title'], row['media_type'], json.dumps({value: row[value] for value in values}))
+        for row in parsed.drop_nulls(PARSE_CACHE_KEYS).iter_rows(named=True)
+    ]
+
+    try:
+        with closing(_connect_parse_cache()) as connection, connection:
+            connection.execute("DELETE FROM parse_cache WHERE parser_version != ?", [version])
+            connection.executemany("INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?)", rows)
+    except sqlite3.Error as e:
+        logging.warning(f"could not write parse cache - {e}")
+
+
+# ------------------------------------------------------------------------------
+# end of parse_cache.py
+# ------------------------------------------------------------------------------
@@ -1,6 +1,221 @@
 # standard library imports
+from bisect import bisect_left
+from pathlib import Path
 import re
 
+# third-party imports
+import polars as pl
+import yaml
+
+################################################################################
+# compiled patterns
+################################################################################
+
+# all patterns are compiled once at import; the functions below are called per
+#   title in the inner loops of rss ingest, collect, and parse
+
+direct_download_hash_pattern = re.compile(r'/([^/]+)$')
+magnet_hash_pattern = re.compile(r'urn:btih:([a-fA-F0-9]{40})')
+
+# media types in order of precedence; each is a named group of a single
+#   alternation, so one scan finds every candidate type. at a given position
+#   the more specific alternatives are tried first, and no alternative can
+#   consume the start of a more specific match
+MEDIA_TYPE_PATTERNS = {
+    # TV episode pack has SxxExx-xx pattern (episode range like S01E07-08)
+    'tv_episode_pack': r'[Ss]\d{1,4}[Ee]\d{1,4}-\d{1,4}',
+    # TV show must have SxxExx pattern
+    'tv_show': r'[Ss]\d{1,4}[Ee]\d{1,4}',
+    # TV season can have either "season X" or "sXX" pattern
+    'tv_season': r'[Ss]eason\s+\d{1,4}|[Ss]\d{1,4}',
+    # movie has a 19xx or 20xx year with delimiters on both sides
+    'movie': r'(?:^|\W)(?:19|20)\d{2}(?:$|\W)'
+}
+MEDIA_TYPE_PRECEDENCE = list(MEDIA_TYPE_PATTERNS)
+media_type_pattern = re.compile('|'.join(
+    f"(?P<{media_type}>{pattern})" for media_type, pattern in MEDIA_TYPE_PATTERNS.items()
+))
+
+# title rules per media type, tried in order; the title is everything before a
+#   marker that is preceded by a run of delimiters ('' none, '*' any, '+' at
+#   least one), and followed by a pattern either later on the same line, or
+#   right after another run of delimiters
+PAREN_YEAR = r'\((?:19|20)\d{2}\)'
+YEAR = r'(?:19|20)\d{2}'
+EPISODE = r's\d{1,4}e\d{1,4}'
+EPISODE_PACK = r's\d{1,4}e\d{1,4}-\d{1,4}'
+SEASON = r'(?:season.{1,4}\d{1,4}|s\d{1,4})'
+
+TITLE_RULES = {
+    'movie': [
+        # everything before year in parentheses
+        {'delimiters': '*', 'marker': PAREN_YEAR},
+        # year without parentheses (delimiter before year, delimiter/end after)
+        {'delimiters': '+', 'marker': YEAR + r'(?:[\s._-]|$)'},
+        # if no year found, everything before resolution pattern
+        {'delimiters': '*', 'marker': r'\d{3,4}p'}
+    ],
+    'tv_show': [
+        # everything before year in parentheses
+        {'delimiters': '*', 'marker': PAREN_YEAR, 'later': EPISODE},
+        # everything before standalone year then season/episode pattern
+        {'delimiters': '+', 'marker': YEAR, 'next': EPISODE},
+        # everything before the SxxExx pattern
+        {'delimiters': '', 'marker': EPISODE}
+    ],
+    'tv_episode_pack': [
+        # everything before year in parentheses
+        {'delimiters': '*', 'marker': PAREN_YEAR, 'later': EPISODE_PACK},
+        # everything before standalone year then episode pack pattern
+        {'delimiters': '+', 'marker': YEAR, 'next': EPISODE_PACK},
+        # everything before the SxxExx-xx pattern
+        {'delimiters': '', 'marker': EPISODE_PACK}
+    ],
+    'tv_season': [
+        # everything before year in parentheses
+        {'delimiters': '*', 'marker': PAREN_YEAR, 'later': SEASON},
+        # everything before standalone year then season pattern
+        {'delimiters': '+', 'marker': YEAR, 'next': SEASON},
+        # everything before the season pattern
+        {'delimiters': '', 'marker': SEASON}
+    ]
+}
+
+
+def _title_pattern(rule: dict) -> re.Pattern:
+    """
+    regex of a title rule, with the title as group 1
+
+    :param rule: title rule from TITLE_RULES
+    :return: compiled pattern
+    """
+    delimiters = {'': '', '*': r'[\s._-]*', '+': r'[\s._-]+'}[rule['delimiters']]
+    pattern = r'(.+?)' + delimiters + rule['marker']
+    if 'later' in rule:
+        pattern += r'.*?' + rule['later']
+    if 'next' in rule:
+        pattern += r'[\s._-]+' + rule['next']
+
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _compile_title_rule(rule: dict) -> dict:
+    """
+    compile the parts of a title rule; markers, and patterns found later, are
+        matched at every position, so overlapping candidates are all seen
+
+    :param rule: title rule from TITLE_RULES
+    :return: dict of the rule's delimiters and compiled patterns
+    """
+    return {
+        'delimiters': rule['delimiters'],
+        'marker': re.compile(r'(?=(' + rule['marker'] + r'))', re.IGNORECASE),
+        'later': re.compile(r'(?=' + rule['later'] + r')', re.IGNORECASE) if 'later' in rule else None,
+        'next': re.compile(rule['next'], re.IGNORECASE) if 'next' in rule else None
+    }
+
+
+# the regexes backtrack polynomially on long runs of delimiters, so they are
+#   only used by the polars expressions, whose regex engine runs in linear time
+title_patterns = {
+    media_type: [_title_pattern(rule) for rule in rules]
+    for media_type, rules in TITLE_RULES.items()
+}
+compiled_title_rules = {
+    media_type: [_compile_title_rule(rule) for rule in rules]
+    for media_type, rules in TITLE_RULES.items()
+}
+newline_pattern = re.compile('\n')
+title_special_characters_pattern = re.compile('[._\\-+()\\[\\]]')
+
+# Pattern matches:
+# - Opening delimiter: (, [, ., -, _, space, or start of string
+# - 19 or 20 followed by two digits
+# - Closing delimiter: ), ], ., -, _, space, or end of string
+year_pattern = re.compile(r'(?:[\(\[\.\-_\s]|^)((?:19|20)\d{2})(?:[\)\]\.\-_\s]|$)')
+
+season_from_episode_pattern = re.compile(r'[. ]s(\d{1,4})e\d{1,4}[. ]', re.IGNORECASE)
+episode_from_episode_pattern = re.compile(r'[. ]s\d{1,4}e(\d{1,4})[. ]', re.IGNORECASE)
+season_from_episode_pack_pattern = re.compile(r'[. ]s(\d{1,4})e\d{1,4}-\d{1,4}', re.IGNORECASE)
+season_from_season_pattern = re.compile(r'(?:S|Season\s?)(\d{1,2})', re.IGNORECASE)
+
+resolution_pattern = re.compile(r'(\d{3,4}p)', re.IGNORECASE)
+
+# vocabularies of codecs, upload types, and uploader groups
+VOCABULARIES_PATH = Path(__file__).parent.parent.parent / 'config' / 'release-vocabularies.yaml'
+
+
+def expand_vocabulary_entry(entry: str) -> list:
+    """
+    expand the brace alternatives of a vocabulary entry into literal strings,
+        in the order a regex would try them, e.g. "h{., ,}264" expands to
+        ["h.264", "h 264", "h264"]
+
+    :param entry: vocabulary entry with optional, possibly nested, {a,b}
+        alternatives
+    :return: list of literal strings
+    """
+    def expand_sequence(position: int, nested: bool) -> tuple:
+        # the earlier parts of a sequence vary slowest, as in a regex
+        expanded = ['']
+        while position < len(entry):
+            char = entry[position]
+            if char == '{':
+                alternatives = []
+                while True:
+                    literals, position = expand_sequence(position + 1, True)
+                    alternatives.extend(literals)
+                    if position >= len(entry):
+                        raise ValueError(f"unbalanced braces in vocabulary entry {entry!r}")
+                    if entry[position] == '}':
+                        break
+                expanded = [prefix + suffix for prefix in expanded for suffix in alternatives]
+                position += 1
+            elif nested and char in ',}':
+                break
+            else:
+                expanded = [prefix + char for prefix in expanded]
+                position += 1
+        return expanded, position
+
+    return expand_sequence(0, False)[0]
+
+
+def load_vocabularies(path: Path = VOCABULARIES_PATH) -> dict:
+    """
+    load the release vocabularies and expand each entry into literal strings
+
+    :param path: path to the vocabularies yaml
+    :return: dict of vocabulary name to list of literals in order of precedence
+    """
+    with open(path, 'r') as file:
+        vocabularies = yaml.safe_load(file)
+
+    return {
+        name: [literal for entry in entries for literal in expand_vocabulary_entry(str(entry))]
+        for name, entries in vocabularies.items()
+    }
+
+
+VOCABULARIES = load_vocabularies()
+VIDEO_CODECS = VOCABULARIES['video_codecs']
+AUDIO_CODECS = VOCABULARIES['audio_codecs']
+UPLOAD_TYPES = VOCABULARIES['upload_types']
+UPLOADERS = VOCABULARIES['uploaders']
+
+
+def _alternation(literals: list) -> str:
+    return '|'.join(re.escape(literal) for literal in literals)
+
+
+# codec and upload type patterns use word boundaries and case insensitive matching
+video_codec_pattern = re.compile(r'\b(' + _alternation(VIDEO_CODECS) + r')\b', re.IGNORECASE)
+audio_codec_pattern = re.compile(r'\b(' + _alternation(AUDIO_CODECS) + r')\b', re.IGNORECASE)
+upload_type_pattern = re.compile(r'\b(' + _alternation(UPLOAD_TYPES) + r')\b', re.IGNORECASE)
+
+# uploaders with optional separators
+uploader_pattern = re.compile(r'(?:[-.\[\s]*)(' + _alternation(UPLOADERS) + r')(?:[-.\]\s]*)', re.IGNORECASE)
+
 ################################################################################
 # hash value operations
 ################################################################################
@@ -15,10 +230,8 @@ def extract_hash_from_direct_download_url(href: str) -> str | None:
     if not href:
         return None
 
-    # Pattern to match the last segment after the final slash
-    # Captures everything that's not a slash, at the end of the string
-    pattern = r'/([^/]+)$'
-    match = re.search(pattern, href)
+    # match the last segment after the final slash
+    match = direct_download_hash_pattern.search(href)
 
     if match:
         result = match.group(1).lower()
@@ -38,9 +251,8 @@ def extract_hash_from_magnet_link(href: str) -> str | None:
     if not href:
         return None
 
-    # Pattern to match urn:btih: followed by 40 hex characters (SHA-1 hash)
-    pattern = r'urn:btih:([a-fA-F0-9]{40})'
-    match = re.search(pattern, href)
+    # match urn:btih: followed by 40 hex characters (SHA-1 hash)
+    match = magnet_hash_pattern.search(href)
 
     return match.group(1).lower() if match else None
 
@@ -55,34 +267,87 @@ def classify_media_type(raw_title:str) -> str | None:
     :param raw_title: raw title string of media item
     :return: string indicating media type
     """
-    # Core patterns
-    # TV episode pack has SxxExx-xx pattern (episode range like S01E07-08)
-    episode_pack_pattern = r'[Ss]\d{1,4}[Ee]\d{1,4}-\d{1,4}'
-
-    # TV show must have SxxExx pattern (case insensitive)
-    tv_pattern = r'[Ss]\d{1,4}[Ee]\d{1,4}'
-
-    # TV season can have either "season X" or "sXX" pattern (case insensitive)
-    # Looks for season/s followed by 1-2 digits, not followed by episode pattern
-    season_pattern = r'(?:[Ss]eason\s+\d{1,4}|[Ss]\d{1,4})'
-
-    # Movie pattern now accounts for years with or without parentheses
-    # Matches 19xx or 20xx with similar delimiters on both sides
-    movie_pattern = r'(?:^|\W)((?:19|20)\d{2})(?:$|\W)'
-
-    # Check episode pack first (before tv_show since it's more specific)
-    if re.search(episode_pack_pattern, raw_title):
-        return "tv_episode_pack"
-    elif re.search(tv_pattern, raw_title):
-        return "tv_show"
-    elif re.search(season_pattern, raw_title):
-        return "tv_season"
-    elif re.search(movie_pattern, raw_title):
-        return "movie"
+    # single scan over the combined pattern, keeping the most specific type
+    #   found; stop early once an episode pack, the most specific, is found
+    precedence = len(MEDIA_TYPE_PRECEDENCE)
+    for match in media_type_pattern.finditer(raw_title):
+        precedence = min(precedence, MEDIA_TYPE_PRECEDENCE.index(match.lastgroup))
+        if precedence == 0:
+            break
+
+    if precedence < len(MEDIA_TYPE_PRECEDENCE):
+        return MEDIA_TYPE_PRECEDENCE[precedence]
     else:
         return "unknown"
 
 
+def _is_title_delimiter(char: str) -> bool:
+    # the characters matched by [\s._-]
+    return char.isspace() or char in '._-'
+
+
+def _match_title_rule(raw_title: str, rule: dict) -> str | None:
+    """
+    find the title a rule's regex would capture, in time linear in the title
+        length; every marker starts with a character that is not a delimiter,
+        so the lazy title always ends at the delimiters before the first marker
+        that completes a match
+
+    :param raw_title: raw title string of media item
+    :param rule: compiled title rule
+    :return: title, or None if the rule does not match
+    """
+    later_starts = newlines = None
+    if rule['later'] is not None:
+        later_starts = [match.start() for match in rule['later'].finditer(raw_title)]
+        if not later_starts:
+            return None
+        newlines = [match.start() for match in newline_pattern.finditer(raw_title)]
+
+    for marker in rule['marker'].finditer(raw_title):
+        start, end = marker.start(), marker.end(1)
+
+        # the later pattern must start after the marker, on the same line
+        if later_starts is not None:
+            later = bisect_left(later_starts, end)
+            if later == len(later_starts):
+                continue
+            newline = bisect_left(newlines, end)
+            if newline < len(newlines) and newlines[newline] < later_starts[later]:
+                continue
+
+        # the next pattern must follow a run of delimiters after the marker
+        if rule['next'] is not None:
+            next_start = end
+            while next_start < len(raw_title) and _is_title_delimiter(raw_title[next_start]):
+                next_start += 1
+            if next_start == end or not rule['next'].match(raw_title, next_start):
+                continue
+
+        # the title ends at the run of delimiters before the marker
+        title_end = start
+        if rule['delimiters']:
+            while title_end > 0 and _is_title_delimiter(raw_title[title_end - 1]):
+                title_end -= 1
+            if rule['delimiters'] == '+' and title_end == start:
+                continue
+
+        # and starts at the start of its line
+        if title_end > 0:
+            title_start = raw_title.rfind('\n', 0, title_end) + 1
+            if title_start < title_end:
+                return raw_title[title_start:title_end]
+            continue
+
+        # if the delimiters reach the start of the title, the title is the first
+        #   of them that is not a line break, leaving any required delimiter
+        for position in range(start - 1 if rule['delimiters'] == '+' else start):
+            if raw_title[position] != '\n':
+                return raw_title[position]
+
+    return None
+
+
 def extract_title(raw_title: str, media_type: str) -> str | None:
     """
     extract and format the title of a media object given a more complicated
@@ -98,73 +363,19 @@ def extract_title(raw_title: str, media_type: str) -> str | None:
 
     cleaned_title = None
 
-    if media_type == 'movie':
-        # Try to match everything before year pattern first (year in parentheses)
-        match = re.search(r'(.+?)[\s._-]*\((?:19|20)\d{2}\)', raw_title)
-        if match:
-            cleaned_title = match.group(1).strip()
-        else:
-            # Try year without parentheses (delimiter before year, delimiter/end after)
-            match = re.search(r'(.+?)[\s._-]+((?:19|20)\d{2})(?:[\s._-]|$)', raw_title)
-            if match:
-                cleaned_title = match.group(1).strip()
-            else:
-                # If no year found, take everything before resolution pattern
-                match = re.search(r'(.+?)[\s._-]*\d{3,4}p', raw_title, re.IGNORECASE)
-                if match:
-                    cleaned_title = match.group(1).strip()
-    elif media_type == 'tv_show':
-        # Try to match everything before year in parentheses first
-        match = re.search(r'(.+?)[\s._-]*\((?:19|20)\d{2}\).*?s\d{1,4}e\d{1,4}', raw_title, re.IGNORECASE)
-        if match:
-            cleaned_title = match.group(1).strip()
-        else:
-            # Try to match everything before standalone year then season/episode pattern
-            match = re.search(r'(.+?)[\s._-]+(?:19|20)\d{2}[\s._-]+s\d{1,4}e\d{1,4}', raw_title, re.IGNORECASE)
-            if match:
-                cleaned_title = match.group(1).strip()
-            else:
-                # Fall back to original: get everything before the SxxExx pattern
-                match = re.search(r'(.+?)s\d{1,4}e\d{1,4}', raw_title, re.IGNORECASE)
-                if match:
-                    cleaned_title = match.group(1).strip()
-    elif media_type == 'tv_episode_pack':
-        # Try to match everything before year in parentheses first
-        match = re.search(r'(.+?)[\s._-]*\((?:19|20)\d{2}\).*?s\d{1,4}e\d{1,4}-\d{1,4}', raw_title, re.IGNORECASE)
-        if match:
-            cleaned_title = match.group(1).strip()
-        else:
-            # Try to match everything before standalone year then episode pack pattern
-            match = re.search(r'(.+?)[\s._-]+(?:19|20)\d{2}[\s._-]+s\d{1,4}e\d{1,4}-\d{1,4}', raw_title, re.IGNORECASE)
-            if match:
-                cleaned_title = match.group(1).strip()
-            else:
-                # Fall back: get everything before the SxxExx-xx pattern
-                match = re.search(r'(.+?)s\d{1,4}e\d{1,4}-\d{1,4}', raw_title, re.IGNORECASE)
-                if match:
-                    cleaned_title = match.group(1).strip()
-    elif media_type == 'tv_season':
-        # Try to match everything before year in parentheses first
-        match = re.search(r'(.+?)[\s._-]*\((?:19|20)\d{2}\).*?(?:season.{1,4}\d{1,4}|s\d{1,4})', raw_title, re.IGNORECASE)
-        if match:
-            cleaned_title = match.group(1).strip()
-        else:
-            # Try to match everything before standalone year then season pattern
-            match = re.search(r'(.+?)[\s._-]+(?:19|20)\d{2}[\s._-]+(?:season.{1,4}\d{1,4}|s\d{1,4})', raw_title, re.IGNORECASE)
-            if match:
-                cleaned_title = match.group(1).strip()
-            else:
-                # Fall back to original: get everything before the season pattern
-                match = re.search(r'(.+?)(?:season.{1,4}\d{1,4}|s\d{1,4})', raw_title, re.IGNORECASE)
-                if match:
-                    cleaned_title = match.group(1).strip()
+    # take everything before the first matching rule for the media type
+    for rule in compiled_title_rules.get(media_type, []):
+        title = _match_title_rule(raw_title, rule)
+        if title is not None:
+            cleaned_title = title.strip()
+            break
 
     # determine if initial title extraction was successful, and if not return none
     if cleaned_title is None or cleaned_title.strip() == "":
         return None
     else:
         # Replace special characters with spaces
-        cleaned_title = re.sub('[._\\-+()\\[\\]]', ' ', cleaned_title)
+        cleaned_title = title_special_characters_pattern.sub(' ', cleaned_title)
         # remove trailing or leading white spice
         cleaned_title = cleaned_title.strip()
 
@@ -179,12 +390,7 @@ def extract_year(raw_title: str) -> str | None:
     # Normalize URL-encoded + to space before parsing
     raw_title = raw_title.replace('+', ' ')
 
-    # Pattern matches:
-    # - Opening delimiter: (, [, ., -, _, space, or start of string
-    # - 19 or 20 followed by two digits
-    # - Closing delimiter: ), ], ., -, _, space, or end of string
-    pattern = re.compile(r'(?:[\(\[\.\-_\s]|^)((?:19|20)\d{2})(?:[\)\]\.\-_\s]|$)')
-    match = pattern.search(raw_title)
+    match = year_pattern.search(raw_title)
     return int(match.group(1)) if match else None
 
 
@@ -193,14 +399,12 @@ def extract_year(raw_title: str) -> str | None:
 ################################################################################
 
 def extract_season_from_episode(raw_title: str) -> str | None:
-    pattern = re.compile(r'[. ]s(\d{1,4})e\d{1,4}[. ]', re.IGNORECASE)
-    match = pattern.search(raw_title)
+    match = season_from_episode_pattern.search(raw_title)
     return int(match.group(1)) if match else None
 
 
 def extract_episode_from_episode(raw_title: str) -> str | None:
-    pattern = re.compile(r'[. ]s\d{1,4}e(\d{1,4})[. ]', re.IGNORECASE)
-    match = pattern.search(raw_title)
+    match = episode_from_episode_pattern.search(raw_title)
     return int(match.group(1)) if match else None
 
 
@@ -210,14 +414,12 @@ def extract_season_from_episode_pack(raw_title: str) -> int | None:
     :param raw_title: raw title string of media item
     :return: season number as integer or None if not found
     """
-    pattern = re.compile(r'[. ]s(\d{1,4})e\d{1,4}-\d{1,4}', re.IGNORECASE)
-    match = pattern.search(raw_title)
+    match = season_from_episode_pack_pattern.search(raw_title)
     return int(match.group(1)) if match else None
 
 
 def extract_season_from_season(raw_title: str) -> str | None:
-    pattern = re.compile(r'(?:S|Season\s?)(\d{1,2})', re.IGNORECASE)
-    match = pattern.search(raw_title)
+    match = season_from_season_pattern.search(raw_title)
     return int(match.group(1)) if match else None
 
 
@@ -226,115 +428,183 @@ def extract_season_from_season(raw_title: str) -> str | None:
 ################################################################################
 
 def extract_resolution(raw_title: str)-> str | None:
-    pattern = re.compile(r'(\d{3,4}p)', re.IGNORECASE)
-    match = pattern.search(raw_title)
-    return match.group(0) if match else None
+    match = resolution_pattern.search(raw_title)
+    return match.group(1) if match else None
 
 
 def extract_video_codec(raw_title: str) -> str | None:
-    # List of video codecs to search for
-    video_codecs = [
-        'h[. ]?264',
-        'x264',
-        'x265',
-        'h[. ]?265',
-        'hevc',
-        'xvid',
-        'divx',
-        'vp8',
-        'vp9',
-        'av1',
-        'mpeg[- ]?[24]',
-        'wmv',
-        'avc'
-    ]
+    match = video_codec_pattern.search(raw_title)
+    return match.group(1) if match else None
+
 
-    # Create pattern with word boundaries and case insensitive matching
-    codec_pattern = r'\b(' + '|'.join(video_codecs) + r')\b'
-    pattern = re.compile(codec_pattern, re.IGNORECASE)
+def extract_audio_codec(raw_title: str) -> str | None:
+    match = audio_codec_pattern.search(raw_title)
+    return match.group(1) if match else None
 
-    match = pattern.search(raw_title)
-    return match.group(0) if match else None
 
+def extract_upload_type(raw_title: str) -> str | None:
+    match = upload_type_pattern.search(raw_title)
+    return match.group(1) if match else None
 
-def extract_audio_codec(raw_title: str) -> str | None:
-    # List of audio codecs to search for
-    audio_codecs = [
-        r'DDP?[. ]?[257]\.1',
-        r'AAC[. ]?[257]\.1',
-        'DDP',
-        'AAC',
-        'AAC2.0',
-        'AC-?3',
-        'E-?AC-?3',
-        'TrueHD',
-        r'DTS(?:-?HD)?(?:[. ]?[257]\.1)?',
-        'FLAC',
-        'MP3',
-        'WMA',
-        'PCM',
-        'LPCM',
-        'Atmos',
-        'OGG',
-        'Vorbis',
-        'ALAC',
-        'EAC-?3'
-    ]
 
-    # Create pattern with word boundaries and case insensitive matching
-    codec_pattern = r'\b(' + '|'.join(audio_codecs) + r')\b'
-    pattern = re.compile(codec_pattern, re.IGNORECASE)
+def extract_uploader(raw_title: str) -> str | None:
+    match = uploader_pattern.search(raw_title)
+    return match.group(1) if match else None
 
-    match = pattern.search(raw_title)
-    return match.group(0) if match else None
 
+################################################################################
+# polars expressions
+################################################################################
 
-def extract_upload_type(raw_title: str) -> str | None:
-    # List of upload types/sources to search for
-    upload_types = [
-        'WEB[-. ]?DL',
-        'WEB(?:Rip)?',
-        'BluRay',
-        'WEBRip',
-    ]
+# expression equivalents of the functions above, built from the same compiled
+#   patterns; polars evaluates them natively across all rows instead of
+#   calling back into python per title
 
-    # Create pattern with word boundaries and case insensitive matching
-    type_pattern = r'\b(' + '|'.join(upload_types) + r')\b'
-    pattern = re.compile(type_pattern, re.IGNORECASE)
+def _polars_pattern(pattern: re.Pattern | str, flags: int = 0) -> str:
+    """
+    translate a python pattern to the equivalent polars (rust regex) pattern
 
-    match = pattern.search(raw_title)
-    return match.group(0) if match else None
+    :param pattern: compiled pattern, or pattern string
+    :param flags: re flags of a pattern string
+    :return: pattern string with flags inlined
+    """
+    if isinstance(pattern, re.Pattern):
+        pattern, flags = pattern.pattern, pattern.flags
 
+    return f"(?i){pattern}" if flags & re.IGNORECASE else pattern
 
-def extract_uploader(raw_title: str) -> str | None:
-    # List of uploader groups to search for (at end of string with prefix)
-    uploaders = [
-        'DiRT',
-        'SuccessfulCrab',
-        'EDITH',
-        'FLUX',
-        'CtrlHD',
-        'BAE',
-        'NTb',
-        'LAZYCUNTS',
-        'HiggsBoson',
-        'RUBiK',
-        'PSA',
-        r'YTS\.MX',
-        'GGEZ',
-        'playWEB',
-        'MeGusta',
-        'ELiTE',
-        'RARBG',
-        'SMURF'
-    ]
 
-    # Create pattern for uploaders with optional separators
-    uploader_pattern = r'(?:[-.\[\s]*)(' + '|'.join(uploaders) + r')(?:[-.\]\s]*)'
-    pattern = re.compile(uploader_pattern, re.IGNORECASE)
+def _as_expr(column: str | pl.Expr) -> pl.Expr:
+    return pl.col(column) if isinstance(column, str) else column
 
-    match = pattern.search(raw_title)
-    return match.group(1) if match else None
+
+def classify_media_type_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """
+    expression equivalent of classify_media_type
+
+    :param raw_title: column name or expression of raw titles
+    :return: Utf8 expression of media types
+    """
+    raw_title = _as_expr(raw_title)
+
+    expr = pl.when(raw_title.is_null()).then(pl.lit(None, dtype=pl.Utf8))
+    for media_type, pattern in MEDIA_TYPE_PATTERNS.items():
+        expr = expr.when(raw_title.str.contains(pattern)).then(pl.lit(media_type))
+
+    return expr.otherwise(pl.lit("unknown"))
+
+
+def extract_title_expr(raw_title: str | pl.Expr, media_type: str | pl.Expr) -> pl.Expr:
+    """
+    expression equivalent of extract_title
+
+    :param raw_title: column name or expression of raw titles
+    :param media_type: column name or expression of media types
+    :return: Utf8 expression of cleaned media titles
+    """
+    raw_title = _as_expr(raw_title).str.replace_all('+', ' ', literal=True)
+    media_type = _as_expr(media_type)
+
+    # the first pattern that matches wins, and a match always captures text
+    expr = pl.when(pl.lit(False)).then(pl.lit(None, dtype=pl.Utf8))
+    for title_media_type, patterns in title_patterns.items():
+        expr = expr.when(media_type == title_media_type).then(pl.coalesce([
+            raw_title.str.extract(_polars_pattern(pattern), 1) for pattern in patterns
+        ]))
+    cleaned_title = expr.otherwise(pl.lit(None, dtype=pl.Utf8)).str.strip_chars()
+
+    return pl.when(cleaned_title == "").then(pl.lit(None, dtype=pl.Utf8)).otherwise(
+        cleaned_title
+            .str.replace_all(_polars_pattern(title_special_characters_pattern), ' ')
+            .str.strip_chars()
+    )
+
+
+def _extract_int_expr(raw_title: str | pl.Expr, pattern: re.Pattern) -> pl.Expr:
+    return _as_expr(raw_title).str.extract(_polars_pattern(pattern), 1).cast(pl.Int32, strict=False)
+
+
+def extract_year_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_year"""
+    return _extract_int_expr(_as_expr(raw_title).str.replace_all('+', ' ', literal=True), year_pattern)
+
+
+def extract_season_from_episode_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_season_from_episode"""
+    return _extract_int_expr(raw_title, season_from_episode_pattern)
+
+
+def extract_episode_from_episode_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_episode_from_episode"""
+    return _extract_int_expr(raw_title, episode_from_episode_pattern)
+
+
+def extract_season_from_episode_pack_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_season_from_episode_pack"""
+    return _extract_int_expr(raw_title, season_from_episode_pack_pattern)
+
+
+def extract_season_from_season_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_season_from_season"""
+    return _extract_int_expr(raw_title, season_from_season_pattern)
+
+
+def extract_resolution_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_resolution"""
+    return _as_expr(raw_title).str.extract(_polars_pattern(resolution_pattern), 1)
+
+
+def extract_video_codec_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_video_codec"""
+    return _as_expr(raw_title).str.extract(_polars_pattern(video_codec_pattern), 1)
+
+
+def extract_audio_codec_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_audio_codec"""
+    return _as_expr(raw_title).str.extract(_polars_pattern(audio_codec_pattern), 1)
+
+
+def extract_upload_type_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_upload_type"""
+    return _as_expr(raw_title).str.extract(_polars_pattern(upload_type_pattern), 1)
+
+
+def extract_uploader_expr(raw_title: str | pl.Expr) -> pl.Expr:
+    """expression equivalent of extract_uploader"""
+    return _as_expr(raw_title).str.extract(_polars_pattern(uploader_pattern), 1)
+
+
+def parse_release_title_expr(raw_title: str | pl.Expr, media_type: str | pl.Expr) -> pl.Expr:
+    """
+    single expression that parses every element of a release title; fields
+        that do not apply to the media type are null
+
+    :param raw_title: column name or expression of raw titles
+    :param media_type: column name or expression of media types
+    :return: struct expression with resolution, video_codec, audio_codec,
+        upload_type, uploader, release_year, season, episode, and media_title
+    """
+    raw_title = _as_expr(raw_title)
+    media_type = _as_expr(media_type)
+
+    return pl.struct(
+        resolution=extract_resolution_expr(raw_title),
+        video_codec=extract_video_codec_expr(raw_title),
+        audio_codec=extract_audio_codec_expr(raw_title),
+        upload_type=extract_upload_type_expr(raw_title),
+        uploader=extract_uploader_expr(raw_title),
+        release_year=pl.when(media_type == "movie")
+            .then(extract_year_expr(raw_title)),
+        season=pl.when(media_type == "tv_show")
+            .then(extract_season_from_episode_expr(raw_title))
+            .when(media_type == "tv_season")
+            .then(extract_season_from_season_expr(raw_title))
+            .when(media_type == "tv_episode_pack")
+            .then(extract_season_from_episode_pack_expr(raw_title)),
+        episode=pl.when(media_type == "tv_show")
+            .then(extract_episode_from_episode_expr(raw_title)),
+        media_title=extract_title_expr(raw_title, media_type)
+    )
 
 
 ################################################################################
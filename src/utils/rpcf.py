@@ -1,10 +1,18 @@
 # standard library imports
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
 import os
 import re
+import threading
+import time
+from typing import Any, Callable
 
 # third-party imports
 from dotenv import load_dotenv
+import polars as pl
 from transmission_rpc import Client as Transmission_client
+from transmission_rpc.error import TransmissionConnectError
 
 # ------------------------------------------------------------------------------
 # load environment variables and
@@ -19,113 +27,691 @@ transmission_username = os.getenv('TRANSMISSION_USERNAME')
 transmission_password = os.getenv('TRANSMISSION_PASSWORD')
 transmission_port = os.getenv('TRANSMISSION_PORT')
 
+
+def _parse_endpoints(endpoints: str | None) -> list:
+    """
+    parse a comma separated list of transmission endpoints, each as host:port
+        optionally followed by @ and the local mount of that daemon's download
+        dir, e.g. "node-a:9091@/mnt/node-a/downloads,node-b:9091"
+
+    :param endpoints: endpoint list, or None for the single daemon defined by
+        TRANSMISSION_HOST and TRANSMISSION_PORT
+    :return: list of (host, port, download_dir) tuples
+    """
+    if not endpoints:
+        return [(hostname, transmission_port, None)]
+
+    parsed = []
+    for endpoint in endpoints.split(','):
+        address, _, download_dir = endpoint.strip().partition('@')
+        host, _, port = address.rpartition(':')
+        if not host or not port:
+            raise ValueError(f"invalid transmission endpoint '{endpoint}', expected host:port")
+        parsed.append((host, port, download_dir or None))
+
+    return parsed
+
+
+# pool of transmission daemons as (host, port); new items are placed on the
+#   least loaded daemon, and each item's daemon is found from the snapshots
+transmission_endpoints = [
+    (host, port) for host, port, _ in _parse_endpoints(os.getenv('TRANSMISSION_ENDPOINTS'))
+]
+
+# local mount of each daemon's download dir, where it differs from AT_DOWNLOAD_DIR
+endpoint_download_dirs = {
+    (host, port): download_dir
+    for host, port, download_dir in _parse_endpoints(os.getenv('TRANSMISSION_ENDPOINTS'))
+    if download_dir is not None
+}
+
+# load measure used to pick the daemon for new items
+DAEMON_BALANCE_STRATEGIES = ('active_count', 'download_rate', 'free_space')
+daemon_balance_strategy = os.getenv('AT_DAEMON_BALANCE_STRATEGY') or 'active_count'
+
+# max concurrent torrent-add requests for bulk initiation; kept at or below the
+#   http connection pool size of the client
+initiation_concurrency = int(os.getenv('AT_INITIATION_CONCURRENCY') or "8")
+
+# process-wide transmission clients keyed by (host, port); each client performs the
+#   session-id handshake and session-get once, and the underlying library
+#   renews the session-id automatically when the daemon rotates it
+_transmission_clients = {}
+_transmission_clients_lock = threading.Lock()
+
+# seconds between full torrent-get resyncs of the local media_item snapshot;
+#   polls in between only fetch recently-active torrents
+torrent_resync_interval = float(os.getenv('AT_TORRENT_RESYNC_INTERVAL') or "300")
+
+# transmission reports torrents changed within the last 60 seconds as
+#   recently-active; incremental polls are only trusted inside that window,
+#   less a margin for request latency
+RECENTLY_ACTIVE_WINDOW = 45
+
+# seconds a media_item snapshot is reused without polling transmission, so
+#   stages within one pipeline cycle share a single listing
+snapshot_max_age = float(os.getenv('AT_SNAPSHOT_MAX_AGE') or "30")
+
+# optional file the snapshot is persisted to, shared by stages running in
+#   separate processes or containers; in-memory only if unset
+snapshot_cache_path = os.getenv('AT_SNAPSHOT_CACHE_PATH') or None
+
+# process-wide media_item snapshots keyed by host:port, each holding torrent id to
+#   (hash, media_item datum), the epoch times of the last full sync and poll,
+#   and whether a local add/remove has made the listing stale
+_media_item_snapshots = {}
+_media_item_snapshots_lock = threading.Lock()
+
+# torrent-get field projections; transmission serializes only requested fields,
+#   and transmission_rpc always adds id and hashString
+MEDIA_ITEM_FIELDS = [
+    'id',
+    'hashString',
+    'name',
+    'status',
+    'magnetLink',
+    'percentDone',
+    'totalSize',
+    'rateUpload',
+    'rateDownload',
+    'peersConnected',
+    'eta',
+    'downloadDir'
+]
+PURGE_FIELDS = ['id', 'hashString', 'name']
+
+# column types of media_items returned as a DataFrame, keyed by hash
+MEDIA_ITEM_SCHEMA = {
+    'hash': pl.Utf8,
+    'id': pl.Int64,
+    'name': pl.Utf8,
+    'status': pl.Utf8,
+    'media_item_source': pl.Utf8,
+    'progress': pl.Float64,
+    'size': pl.Int64,
+    'upload_speed': pl.Int64,
+    'download_speed': pl.Int64,
+    'peers_connected': pl.Int64,
+    'eta': pl.Int64,
+    'download_dir': pl.Utf8
+}
+
 # ------------------------------------------------------------------------------
 # create client function
 # ------------------------------------------------------------------------------
 
-def get_transmission_client(port: int = transmission_port):
+def get_transmission_client(port: int = transmission_port, host: str = hostname):
     """
-    Instantiate a transmission client
+    Return the cached transmission client for a daemon, instantiating it on
+        first use
     :param port: server port for transmission client being used
+    :param host: host of the transmission daemon
     :return: Transmission_client object
     """
-    return Transmission_client(
-        host=hostname,
-        port=port,
-        username=transmission_username,
-        password=transmission_password
-    )
+    with _transmission_clients_lock:
+        if (host, port) not in _transmission_clients:
+            _transmission_clients[(host, port)] = Transmission_client(
+                host=host,
+                port=port,
+                username=transmission_username,
+                password=transmission_password
+            )
+
+        return _transmission_clients[(host, port)]
+
+
+def reset_transmission_client(port: int = transmission_port, host: str = hostname):
+    """
+    Discard the cached transmission client for a daemon so the next call
+        reconnects
+    :param port: server port for transmission client being used
+    :param host: host of the transmission daemon
+    """
+    with _transmission_clients_lock:
+        _transmission_clients.pop((host, port), None)
+
+
+def _with_client(
+    operation: Callable[[Transmission_client], Any],
+    port: int = transmission_port,
+    host: str = hostname
+) -> Any:
+    """
+    Run an operation against the cached client, reconnecting and retrying
+        once if the connection to the daemon was lost
+    :param operation: function taking a transmission client
+    :param port: server port for transmission client being used
+    :param host: host of the transmission daemon
+    :return: result of the operation
+    """
+    try:
+        return operation(get_transmission_client(port, host))
+    except TransmissionConnectError as e:
+        logging.warning(f"transmission connection to {host}:{port} lost, reconnecting - {e}")
+        reset_transmission_client(port, host)
+        return operation(get_transmission_client(port, host))
+
+
+def _select_endpoints(port: int | None, host: str | None) -> list:
+    """
+    resolve the daemons a read applies to
+
+    :param port: daemon port, or None for every daemon in the pool
+    :param host: daemon host; TRANSMISSION_HOST if None
+    :return: list of (host, port)
+    """
+    if port is None:
+        return transmission_endpoints
+
+    return [(host or hostname, port)]
 
 # ------------------------------------------------------------------------------
 # functions to retrieve data
 # ------------------------------------------------------------------------------
 
-def get_media_item_info(hash: str):
+def get_media_item_info(hash: str, arguments: list | None = None):
     """
     using hash, retrieve media_item metadata from transmission client
 
     :param hash: individual hash of the media_item
+    :param arguments: torrent fields to retrieve; all fields if None
     :return: dict of all media_item parameters stored in transmission client
     """
-    transmission_client = get_transmission_client()
+    locations, unlocated = locate_media_items([hash])
+    if unlocated:
+        raise ValueError(f"media_item {hash} not found on any reachable transmission daemon")
+    if hash not in locations:
+        raise ValueError(f"media_item {hash} not found on any transmission daemon")
 
-    media_item = transmission_client.get_torrent(hash)
+    host, port = locations[hash]
+    media_item = _with_client(lambda client: client.get_torrent(hash, arguments=arguments), port, host)
 
     return media_item
 
 
-def return_current_media_items(port: int = transmission_port) -> dict | None:
+def _format_media_item(media_item) -> dict:
+    """
+    extract the relevant information from a transmission media_item
+
+    :param media_item: transmission_rpc Torrent with MEDIA_ITEM_FIELDS
+    :return: dict of media_item information
+    """
+    return {
+        'id': media_item.id,
+        'name': media_item.name,
+        'status': media_item.status.value,
+        'media_item_source': media_item.magnet_link,
+        'progress': round(media_item.progress, 2),
+        'size': media_item.total_size,
+        'upload_speed': media_item.rate_upload,
+        'download_speed': media_item.rate_download,
+        'peers_connected': media_item.peers_connected,
+        'eta': media_item.fields.get('eta'),
+        'download_dir': media_item.download_dir
+    }
+
+
+def _load_media_item_snapshot(key: str) -> dict | None:
+    """
+    return the freshest snapshot for a daemon, from memory or the snapshot
+        cache file; must be called holding _media_item_snapshots_lock
+
+    :param key: host:port of the transmission daemon
+    :return: snapshot dict, or None if no snapshot exists
+    """
+    snapshot = _media_item_snapshots.get(key)
+
+    if snapshot_cache_path is None or not os.path.exists(snapshot_cache_path):
+        return snapshot
+
+    try:
+        with open(snapshot_cache_path) as f:
+            cached = json.load(f).get(key)
+    except (OSError, ValueError) as e:
+        logging.warning(f"could not read media_item snapshot cache - {e}")
+        return snapshot
+
+    if cached is None or (snapshot is not None and snapshot['polled_at'] >= cached['polled_at']):
+        return snapshot
+
+    snapshot = {
+        **cached,
+        'items': {int(id): tuple(item) for id, item in cached['items'].items()}
+    }
+    _media_item_snapshots[key] = snapshot
+
+    return snapshot
+
+
+def _save_media_item_snapshot(key: str, snapshot: dict):
+    """
+    persist a snapshot to the snapshot cache file, if one is configured;
+        must be called holding _media_item_snapshots_lock
+
+    :param key: host:port of the transmission daemon
+    :param snapshot: snapshot dict to persist
+    """
+    if snapshot_cache_path is None:
+        return
+
+    try:
+        cached = {}
+        if os.path.exists(snapshot_cache_path):
+            with open(snapshot_cache_path) as f:
+                cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+
+    cached[key] = snapshot
+
+    # write to a temporary file and swap it in so readers never see a partial file
+    try:
+        temp_path = f"{snapshot_cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(cached, f)
+        os.replace(temp_path, snapshot_cache_path)
+    except OSError as e:
+        logging.warning(f"could not write media_item snapshot cache - {e}")
+
+
+def invalidate_media_item_snapshot(port: int = transmission_port, host: str = hostname):
     """
-    hit transmission rpc and return all current media_items
+    mark the snapshot for a daemon as stale after items are added or removed,
+        so the next read polls transmission; the tracked items are kept so
+        that poll can still be incremental
 
     :param port: transmission daemon port
-    :return: dict containing all relevant media_item information if media_items exist, None if no media_items
+    :param host: transmission daemon host
+    """
+    key = f"{host}:{port}"
+    with _media_item_snapshots_lock:
+        snapshot = _load_media_item_snapshot(key)
+
+        if snapshot is None:
+            return
+
+        snapshot['stale'] = True
+        _save_media_item_snapshot(key, snapshot)
+
+
+def sync_media_item_snapshot(
+    port: int = transmission_port,
+    full: bool = False,
+    max_age: float = 0,
+    host: str = hostname
+) -> dict:
+    """
+    bring the local media_item snapshot up to date; a snapshot younger than
+        max_age is returned as-is, polls within the recently-active window
+        fetch only changed torrents and the ids of removed ones, otherwise
+        the full torrent list is fetched
+
+    :param port: transmission daemon port
+    :param full: force a full resync
+    :param max_age: seconds a snapshot may be reused without polling
+    :param host: transmission daemon host
+    :return: dict of torrent id to (hash, media_item datum)
+    """
+    key = f"{host}:{port}"
+    with _media_item_snapshots_lock:
+        snapshot = _load_media_item_snapshot(key)
+        now = time.time()
+
+        if (
+            not full
+            and snapshot is not None
+            and not snapshot.get('stale')
+            and now - snapshot['polled_at'] < max_age
+        ):
+            return dict(snapshot['items'])
+
+        incremental = (
+            not full
+            and snapshot is not None
+            and now - snapshot['synced_at'] < torrent_resync_interval
+            and now - snapshot['polled_at'] < RECENTLY_ACTIVE_WINDOW
+        )
+
+        if incremental:
+            media_items, removed_ids = _with_client(
+                lambda client: client.get_recently_active_torrents(arguments=MEDIA_ITEM_FIELDS),
+                port,
+                host
+            )
+            for removed_id in removed_ids:
+                snapshot['items'].pop(removed_id, None)
+        else:
+            media_items = _with_client(
+                lambda client: client.get_torrents(arguments=MEDIA_ITEM_FIELDS),
+                port,
+                host
+            )
+            snapshot = {'items': {}, 'synced_at': now}
+            _media_item_snapshots[key] = snapshot
+
+        for media_item in media_items:
+            snapshot['items'][media_item.id] = (media_item.hash_string, _format_media_item(media_item))
+
+        # time the poll from before the request so the window stays conservative
+        snapshot['polled_at'] = now
+        snapshot['stale'] = False
+
+        _save_media_item_snapshot(key, snapshot)
+
+        logging.debug(
+            f"{'incremental' if incremental else 'full'} media_item sync of {key} - "
+            f"{len(media_items)} fetched, {len(snapshot['items'])} tracked"
+        )
+
+        return dict(snapshot['items'])
+
+
+def _sync_media_item_snapshots(
+    port: int | None,
+    full: bool,
+    max_age: float,
+    host: str | None
+) -> dict:
+    """
+    sync the snapshots of the selected daemons and merge their media_items; a
+        daemon that cannot be reached is logged and skipped, unless no
+        selected daemon can be reached
+
+    :param port: daemon port, or None for every daemon in the pool
+    :param full: force a full resync of the snapshots
+    :param max_age: seconds a snapshot may be reused; 0 for fresh data
+    :param host: daemon host; TRANSMISSION_HOST if None
+    :return: tuple of dict of hash to media_item datum, and list of (host,
+        port) of the daemons that could not be reached
+    """
+    endpoints = _select_endpoints(port, host)
+    media_items = {}
+    errors = {}
+    for endpoint_host, endpoint_port in endpoints:
+        try:
+            snapshot_items = sync_media_item_snapshot(endpoint_port, full=full, max_age=max_age, host=endpoint_host)
+        except Exception as e:
+            logging.warning(f"could not read media_items from {endpoint_host}:{endpoint_port} - {e}")
+            errors[(endpoint_host, endpoint_port)] = e
+            continue
+        media_items.update(snapshot_items.values())
+
+    if len(errors) == len(endpoints):
+        raise next(iter(errors.values()))
+
+    return media_items, list(errors)
+
+
+def return_current_media_items(
+    port: int | None = None,
+    full: bool = False,
+    max_age: float = snapshot_max_age,
+    host: str | None = None
+) -> dict | None:
     """
-    # Get transmission client
-    client = get_transmission_client(port)
+    return all current media_items from the shared snapshots, updating them
+        from transmission if they are older than max_age
 
-    # Get all media_items
-    media_items = client.get_torrents()
+    :param port: transmission daemon port, or None for every daemon in the pool
+    :param full: force a full resync of the snapshot
+    :param max_age: seconds a snapshot may be reused; 0 for fresh data
+    :param host: transmission daemon host; TRANSMISSION_HOST if None
+    :return: dict containing all relevant media_item information if media_items exist, None if no media_items
+    """
+    media_items, _ = _sync_media_item_snapshots(port, full, max_age, host)
 
     # If no media_items, return None
     if not media_items:
         return None
 
-    # Create list to store media_item data
-    media_item_data = {}
-
-    # Extract relevant information from each media_item
-    for media_item in media_items:
-        media_item_datum = {
-            media_item.hashString: {
-                'id': media_item.id,
-                'name': media_item.name,
-                'status': media_item.status,
-                'media_item_source': media_item.magnet_link,
-                'progress': round(media_item.progress, 2),
-                'size': media_item.total_size,
-                'upload_speed': media_item.rate_upload,
-                'download_speed': media_item.rate_download,
-                'peers_connected': media_item.peers_connected,
-                'eta': media_item.eta,
-                'download_dir': media_item.download_dir
-            }
-        }
-        media_item_data.update(media_item_datum)
+    return {hash: dict(datum) for hash, datum in media_items.items()}
 
-    return media_item_data
 
+def media_items_to_frame(media_items: dict | None) -> pl.DataFrame:
+    """
+    convert media_items keyed by hash into a typed DataFrame
 
-def return_current_item_count(port: int = transmission_port) -> int:
+    :param media_items: dict of hash to media_item information, or None
+    :return: DataFrame with MEDIA_ITEM_SCHEMA, empty if no media_items
     """
-    hit transmission rpc and return count of active items
+    if not media_items:
+        return pl.DataFrame(schema=MEDIA_ITEM_SCHEMA)
 
-    :return: DataFrame containing all relevant media_item information if media_items exist, None if no media_items
+    return pl.DataFrame({
+        col: [hash for hash in media_items] if col == 'hash'
+            else [media_item.get(col) for media_item in media_items.values()]
+        for col in MEDIA_ITEM_SCHEMA
+    }, schema=MEDIA_ITEM_SCHEMA)
 
-    :param port: transmission daemon port
-    :debug: port=30091
+
+def return_current_media_frame(
+    port: int | None = None,
+    full: bool = False,
+    max_age: float = snapshot_max_age,
+    host: str | None = None
+) -> pl.DataFrame:
+    """
+    return all current media_items from the shared snapshots as a DataFrame
+        keyed by hash, updating them from transmission if they are older than
+        max_age
+
+    :param port: transmission daemon port, or None for every daemon in the pool
+    :param full: force a full resync of the snapshot
+    :param max_age: seconds a snapshot may be reused; 0 for fresh data
+    :param host: transmission daemon host; TRANSMISSION_HOST if None
+    :return: DataFrame with MEDIA_ITEM_SCHEMA, empty if no media_items
     """
-    # Get transmission client
-    client = get_transmission_client(port)
+    media_items, _ = _sync_media_item_snapshots(port, full, max_age, host)
 
-    # Get all media_items
-    media_items = client.get_torrents()
+    return media_items_to_frame(media_items)
+
+
+def return_current_media_state(
+    port: int | None = None,
+    full: bool = False,
+    max_age: float = snapshot_max_age,
+    host: str | None = None
+) -> tuple:
+    """
+    return all current media_items as a DataFrame, along with the daemons
+        that could not be reached; items held by those daemons are missing
+        from the DataFrame, so absence from it is only conclusive when every
+        daemon answered
+
+    :param port: transmission daemon port, or None for every daemon in the pool
+    :param full: force a full resync of the snapshot
+    :param max_age: seconds a snapshot may be reused; 0 for fresh data
+    :param host: transmission daemon host; TRANSMISSION_HOST if None
+    :return: tuple of DataFrame with MEDIA_ITEM_SCHEMA, and list of (host,
+        port) of unreachable daemons
+    """
+    media_items, unreachable_endpoints = _sync_media_item_snapshots(port, full, max_age, host)
+
+    return media_items_to_frame(media_items), unreachable_endpoints
+
+
+def return_current_item_count(
+    port: int | None = None,
+    max_age: float = snapshot_max_age,
+    host: str | None = None
+) -> int:
+    """
+    return count of active items from the shared snapshots, updating them
+        from transmission if they are older than max_age
+
+    :param port: transmission daemon port, or None for every daemon in the pool
+    :param max_age: seconds a snapshot may be reused; 0 for fresh data
+    :param host: transmission daemon host; TRANSMISSION_HOST if None
+    :return: number of media_items in transmission
+    :debug: port=30091
+    """
+    media_items, _ = _sync_media_item_snapshots(port, False, max_age, host)
 
-    # If no media_items, return None
     return len(media_items)
 
 
+# ------------------------------------------------------------------------------
+# daemon pool functions
+# ------------------------------------------------------------------------------
+
+def locate_media_items(hashes: list, max_age: float = snapshot_max_age) -> tuple:
+    """
+    find the daemon holding each media_item from the shared snapshots; with a
+        single daemon every hash is taken to be on it. hashes in neither of the
+        returned collections are on no daemon in the pool
+
+    :param hashes: list of media_item hashes
+    :param max_age: seconds a snapshot may be reused; 0 for fresh data
+    :return: tuple of dict of hash to (host, port), and list of hashes not
+        found on any daemon that answered, which may be held by one that did
+        not; empty when every daemon answered
+    """
+    if len(transmission_endpoints) == 1:
+        return {hash: transmission_endpoints[0] for hash in hashes}, []
+
+    locations = {}
+    unreachable = False
+    wanted = set(hashes)
+    for host, port in transmission_endpoints:
+        try:
+            snapshot_items = sync_media_item_snapshot(port, max_age=max_age, host=host)
+        except Exception as e:
+            logging.warning(f"could not read media_items from {host}:{port} - {e}")
+            unreachable = True
+            continue
+
+        for hash, _ in snapshot_items.values():
+            if hash in wanted:
+                locations[hash] = (host, port)
+
+    unlocated = [hash for hash in hashes if hash not in locations] if unreachable else []
+
+    return locations, unlocated
+
+
+def get_download_dirs(hashes: list) -> dict:
+    """
+    return the local mount of the download dir for each media_item whose
+        daemon has one configured in TRANSMISSION_ENDPOINTS
+
+    :param hashes: list of media_item hashes
+    :return: tuple of dict of hash to download dir, omitting hashes without
+        one, and list of hashes whose download dir is unknown because they
+        may be held by a daemon that did not answer
+    """
+    if not endpoint_download_dirs:
+        return {}, []
+
+    locations, unlocated = locate_media_items(hashes)
+
+    download_dirs = {
+        hash: endpoint_download_dirs[endpoint]
+        for hash, endpoint in locations.items()
+        if endpoint in endpoint_download_dirs
+    }
+
+    return download_dirs, unlocated
+
+
+def get_daemon_loads(strategy: str = daemon_balance_strategy) -> dict:
+    """
+    measure the load of every reachable daemon in the pool; daemons that
+        cannot be reached are left out
+
+    :param strategy: one of DAEMON_BALANCE_STRATEGIES; free space is only
+        queried for the free_space strategy
+    :return: dict of (host, port) to dict of active_count, download_rate,
+        item_count, total_size and free_space
+    """
+    loads = {}
+    for host, port in transmission_endpoints:
+        try:
+            media_items = return_current_media_frame(port=port, host=host)
+            free_space = None
+            if strategy == 'free_space':
+                free_space = _with_client(
+                    lambda client: client.free_space(client.get_session().download_dir),
+                    port,
+                    host
+                )
+        except Exception as e:
+            logging.warning(f"transmission daemon {host}:{port} unavailable for placement - {e}")
+            continue
+
+        downloading = media_items.filter(pl.col('progress') < 100.0)
+        loads[(host, port)] = {
+            'active_count': downloading.height,
+            'download_rate': downloading['download_speed'].fill_null(0).sum(),
+            'item_count': media_items.height,
+            'total_size': media_items['size'].fill_null(0).sum(),
+            'free_space': free_space or 0
+        }
+
+    return loads
+
+
+def assign_daemons(count: int, strategy: str = daemon_balance_strategy) -> list:
+    """
+    pick a daemon for each of count new media_items, placing each on the
+        least loaded daemon and counting earlier placements in the batch; for
+        download_rate and free_space each placement is charged the pool-wide
+        mean rate or size of an item
+
+    :param count: number of media_items to place
+    :param strategy: one of DAEMON_BALANCE_STRATEGIES
+    :return: list of (host, port), one per media_item
+    """
+    if strategy not in DAEMON_BALANCE_STRATEGIES:
+        raise ValueError(f"AT_DAEMON_BALANCE_STRATEGY must be one of {DAEMON_BALANCE_STRATEGIES}")
+
+    if len(transmission_endpoints) == 1:
+        return [transmission_endpoints[0]] * count
+
+    loads = get_daemon_loads(strategy)
+
+    # fall back to the first daemon so failed adds are reported per item
+    if not loads:
+        return [transmission_endpoints[0]] * count
+
+    active_count = sum(load['active_count'] for load in loads.values())
+    item_count = sum(load['item_count'] for load in loads.values())
+    mean_rate = sum(load['download_rate'] for load in loads.values()) / max(active_count, 1)
+    mean_size = sum(load['total_size'] for load in loads.values()) / max(item_count, 1)
+
+    def score(load: dict) -> tuple:
+        if strategy == 'download_rate':
+            return load['download_rate'] + load['pending'] * mean_rate, load['active_count'] + load['pending']
+        if strategy == 'free_space':
+            return -(load['free_space'] - load['pending'] * mean_size), load['active_count'] + load['pending']
+        return (load['active_count'] + load['pending'],)
+
+    for load in loads.values():
+        load['pending'] = 0
+
+    assignments = []
+    for _ in range(count):
+        endpoint = min(loads, key=lambda endpoint: score(loads[endpoint]))
+        loads[endpoint]['pending'] += 1
+        assignments.append(endpoint)
+
+    return assignments
+
+
 # ------------------------------------------------------------------------------
 # functions to add/remove media_items
 # ------------------------------------------------------------------------------
 
-def add_media_item(media_item_source: str):
+def add_media_item(
+    media_item_source: str,
+    port: int = transmission_port,
+    host: str = hostname
+):
     """
     add media item to transmission client
     :param media_item_source: any acceptable format of media_item link
+    :param port: port of the daemon to add the item to
+    :param host: host of the daemon to add the item to
     """
-    transmission_client = get_transmission_client()
-
     # Regex pattern for a 40-character hex string (SHA-1 hash)
     hash_pattern = re.compile(r'^[0-9a-f]{40}$')
 
@@ -134,35 +720,137 @@ def add_media_item(media_item_source: str):
         media_item_source = f"magnet:?xt=urn:btih:{media_item_source}"
 
     # send to transmission
-    transmission_client.add_torrent(media_item_source)
+    _with_client(lambda client: client.add_torrent(media_item_source), port, host)
+    invalidate_media_item_snapshot(port, host)
 
 
-def remove_media_item(hash: str):
+def add_media_items(
+    media_item_sources: list,
+    max_workers: int = initiation_concurrency
+) -> dict:
+    """
+    add many media items to transmission concurrently over the shared
+        clients, placing each on the least loaded daemon in the pool
+    :param media_item_sources: list of any acceptable format of media_item link
+    :param max_workers: max number of concurrent torrent-add requests
+    :return: dict of media_item_source to None if added, or the error message
+        if the add failed
+    """
+    if not media_item_sources:
+        return {}
+
+    endpoints = assign_daemons(len(media_item_sources))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            media_item_source: executor.submit(add_media_item, media_item_source, port, host)
+            for media_item_source, (host, port) in zip(media_item_sources, endpoints)
+        }
+
+    results = {}
+    for media_item_source, future in futures.items():
+        try:
+            future.result()
+            results[media_item_source] = None
+        except Exception as e:
+            results[media_item_source] = f"{e}"
+
+    return results
+
+
+def remove_media_item(
+    hash: str,
+    port: int = transmission_port,
+    host: str = hostname
+):
     """
     remove media item from transmission client
     :param hash: hash of the media_item to remove
+    :param port: port of the daemon holding the item
+    :param host: host of the daemon holding the item
     """
-    transmission_client = get_transmission_client()
-    transmission_client.remove_torrent(hash, delete_data=True)
+    _with_client(lambda client: client.remove_torrent(hash, delete_data=True), port, host)
+    invalidate_media_item_snapshot(port, host)
 
 
-def purge_media_item_queue():
+def remove_media_items(hashes: list) -> dict:
     """
-    purge entire queue of media_items
+    remove many media items from transmission, deleting local data, with a
+        single torrent-remove request per daemon holding them; items on no
+        daemon are already removed, while items not found on any daemon that
+        answered are reported as errors, since they may be held by one that
+        did not
+    :param hashes: list of hashes of the media_items to remove
+    :return: dict of hash to None if removed, or the error message if the
+        removal failed
     """
-    # Instantiate transmission client
-    transmission_client = get_transmission_client()
+    if not hashes:
+        return {}
+
+    # group hashes by the daemon holding them
+    locations, unlocated = locate_media_items(hashes)
+    hashes_by_endpoint = {}
+    for hash, endpoint in locations.items():
+        hashes_by_endpoint.setdefault(endpoint, []).append(hash)
+
+    results = {hash: None for hash in hashes}
+    results.update({hash: "not found on any reachable transmission daemon" for hash in unlocated})
+    for (host, port), endpoint_hashes in hashes_by_endpoint.items():
+        results.update(_remove_endpoint_media_items(endpoint_hashes, port, host))
+
+    return results
 
-    # Get all media_items
-    media_items = transmission_client.get_torrents()
 
-    # Iterate through each media_item and remove it
-    for media_item in media_items:
+def _remove_endpoint_media_items(hashes: list, port: int, host: str) -> dict:
+    """
+    remove media items from a single daemon in one torrent-remove request;
+        transmission ignores ids it does not know, so only a failed request
+        is reported as an error, in which case each item is retried
+        individually to isolate failures
+    :param hashes: list of hashes of the media_items to remove
+    :param port: port of the daemon holding the items
+    :param host: host of the daemon holding the items
+    :return: dict of hash to None if removed, or the error message if the
+        removal failed
+    """
+    try:
+        _with_client(lambda client: client.remove_torrent(hashes, delete_data=True), port, host)
+        invalidate_media_item_snapshot(port, host)
+        return {hash: None for hash in hashes}
+    except Exception as e:
+        logging.warning(f"batch removal of {len(hashes)} media_items failed, removing individually - {e}")
+
+    results = {}
+    for hash in hashes:
         try:
-            transmission_client.remove_torrent(media_item.id, delete_data=True)
-            print(f"Removed media_item: {media_item.name} with hash {media_item.hashString}")
+            remove_media_item(hash, port, host)
+            results[hash] = None
         except Exception as e:
-            print(f"Failed to remove media_item: {media_item.name} with hash {media_item.hashString}. Error: {e}")
+            results[hash] = f"{e}"
+
+    return results
+
+
+def purge_media_item_queue():
+    """
+    purge entire queue of media_items on every daemon in the pool
+    """
+    for host, port in transmission_endpoints:
+        # Get all media_items
+        media_items = _with_client(lambda client: client.get_torrents(arguments=PURGE_FIELDS), port, host)
+
+        if not media_items:
+            continue
+
+        # remove all media_items of the daemon in a single request
+        results = _remove_endpoint_media_items([media_item.hash_string for media_item in media_items], port, host)
+
+        for media_item in media_items:
+            error = results[media_item.hash_string]
+            if error is None:
+                print(f"Removed media_item: {media_item.name} with hash {media_item.hash_string}")
+            else:
+                print(f"Failed to remove media_item: {media_item.name} with hash {media_item.hash_string}. Error: {error}")
 
 # ------------------------------------------------------------------------------
 # end of rpcf.py
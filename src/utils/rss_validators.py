@@ -0,0 +1,62 @@
+# standard library imports
+import json
+import logging
+import os
+from pathlib import Path
+
+# ------------------------------------------------------------------------------
+# rss validator config
+# ------------------------------------------------------------------------------
+
+# optional json file keeping the etag and last-modified validators of each rss
+#   feed between runs, so unchanged feeds are answered with 304 not modified;
+#   conditional requests are disabled when unset
+rss_validator_path = os.getenv('AT_RSS_VALIDATOR_PATH') or None
+
+# ------------------------------------------------------------------------------
+# rss validator functions
+# ------------------------------------------------------------------------------
+
+def load_rss_validators() -> dict | None:
+    """
+    load the validators stored for each rss feed
+
+    :return: dict of rss url to dict of its etag and modified values; empty if
+        the file does not exist or is unreadable, and None if disabled
+    """
+    if rss_validator_path is None:
+        return None
+
+    try:
+        with open(rss_validator_path, 'r') as file:
+            validators = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"could not read rss validators - {e}")
+        return {}
+
+    return validators if isinstance(validators, dict) else {}
+
+
+def save_rss_validators(validators: dict | None) -> None:
+    """
+    store the validators of each rss feed, replacing the file in one step so
+        a failed write leaves the previous validators in place
+
+    :param validators: dict of rss url to dict of its etag and modified values
+    """
+    if rss_validator_path is None or validators is None:
+        return
+
+    temp_path = Path(f"{rss_validator_path}.tmp")
+    try:
+        temp_path.write_text(json.dumps(validators, indent=2, sort_keys=True))
+        os.replace(temp_path, rss_validator_path)
+    except OSError as e:
+        logging.warning(f"could not write rss validators - {e}")
+
+
+# ------------------------------------------------------------------------------
+# end of rss_validators.py
+# ------------------------------------------------------------------------------
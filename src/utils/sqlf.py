@@ -2,7 +2,8 @@
 import logging
 import os
 import sys
-from typing import List, Optional
+import time
+from typing import Callable, List, Optional
 import warnings
 
 # third-party imports
@@ -27,6 +28,10 @@ pg_port = os.getenv('AT_PGSQL_PORT')
 pg_database = os.getenv('AT_PGSQL_DATABASE')
 pg_schema = os.getenv('AT_PGSQL_SCHEMA')
 
+# write-behind buffer flush thresholds
+write_buffer_max_items = int(os.getenv('AT_WRITE_BUFFER_MAX_ITEMS') or "50")
+write_buffer_max_age = float(os.getenv('AT_WRITE_BUFFER_MAX_AGE') or "10")
+
 # ------------------------------------------------------------------------------
 # sql functions to be used by core packages
 # ------------------------------------------------------------------------------
@@ -106,6 +111,103 @@ def create_db_engine(
 # select statements
 # ------------------------------------------------------------------------------
 
+def get_pipeline_status_counts() -> dict:
+    """
+    Returns the number of actionable media items per pipeline_status using a
+        single aggregate query; intended as a cheap probe before a stage loads
+        any media
+
+    :return: dict of pipeline_status to item count; statuses with no items
+        are absent
+    """
+    # assign engine
+    engine = create_db_engine()
+
+    try:
+        query = text("""
+            SELECT pipeline_status, COUNT(*)
+            FROM media
+            WHERE error_status = FALSE
+            AND deleted_at IS NULL
+            GROUP BY pipeline_status
+        """)
+
+        with engine.connect() as conn:
+            rows = conn.execute(query).fetchall()
+
+        return {pipeline_status: count for pipeline_status, count in rows}
+
+    except Exception as e:
+        logging.error(f"get_pipeline_status_counts error: {str(e)}")
+        raise Exception(f"get_pipeline_status_counts error: {str(e)}")
+
+
+def has_pending_media(pipeline_statuses: List[str]) -> bool:
+    """
+    Determines if any actionable media items exist in the given pipeline
+        statuses, allowing stages with no pending work to exit early
+
+    :param pipeline_statuses: list of pipeline_status values consumed by a stage
+    :return: True if at least one item is pending, else False
+    """
+    status_counts = get_pipeline_status_counts()
+
+    # accept either plain strings or PipelineStatus enum members
+    pipeline_statuses = [getattr(status, 'value', status) for status in pipeline_statuses]
+
+    return any(status_counts.get(status, 0) > 0 for status in pipeline_statuses)
+
+
+def get_pipeline_status_summary() -> pl.DataFrame | None:
+    """
+    Returns queue depth and throughput per pipeline_status using a single
+        aggregate query; throughput is the number of items that reached a
+        terminal status (complete or rejected) within the last hour, expressed
+        per minute; terminal rows are not written again by later stages, so
+        their updated_at marks the transition, while updated_at on other
+        statuses also moves on re-writes and is not counted
+
+    :return: DataFrame with pipeline_status, item_count,
+        oldest_item_age_seconds, and finished_per_minute; None if no items
+    """
+    # assign engine
+    engine = create_db_engine()
+
+    try:
+        query = text("""
+            SELECT
+                pipeline_status,
+                COUNT(*) AS item_count,
+                EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - MIN(updated_at)))::float AS oldest_item_age_seconds,
+                COUNT(*) FILTER (
+                    WHERE pipeline_status IN ('complete', 'rejected')
+                    AND updated_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
+                ) / 60.0 AS finished_per_minute
+            FROM media
+            WHERE error_status = FALSE
+            AND deleted_at IS NULL
+            GROUP BY pipeline_status
+        """)
+
+        with engine.connect() as conn:
+            result = conn.execute(query)
+            columns = result.keys()
+            rows = result.fetchall()
+
+        if not rows:
+            return None
+
+        data = [dict(zip(columns, row)) for row in rows]
+
+        return pl.DataFrame(data).with_columns(
+            finished_per_minute=pl.col('finished_per_minute').cast(pl.Float64)
+        )
+
+    except Exception as e:
+        logging.error(f"get_pipeline_status_summary error: {str(e)}")
+        raise Exception(f"get_pipeline_status_summary error: {str(e)}")
+
+
 def compare_hashes_to_db(
     hashes: List[str],
     pipeline_status: str = None
@@ -612,6 +714,145 @@ def media_db_update(media: pl.DataFrame) -> None:
         engine.dispose()
 
 
+# ------------------------------------------------------------------------------
+# write-behind buffer for media updates
+# ------------------------------------------------------------------------------
+
+class MediaWriteBuffer:
+    """
+    Write-behind buffer for media upserts. Rows are keyed by hash, successive
+        updates to the same hash are merged, and rows are written in bulk via
+        media_db_update once max_items rows are buffered or the oldest
+        buffered row is older than max_age seconds; thresholds are checked as
+        rows are added. Remaining rows are written on flush or when used as a
+        context manager, on exit.
+
+    Rows are validated as they are added, so an invalid row raises to the
+        caller and is never buffered. Rows are written in the order their hash
+        was first buffered. If a bulk write fails, its rows are retried
+        individually so one bad row does not block the rest; rows that still
+        fail are logged and recorded in failed_hashes.
+    """
+
+    def __init__(
+        self,
+        max_items: int = write_buffer_max_items,
+        max_age: float = write_buffer_max_age,
+        validator: Optional[Callable[[pl.DataFrame], pl.DataFrame]] = None
+    ):
+        """
+        :param max_items: number of buffered rows that triggers a flush
+        :param max_age: age in seconds of the oldest buffered row that
+            triggers a flush
+        :param validator: optional function applied to rows as they are
+            added, e.g. MediaSchema.validate
+        """
+        self.max_items = max_items
+        self.max_age = max_age
+        self.validator = validator
+        self.failed_hashes = []
+        self._rows = {}
+        self._first_added_at = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
+
+    def add(self, media: pl.DataFrame) -> None:
+        """
+        Buffers all rows of a DataFrame.
+
+        :param media: DataFrame containing media records to write
+        """
+        if self.validator is not None:
+            media = self.validator(media)
+
+        for row in media.iter_rows(named=True):
+            self._merge_row(row)
+
+        self._flush_if_due()
+
+    def add_row(self, row: dict) -> None:
+        """
+        Buffers a single media record.
+
+        :param row: dict containing one media record, including its hash
+        """
+        if self.validator is not None:
+            row = self.validator(pl.DataFrame([row], infer_schema_length=None)).row(0, named=True)
+
+        self._merge_row(row)
+        self._flush_if_due()
+
+    def flush(self) -> List[str]:
+        """
+        Writes all buffered rows to the database in buffered order.
+
+        :return: hashes of the rows that could not be written by this flush
+        """
+        failed_hashes = []
+        while self._rows:
+            chunk = self._next_chunk()
+
+            try:
+                self._write(chunk)
+            except Exception as e:
+                logging.error(f"bulk write of {len(chunk)} buffered records failed, retrying individually - {e}")
+                for row in chunk:
+                    try:
+                        self._write([row])
+                    except Exception as row_e:
+                        logging.error(f"buffered write failed - {row['hash']} - {row_e}")
+                        failed_hashes.append(row['hash'])
+
+            for row in chunk:
+                del self._rows[row['hash']]
+
+        self._first_added_at = None
+        self.failed_hashes.extend(failed_hashes)
+
+        return failed_hashes
+
+    def _merge_row(self, row: dict) -> None:
+        if self._first_added_at is None:
+            self._first_added_at = time.monotonic()
+
+        # later values for a hash overwrite earlier ones, but the hash keeps
+        #   its original position in the write order
+        self._rows.setdefault(row['hash'], {}).update(row)
+
+    def _flush_if_due(self) -> None:
+        if not self._rows:
+            return
+
+        if len(self._rows) >= self.max_items or \
+                time.monotonic() - self._first_added_at >= self.max_age:
+            self.flush()
+
+    def _next_chunk(self) -> List[dict]:
+        # a bulk upsert requires all records share the same columns, so take
+        #   the leading run of rows with the same columns as the first row
+        rows = iter(self._rows.values())
+        first_row = next(rows)
+        chunk = [first_row]
+
+        for row in rows:
+            if row.keys() != first_row.keys():
+                break
+            chunk.append(row)
+
+        return chunk
+
+    def _write(self, rows: List[dict]) -> None:
+        media_db_update(media=pl.DataFrame(rows, infer_schema_length=None))
+
+
 # ------------------------------------------------------------------------------
 # training table operations
 # ------------------------------------------------------------------------------
@@ -0,0 +1,162 @@
+# standard library imports
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import os
+import time
+
+# third-party imports
+from dotenv import load_dotenv
+import polars as pl
+
+# local/custom imports
+from src.data_models import PipelineStatus
+from src.utils.log_config import setup_logging
+from src.utils.sqlf import get_pipeline_status_summary
+
+# ------------------------------------------------------------------------------
+# load environment variables
+# ------------------------------------------------------------------------------
+
+load_dotenv(override=True)
+
+# seconds a status report is reused before the database is queried again
+status_cache_ttl = float(os.getenv('AT_STATUS_CACHE_TTL') or "15")
+status_host = os.getenv('AT_STATUS_HOST') or "0.0.0.0"
+status_port = int(os.getenv('AT_STATUS_PORT') or "8085")
+
+# in-process cache of the most recent report
+_status_cache = {'fetched_at': None, 'report': None}
+
+# ------------------------------------------------------------------------------
+# status report functions
+# ------------------------------------------------------------------------------
+
+def build_status_report(summary: pl.DataFrame | None) -> pl.DataFrame:
+    """
+    expands the aggregate status summary to include every pipeline_status, in
+        pipeline order, so empty queues are reported explicitly
+
+    :param summary: output of sqlf.get_pipeline_status_summary
+    :return: DataFrame with one row per pipeline_status
+    """
+    all_statuses = pl.DataFrame({
+        'pipeline_status': [status.value for status in PipelineStatus]
+    })
+
+    if summary is None:
+        summary = pl.DataFrame(schema={
+            'pipeline_status': pl.Utf8,
+            'item_count': pl.Int64,
+            'oldest_item_age_seconds': pl.Float64,
+            'finished_per_minute': pl.Float64
+        })
+
+    return all_statuses.join(
+        summary.with_columns(pl.col('pipeline_status').cast(pl.Utf8)),
+        on='pipeline_status',
+        how='left'
+    ).with_columns(
+        item_count=pl.col('item_count').fill_null(0).cast(pl.Int64),
+        oldest_item_age_seconds=pl.col('oldest_item_age_seconds').cast(pl.Float64).round(0),
+        finished_per_minute=pl.col('finished_per_minute').fill_null(0.0).cast(pl.Float64).round(2)
+    )
+
+
+def get_status_report(max_age: float = status_cache_ttl) -> pl.DataFrame:
+    """
+    returns the current status report, reusing a cached copy if it is younger
+        than max_age seconds
+
+    :param max_age: maximum age of a cached report in seconds
+    :return: DataFrame with one row per pipeline_status
+    """
+    fetched_at = _status_cache['fetched_at']
+
+    if fetched_at is not None and time.monotonic() - fetched_at < max_age:
+        return _status_cache['report']
+
+    report = build_status_report(get_pipeline_status_summary())
+
+    _status_cache['fetched_at'] = time.monotonic()
+    _status_cache['report'] = report
+
+    return report
+
+
+# ------------------------------------------------------------------------------
+# http status surface
+# ------------------------------------------------------------------------------
+
+class _StatusRequestHandler(BaseHTTPRequestHandler):
+    """read-only handler serving the status report as json"""
+
+    def do_GET(self):
+        if self.path.rstrip('/') not in ('', '/status'):
+            self.send_error(404)
+            return
+
+        try:
+            body = json.dumps({
+                'pipeline_status': get_status_report().to_dicts()
+            }).encode()
+            self.send_response(200)
+        except Exception as e:
+            logging.error(f"status report error: {e}")
+            body = json.dumps({'error': str(e)}).encode()
+            self.send_response(503)
+
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(f"status request - {format % args}")
+
+
+def serve_status_report(host: str = status_host, port: int = status_port):
+    """
+    serves the status report over http until interrupted
+
+    :param host: interface to bind to
+    :param port: port to bind to
+    """
+    server = ThreadingHTTPServer((host, port), _StatusRequestHandler)
+    logging.info(f"serving pipeline status on {host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# ------------------------------------------------------------------------------
+# main guard
+# ------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="report pipeline queue depth and throughput")
+    parser.add_argument('--serve', action='store_true', help="serve the report over http")
+    parser.add_argument('--host', default=status_host)
+    parser.add_argument('--port', type=int, default=status_port)
+    args = parser.parse_args()
+
+    setup_logging()
+
+    if args.serve:
+        serve_status_report(host=args.host, port=args.port)
+    else:
+        with pl.Config(tbl_rows=-1, tbl_hide_dataframe_shape=True):
+            print(get_status_report())
+
+if __name__ == "__main__":
+    main()
+
+
+# ------------------------------------------------------------------------------
+# end of status_report.py
+# ------------------------------------------------------------------------------
@@ -431,4 +431,52 @@ def update_status_cases():
                 }
             ]
         }
-    ]
\ No newline at end of file
+    ]
+
+@pytest.fixture
+def initiate_media_items_cases():
+    """Test scenarios for initiate_media_items function."""
+    return [
+        {
+            "description": "All items initiated successfully",
+            "input_data": [
+                {"hash": "success1234567890123456789012345678901234", "error_condition": None},
+                {"hash": "success2234567890123456789012345678901234", "error_condition": None}
+            ],
+            "initiation_results": {
+                "success1234567890123456789012345678901234": None,
+                "success2234567890123456789012345678901234": None
+            },
+            "expected_fields": [
+                {"hash": "success1234567890123456789012345678901234", "error_condition": None},
+                {"hash": "success2234567890123456789012345678901234", "error_condition": None}
+            ]
+        },
+        {
+            "description": "Only failed items receive an error condition",
+            "input_data": [
+                {"hash": "success1234567890123456789012345678901234", "error_condition": None},
+                {"hash": "failed12234567890123456789012345678901234", "error_condition": None}
+            ],
+            "initiation_results": {
+                "success1234567890123456789012345678901234": None,
+                "failed12234567890123456789012345678901234": "torrent-add timed out"
+            },
+            "expected_fields": [
+                {"hash": "success1234567890123456789012345678901234", "error_condition": None},
+                {"hash": "failed12234567890123456789012345678901234", "error_condition": "initiate_item error: torrent-add timed out"}
+            ]
+        },
+        {
+            "description": "Missing error_condition column is added",
+            "input_data": [
+                {"hash": "failed12234567890123456789012345678901234"}
+            ],
+            "initiation_results": {
+                "failed12234567890123456789012345678901234": "invalid magnet"
+            },
+            "expected_fields": [
+                {"hash": "failed12234567890123456789012345678901234", "error_condition": "initiate_item error: invalid magnet"}
+            ]
+        }
+    ]
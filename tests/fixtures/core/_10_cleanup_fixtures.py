@@ -59,6 +59,52 @@ def get_delay_multiple_error_cases():
     ]
 
 
+@pytest.fixture
+def update_removed_items_cases():
+    """Test scenarios for update_removed_items function."""
+    return [
+        {
+            "description": "Removed items get new status, failed items get error",
+            "input_media": [
+                {"hash": "removed1234567890123456789012345678901234", "pipeline_status": "transferred", "error_condition": None},
+                {"hash": "failed12345678901234567890123456789012345", "pipeline_status": "transferred", "error_condition": None}
+            ],
+            "removal_results": {
+                "removed1234567890123456789012345678901234": None,
+                "failed12345678901234567890123456789012345": "connection refused"
+            },
+            "removed_values": {"pipeline_status": "complete"},
+            "expected_fields": [
+                {"hash": "removed1234567890123456789012345678901234", "pipeline_status": "complete", "error_condition": None},
+                {"hash": "failed12345678901234567890123456789012345", "pipeline_status": "transferred", "error_condition": "connection refused"}
+            ]
+        },
+        {
+            "description": "Missing target columns are added for hung items",
+            "input_media": [
+                {"hash": "hung12345678901234567890123456789012345678", "pipeline_status": "downloading", "rejection_status": "accepted"}
+            ],
+            "removal_results": {
+                "hung12345678901234567890123456789012345678": None
+            },
+            "removed_values": {
+                "pipeline_status": "rejected",
+                "rejection_status": "rejected",
+                "rejection_reason": "exceeded time limit"
+            },
+            "expected_fields": [
+                {
+                    "hash": "hung12345678901234567890123456789012345678",
+                    "pipeline_status": "rejected",
+                    "rejection_status": "rejected",
+                    "rejection_reason": "exceeded time limit",
+                    "error_condition": None
+                }
+            ]
+        }
+    ]
+
+
 @pytest.fixture
 def cleanup_transferred_media_cases():
     """Test scenarios for cleanup_transferred_media function."""
@@ -0,0 +1,54 @@
+import pytest
+
+@pytest.fixture
+def media_write_buffer_cases():
+    """Test scenarios for MediaWriteBuffer."""
+    return [
+        {
+            "description": "Updates to the same hash are merged into one row",
+            "max_items": 10,
+            "rows": [
+                {"hash": "a", "pipeline_status": "downloaded", "error_condition": None},
+                {"hash": "b", "pipeline_status": "downloaded", "error_condition": None},
+                {"hash": "a", "pipeline_status": "transferred", "error_condition": None}
+            ],
+            "expected_writes": [
+                [
+                    {"hash": "a", "pipeline_status": "transferred", "error_condition": None},
+                    {"hash": "b", "pipeline_status": "downloaded", "error_condition": None}
+                ]
+            ]
+        },
+        {
+            "description": "Size threshold flushes in buffered order",
+            "max_items": 2,
+            "rows": [
+                {"hash": "a", "pipeline_status": "transferred"},
+                {"hash": "b", "pipeline_status": "transferred"},
+                {"hash": "c", "pipeline_status": "transferred"}
+            ],
+            "expected_writes": [
+                [
+                    {"hash": "a", "pipeline_status": "transferred"},
+                    {"hash": "b", "pipeline_status": "transferred"}
+                ],
+                [
+                    {"hash": "c", "pipeline_status": "transferred"}
+                ]
+            ]
+        },
+        {
+            "description": "Rows with different columns are written in separate ordered runs",
+            "max_items": 10,
+            "rows": [
+                {"hash": "a", "pipeline_status": "complete"},
+                {"hash": "b", "pipeline_status": "complete", "error_condition": "boom"},
+                {"hash": "c", "pipeline_status": "complete"}
+            ],
+            "expected_writes": [
+                [{"hash": "a", "pipeline_status": "complete"}],
+                [{"hash": "b", "pipeline_status": "complete", "error_condition": "boom"}],
+                [{"hash": "c", "pipeline_status": "complete"}]
+            ]
+        }
+    ]
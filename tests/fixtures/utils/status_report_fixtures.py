@@ -0,0 +1,37 @@
+import pytest
+
+@pytest.fixture
+def build_status_report_cases():
+    """Test scenarios for build_status_report function."""
+    return [
+        {
+            "description": "No items in any status",
+            "summary": None,
+            "expected": {
+                "ingested": {"item_count": 0, "oldest_item_age_seconds": None, "finished_per_minute": 0.0},
+                "complete": {"item_count": 0, "oldest_item_age_seconds": None, "finished_per_minute": 0.0}
+            }
+        },
+        {
+            "description": "Some statuses populated, others filled with zero",
+            "summary": [
+                {
+                    "pipeline_status": "ingested",
+                    "item_count": 12,
+                    "oldest_item_age_seconds": 3600.4,
+                    "finished_per_minute": 0.0
+                },
+                {
+                    "pipeline_status": "complete",
+                    "item_count": 3,
+                    "oldest_item_age_seconds": 120.0,
+                    "finished_per_minute": 0.05
+                }
+            ],
+            "expected": {
+                "ingested": {"item_count": 12, "oldest_item_age_seconds": 3600.0, "finished_per_minute": 0.0},
+                "complete": {"item_count": 3, "oldest_item_age_seconds": 120.0, "finished_per_minute": 0.05},
+                "parsed": {"item_count": 0, "oldest_item_age_seconds": None, "finished_per_minute": 0.0}
+            }
+        }
+    ]
@@ -0,0 +1,377 @@
+# standard library imports
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+
+# local/custom imports
+from src.utils.log_config import setup_logging
+
+# ------------------------------------------------------------------------------
+# fake daemon parameters
+# ------------------------------------------------------------------------------
+
+# transmission torrent status codes
+STATUS_STOPPED = 0
+STATUS_DOWNLOADING = 4
+STATUS_SEEDING = 6
+
+# transmission treats torrents changed within this many seconds as recently-active
+RECENTLY_ACTIVE_WINDOW = 60
+
+# shapes of simulated download progress over download_seconds
+PROGRESS_CURVES = ('linear', 'front_loaded', 'stalled', 'instant')
+
+RPC_PATH = '/transmission/rpc'
+SESSION_ID_HEADER = 'X-Transmission-Session-Id'
+
+btih_pattern = re.compile(r'xt=urn:btih:([0-9a-fA-F]{40})')
+
+# ------------------------------------------------------------------------------
+# simulated daemon state
+# ------------------------------------------------------------------------------
+
+class FakeTransmissionDaemon:
+    """
+    in-memory torrent queue answering transmission rpc methods, with
+        download progress derived from the time since each torrent was added
+    """
+
+    def __init__(
+        self,
+        progress_curve: str = 'linear',
+        download_seconds: float = 600,
+        total_size: int = 4 * 1024 ** 3,
+        seed: int | None = None
+    ):
+        """
+        :param progress_curve: one of PROGRESS_CURVES
+        :param download_seconds: seconds for a torrent to finish downloading
+        :param total_size: simulated size of each torrent in bytes
+        :param seed: random seed for generated torrents
+        """
+        if progress_curve not in PROGRESS_CURVES:
+            raise ValueError(f"progress_curve must be one of {PROGRESS_CURVES}")
+
+        self.progress_curve = progress_curve
+        self.download_seconds = max(download_seconds, 1e-9)
+        self.total_size = total_size
+        self.session_id = uuid.uuid4().hex
+        self.torrents = {}
+        self.removed = {}
+        self.next_id = 1
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+
+    # ---- progress simulation ----
+
+    def _percent_done(self, torrent: dict, now: float) -> float:
+        fraction = min((now - torrent['added_at']) / self.download_seconds, 1.0)
+
+        if self.progress_curve == 'instant':
+            return 1.0
+        if self.progress_curve == 'stalled':
+            return min(fraction, 0.5)
+        if self.progress_curve == 'front_loaded':
+            return 1.0 - (1.0 - fraction) ** 2
+        return fraction
+
+    def _done_at(self, torrent: dict) -> float | None:
+        if self.progress_curve == 'instant':
+            return torrent['added_at']
+        if self.progress_curve == 'stalled':
+            return None
+        return torrent['added_at'] + self.download_seconds
+
+    def _render(self, torrent: dict, fields: list | None, now: float) -> dict:
+        percent_done = self._percent_done(torrent, now)
+        done_at = self._done_at(torrent)
+        finished = percent_done >= 1.0
+        rate = 0 if finished or self.progress_curve == 'stalled' else int(self.total_size / self.download_seconds)
+        remaining = int(self.total_size * (1.0 - percent_done))
+
+        rendered = {
+            'id': torrent['id'],
+            'hashString': torrent['hash'],
+            'name': torrent['name'],
+            'status': STATUS_SEEDING if finished else STATUS_DOWNLOADING,
+            'magnetLink': f"magnet:?xt=urn:btih:{torrent['hash']}&dn={torrent['name']}",
+            'percentDone': percent_done,
+            'totalSize': self.total_size,
+            'sizeWhenDone': self.total_size,
+            'leftUntilDone': remaining,
+            'rateUpload': 0,
+            'rateDownload': rate,
+            'peersConnected': 0 if finished else 12,
+            'eta': -1 if finished or rate == 0 else int(remaining / rate),
+            'downloadDir': '/downloads/complete' if finished else '/downloads/incomplete',
+            'isFinished': finished,
+            'error': 0,
+            'errorString': '',
+            'addedDate': int(torrent['added_at']),
+            'doneDate': int(done_at) if finished and done_at is not None else 0,
+            'activityDate': int(min(now, done_at) if done_at is not None else now)
+        }
+
+        if not fields:
+            return rendered
+
+        return {field: rendered[field] for field in fields if field in rendered}
+
+    def _recently_active(self, torrent: dict, now: float) -> bool:
+        done_at = self._done_at(torrent)
+        last_change = now if done_at is None or done_at > now else done_at
+        return now - max(last_change, torrent['added_at']) < RECENTLY_ACTIVE_WINDOW
+
+    # ---- queue manipulation ----
+
+    def add(self, hash: str, name: str | None = None, added_at: float | None = None) -> tuple[dict, bool]:
+        """
+        add a torrent, or return the existing one for a duplicate hash
+
+        :param hash: 40 character info hash
+        :param name: display name of the torrent
+        :param added_at: epoch time the torrent was added; now if None
+        :return: tuple of the torrent and whether it was newly added
+        """
+        hash = hash.lower()
+        with self.lock:
+            for torrent in self.torrents.values():
+                if torrent['hash'] == hash:
+                    return torrent, False
+
+            torrent = {
+                'id': self.next_id,
+                'hash': hash,
+                'name': name or f"fake.torrent.{self.next_id}",
+                'added_at': time.time() if added_at is None else added_at
+            }
+            self.torrents[torrent['id']] = torrent
+            self.next_id += 1
+
+            return torrent, True
+
+    def populate(self, count: int, spread_seconds: float = 0):
+        """
+        add count generated torrents, with added times spread evenly over the
+            preceding spread_seconds so the queue holds a mix of progress
+
+        :param count: number of torrents to add
+        :param spread_seconds: window of past added times
+        """
+        now = time.time()
+        for i in range(count):
+            hash = '%040x' % self.random.getrandbits(160)
+            offset = spread_seconds * i / count if count else 0
+            self.add(hash, name=f"Fake.Media.{i:06d}.1080p.mkv", added_at=now - offset)
+
+    def _select(self, ids) -> list:
+        if ids is None:
+            return list(self.torrents.values())
+
+        ids = ids if isinstance(ids, list) else [ids]
+        hashes = {id.lower() for id in ids if isinstance(id, str)}
+
+        return [
+            torrent for torrent in self.torrents.values()
+            if torrent['id'] in ids or torrent['hash'] in hashes
+        ]
+
+    # ---- rpc methods ----
+
+    def torrent_get(self, arguments: dict) -> dict:
+        now = time.time()
+        fields = arguments.get('fields')
+        ids = arguments.get('ids')
+
+        with self.lock:
+            if ids == 'recently-active':
+                torrents = [t for t in self.torrents.values() if self._recently_active(t, now)]
+                removed = [id for id, removed_at in self.removed.items() if now - removed_at < RECENTLY_ACTIVE_WINDOW]
+                return {
+                    'torrents': [self._render(t, fields, now) for t in torrents],
+                    'removed': removed
+                }
+
+            return {'torrents': [self._render(t, fields, now) for t in self._select(ids)]}
+
+    def torrent_add(self, arguments: dict) -> dict:
+        source = arguments.get('filename') or ''
+        match = btih_pattern.search(source)
+        if match is None:
+            raise ValueError("invalid or corrupt torrent file")
+
+        name = re.search(r'dn=([^&]+)', source)
+        torrent, added = self.add(match.group(1), name=name.group(1) if name else None)
+        key = 'torrent-added' if added else 'torrent-duplicate'
+
+        return {key: {'id': torrent['id'], 'name': torrent['name'], 'hashString': torrent['hash']}}
+
+    def torrent_remove(self, arguments: dict) -> dict:
+        now = time.time()
+        with self.lock:
+            for torrent in self._select(arguments.get('ids')):
+                del self.torrents[torrent['id']]
+                self.removed[torrent['id']] = now
+        return {}
+
+    def session_get(self, arguments: dict) -> dict:
+        return {
+            'version': '4.0.6 (fake)',
+            'rpc-version': 17,
+            'rpc-version-minimum': 14,
+            'rpc-version-semver': '5.3.0',
+            'download-dir': '/downloads/complete'
+        }
+
+    def handle(self, method: str, arguments: dict) -> dict:
+        """
+        dispatch an rpc method
+
+        :param method: rpc method name
+        :param arguments: rpc arguments
+        :return: rpc response arguments
+        """
+        handlers = {
+            'torrent-get': self.torrent_get,
+            'torrent-add': self.torrent_add,
+            'torrent-remove': self.torrent_remove,
+            'session-get': self.session_get
+        }
+        if method not in handlers:
+            raise ValueError(f"method name not recognized: {method}")
+
+        return handlers[method](arguments)
+
+# ------------------------------------------------------------------------------
+# http rpc surface
+# ------------------------------------------------------------------------------
+
+class FakeTransmissionServer(ThreadingHTTPServer):
+    """http server exposing a FakeTransmissionDaemon at the transmission rpc path"""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, daemon: FakeTransmissionDaemon, latency: float = 0):
+        """
+        :param address: (host, port) to bind to
+        :param daemon: simulated daemon state
+        :param latency: seconds added to every rpc response
+        """
+        super().__init__(address, _FakeTransmissionRequestHandler)
+        self.daemon = daemon
+        self.latency = latency
+
+
+class _FakeTransmissionRequestHandler(BaseHTTPRequestHandler):
+    """handler implementing the session-id handshake and json rpc calls"""
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header(SESSION_ID_HEADER, self.server.daemon.session_id)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+        if self.path.rstrip('/') != RPC_PATH:
+            self.send_error(404)
+            return
+
+        if self.headers.get(SESSION_ID_HEADER) != self.server.daemon.session_id:
+            self._send_json(409, {'result': 'missing or invalid session id'})
+            return
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        request = {}
+        try:
+            request = json.loads(body)
+            arguments = self.server.daemon.handle(request['method'], request.get('arguments') or {})
+            response = {'result': 'success', 'arguments': arguments}
+        except Exception as e:
+            response = {'result': f"{e}", 'arguments': {}}
+
+        if 'tag' in request:
+            response['tag'] = request['tag']
+
+        self._send_json(200, response)
+
+    def log_message(self, format, *args):
+        logging.debug(f"fake transmission request - {format % args}")
+
+
+def start_fake_transmission(
+    host: str = '127.0.0.1',
+    port: int = 0,
+    latency: float = 0,
+    **daemon_kwargs
+) -> FakeTransmissionServer:
+    """
+    start a fake transmission daemon on a background thread; port 0 binds
+        a free port, available as server.server_port
+
+    :param host: interface to bind to
+    :param port: port to bind to
+    :param latency: seconds added to every rpc response
+    :param daemon_kwargs: passed to FakeTransmissionDaemon
+    :return: running server; call shutdown() and server_close() to stop
+    """
+    server = FakeTransmissionServer((host, port), FakeTransmissionDaemon(**daemon_kwargs), latency=latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+# ------------------------------------------------------------------------------
+# main guard
+# ------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="serve a fake transmission rpc daemon for load testing")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9091)
+    parser.add_argument('--torrents', type=int, default=0, help="number of torrents to pre-populate")
+    parser.add_argument('--progress-curve', choices=PROGRESS_CURVES, default='linear')
+    parser.add_argument('--download-seconds', type=float, default=600, help="seconds for a torrent to finish")
+    parser.add_argument('--spread-seconds', type=float, default=None, help="spread of pre-populated added times; defaults to 2x download-seconds")
+    parser.add_argument('--latency', type=float, default=0, help="seconds added to every rpc response")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    setup_logging()
+
+    daemon = FakeTransmissionDaemon(
+        progress_curve=args.progress_curve,
+        download_seconds=args.download_seconds,
+        seed=args.seed
+    )
+    spread_seconds = args.spread_seconds if args.spread_seconds is not None else 2 * args.download_seconds
+    daemon.populate(args.torrents, spread_seconds=spread_seconds)
+
+    server = FakeTransmissionServer((args.host, args.port), daemon, latency=args.latency)
+    logging.info(f"serving fake transmission with {args.torrents} torrents on {args.host}:{args.port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
+
+
+# ------------------------------------------------------------------------------
+# end of fake_transmission.py
+# ------------------------------------------------------------------------------
@@ -0,0 +1,315 @@
+# standard library imports
+import argparse
+import json
+from pathlib import Path
+import time
+
+# third-party imports
+import polars as pl
+
+# local/custom imports
+from src.core._03_parse import load_special_conditions, parse_media_items, parse_titles
+import src.utils.parse_element as parse_element
+
+# ------------------------------------------------------------------------------
+# benchmark parameters
+# ------------------------------------------------------------------------------
+
+# placeholder corpus rebuilt from the parser test fixtures; it only smoke-tests
+#   the benchmark, pass a real labeled sample with --corpus for real numbers
+DEFAULT_CORPUS_PATH = Path(__file__).parent.parent / 'fixtures' / 'utils' / 'release_title_corpus.jsonl'
+
+# special conditions applied by the parse stage before its title expressions
+SPECIAL_CONDITIONS_PATH = Path(__file__).parent.parent.parent / 'config' / 'string-special-conditions.yaml'
+
+# fields a corpus entry may label, as produced by the parse stage; entries
+#   only need the fields they label, and unlabeled fields are not scored
+LABELED_FIELDS = (
+    'media_type',
+    'media_title',
+    'release_year',
+    'season',
+    'episode',
+    'resolution',
+    'video_codec',
+    'audio_codec',
+    'upload_type',
+    'uploader'
+)
+
+# per-title parser functions, timed over every corpus title
+BENCHMARKED_FUNCTIONS = (
+    'classify_media_type',
+    'extract_year',
+    'extract_season_from_episode',
+    'extract_episode_from_episode',
+    'extract_season_from_episode_pack',
+    'extract_season_from_season',
+    'extract_resolution',
+    'extract_video_codec',
+    'extract_audio_codec',
+    'extract_upload_type',
+    'extract_uploader'
+)
+
+# junk-filled titles with no year or marker to stop at, by name; each takes the
+#   title length, and would stall a backtracking title pattern
+ADVERSARIAL_TITLES = {
+    'space run': lambda length: 'a' + ' ' * (length - 2) + 'b',
+    'delimiter run': lambda length: 'Title' + ('.-_ ' * length)[:length - 5],
+    'season prefixes': lambda length: ('s1' * length)[:length],
+    'parenthesized years': lambda length: ('(2020)' * length)[:length],
+    'bare years': lambda length: ('2020 ' * length)[:length]
+}
+
+# adversarial title lengths, each ten times the last, so linear scaling shows
+#   as each time growing about tenfold
+ADVERSARIAL_LENGTHS = (1_000, 10_000, 100_000)
+
+# media types whose title patterns are timed against the adversarial titles
+ADVERSARIAL_MEDIA_TYPES = ('movie', 'tv_show', 'tv_episode_pack', 'tv_season')
+
+# ------------------------------------------------------------------------------
+# benchmark functions
+# ------------------------------------------------------------------------------
+
+def load_corpus(path: str | Path = DEFAULT_CORPUS_PATH) -> list:
+    """
+    load a labeled corpus of release titles
+
+    :param path: path to a jsonl file with one object per title, holding
+        original_title and any of LABELED_FIELDS
+    :return: list of corpus entries
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _titles_per_second(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else float('inf')
+
+
+def time_functions(titles: list, repeat: int = 1) -> dict:
+    """
+    measure the throughput of each per-title parser function
+
+    :param titles: release titles to parse
+    :param repeat: number of passes over the titles
+    :return: dict of function name to titles parsed per second
+    """
+    media_types = [parse_element.classify_media_type(title) for title in titles]
+    rates = {}
+
+    for name in BENCHMARKED_FUNCTIONS:
+        function = getattr(parse_element, name)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for title in titles:
+                function(title)
+        rates[name] = _titles_per_second(len(titles) * repeat, time.perf_counter() - start)
+
+    # extract_title also takes the media type
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for title, media_type in zip(titles, media_types):
+            parse_element.extract_title(title, media_type)
+    rates['extract_title'] = _titles_per_second(len(titles) * repeat, time.perf_counter() - start)
+
+    return rates
+
+
+def corpus_frame(corpus: list) -> pl.DataFrame:
+    """
+    build the parse stage input for a corpus; labeled media types are used as
+        given so field accuracy is not compounded by misclassification
+
+    :param corpus: list of corpus entries
+    :return: DataFrame of hash, original_title, and media_type
+    """
+    return pl.DataFrame({
+        'hash': [str(i) for i in range(len(corpus))],
+        'original_title': [entry['original_title'] for entry in corpus],
+        'media_type': [
+            entry.get('media_type') or parse_element.classify_media_type(entry['original_title'])
+            for entry in corpus
+        ]
+    })
+
+
+def score_fields(corpus: list, parsed: pl.DataFrame) -> tuple:
+    """
+    compare parsed fields with the corpus labels
+
+    :param corpus: list of corpus entries
+    :param parsed: parse stage output, in corpus order
+    :return: tuple of dict of field to accuracy counts, and list of mismatches
+    """
+    accuracy = {field: {'correct': 0, 'labeled': 0} for field in LABELED_FIELDS}
+    mismatches = []
+
+    for entry, row in zip(corpus, parsed.iter_rows(named=True)):
+        # media type is scored on classification, not the labeled input
+        actual_values = {**row, 'media_type': parse_element.classify_media_type(entry['original_title'])}
+        for field in LABELED_FIELDS:
+            if field not in entry:
+                continue
+            accuracy[field]['labeled'] += 1
+            if actual_values.get(field) == entry[field]:
+                accuracy[field]['correct'] += 1
+            else:
+                mismatches.append({
+                    'original_title': entry['original_title'],
+                    'field': field,
+                    'expected': entry[field],
+                    'actual': actual_values.get(field)
+                })
+
+    for counts in accuracy.values():
+        counts['accuracy'] = counts['correct'] / counts['labeled'] if counts['labeled'] else None
+
+    return accuracy, mismatches
+
+
+def run_benchmark(corpus: list, repeat: int = 1) -> dict:
+    """
+    measure parser throughput and field accuracy over a labeled corpus
+
+    :param corpus: list of corpus entries
+    :param repeat: number of timed passes over the corpus
+    :return: report dict of titles, per function rates, parse stage rate,
+        field accuracy, and mismatches
+    """
+    titles = [entry['original_title'] for entry in corpus]
+    media = corpus_frame(corpus)
+
+    # the parse cache would turn every pass after the first into lookups
+    parsed = parse_media_items(media, use_cache=False)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_media_items(media, use_cache=False)
+    parse_media_items_rate = _titles_per_second(len(titles) * repeat, time.perf_counter() - start)
+
+    accuracy, mismatches = score_fields(corpus, parsed)
+
+    return {
+        'titles': len(titles),
+        'repeat': repeat,
+        'functions': time_functions(titles, repeat),
+        'parse_media_items': parse_media_items_rate,
+        'accuracy': accuracy,
+        'mismatches': mismatches
+    }
+
+
+def run_adversarial_benchmark(lengths: tuple = ADVERSARIAL_LENGTHS) -> dict:
+    """
+    measure title parsing time on adversarial titles of increasing length,
+        both for extract_title and for the parse stage's title expressions
+
+    :param lengths: title lengths to time
+    :return: dict of extract_title and parse_titles, each a dict of
+        adversarial title name to dict of length to seconds taken for every
+        media type
+    """
+    special_conditions = load_special_conditions(SPECIAL_CONDITIONS_PATH)
+    report = {'extract_title': {}, 'parse_titles': {}}
+    for name, build_title in ADVERSARIAL_TITLES.items():
+        report['extract_title'][name] = {}
+        report['parse_titles'][name] = {}
+        for length in lengths:
+            title = build_title(length)
+            start = time.perf_counter()
+            for media_type in ADVERSARIAL_MEDIA_TYPES:
+                parse_element.extract_title(title, media_type)
+            report['extract_title'][name][length] = time.perf_counter() - start
+
+            titles = pl.DataFrame({
+                'original_title': [title] * len(ADVERSARIAL_MEDIA_TYPES),
+                'media_type': list(ADVERSARIAL_MEDIA_TYPES)
+            })
+            start = time.perf_counter()
+            parse_titles(titles, special_conditions)
+            report['parse_titles'][name][length] = time.perf_counter() - start
+
+    return report
+
+
+def format_adversarial_report(report: dict) -> str:
+    """
+    format an adversarial benchmark report as plain text
+
+    :param report: report dict from run_adversarial_benchmark
+    :return: report text
+    """
+    lines = []
+    for function, timings in report.items():
+        lengths = list(next(iter(timings.values()), {}))
+        if lines:
+            lines.append("")
+        lines.extend([
+            f"{function} seconds by title length",
+            f"  {'title':<34}" + "".join(f"{length:>12,}" for length in lengths)
+        ])
+        for name, seconds in timings.items():
+            lines.append(f"  {name:<34}" + "".join(f"{seconds[length]:>12.4f}" for length in lengths))
+
+    return "\n".join(lines)
+
+
+def format_report(report: dict) -> str:
+    """
+    format a benchmark report as plain text
+
+    :param report: report dict from run_benchmark
+    :return: report text
+    """
+    lines = [f"{report['titles']} titles x {report['repeat']} passes", "", "throughput (titles/sec)"]
+    for name, rate in report['functions'].items():
+        lines.append(f"  {name:<34}{rate:>14,.0f}")
+    lines.append(f"  {'parse_media_items':<34}{report['parse_media_items']:>14,.0f}")
+
+    lines.extend(["", "field accuracy"])
+    for field, counts in report['accuracy'].items():
+        if counts['labeled']:
+            lines.append(
+                f"  {field:<34}{counts['correct']:>6}/{counts['labeled']:<6}{counts['accuracy']:>8.1%}"
+            )
+
+    if report['mismatches']:
+        lines.extend(["", "mismatches"])
+        for mismatch in report['mismatches']:
+            lines.append(
+                f"  {mismatch['field']}: expected {mismatch['expected']!r}, "
+                f"got {mismatch['actual']!r} - {mismatch['original_title']}"
+            )
+
+    return "\n".join(lines)
+
+
+# ------------------------------------------------------------------------------
+# main guard
+# ------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark release title parsing throughput and accuracy")
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS_PATH, help="labeled jsonl corpus of release titles")
+    parser.add_argument('--repeat', type=int, default=100, help="number of timed passes over the corpus")
+    parser.add_argument('--json', action='store_true', help="print the report as json")
+    parser.add_argument('--adversarial', action='store_true', help="time title parsing on long junk-filled titles instead")
+    args = parser.parse_args()
+
+    if args.adversarial:
+        report = run_adversarial_benchmark()
+        print(json.dumps(report, indent=2) if args.json else format_adversarial_report(report))
+        return
+
+    report = run_benchmark(load_corpus(args.corpus), repeat=args.repeat)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+if __name__ == "__main__":
+    main()
+
+
+# ------------------------------------------------------------------------------
+# end of parse_benchmark.py
+# ------------------------------------------------------------------------------
@@ -1,6 +1,10 @@
 import pytest
 from unittest.mock import patch, MagicMock, call
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
 import polars as pl
 from src.core._01_rss_ingest import *
 from src.data_models import *
@@ -24,8 +28,11 @@ class TestRssIngest:
             # Call function
             result = rss_feed_ingest(case["rss_url"], case["rss_source"])
             
-            # Verify feedparser was called with correct URL
-            mock_parse.assert_called_once_with(case["rss_url"])
+            # Verify feedparser was called with correct URL, and the default timeout
+            mock_parse.assert_called_once()
+            assert mock_parse.call_args.args == (case["rss_url"],)
+            timeout_handler, = mock_parse.call_args.kwargs["handlers"]
+            assert timeout_handler.timeout == 30
             
             # Verify results
             assert len(result) == len(case["expected_entries"]), (
@@ -45,6 +52,134 @@ class TestRssIngest:
                     )
 
 
+    @patch('src.core._01_rss_ingest.rss_feed_ingest')
+    def test_fetch_rss_feeds(self, mock_feed_ingest):
+        """Test feeds are fetched concurrently and their entries kept in feed order."""
+        delays = {"slow_url": 0.5, "fast_url": 0.0, "failed_url": 0.2}
+
+        def feed_ingest_side_effect(rss_url, rss_source, timeout, validators):
+            time.sleep(delays[rss_url])
+            if rss_url == "failed_url":
+                return []
+            return [{'title': f"{rss_source} {i}", 'rss_source': rss_source} for i in range(2)]
+
+        mock_feed_ingest.side_effect = feed_ingest_side_effect
+
+        start = time.perf_counter()
+        result = fetch_rss_feeds(
+            ["slow_url", "failed_url", "fast_url"],
+            ["yts.mx", "yts.lt", "episodefeed.com"],
+            timeout=5
+        )
+        elapsed = time.perf_counter() - start
+
+        assert [entry['title'] for entry in result] == [
+            "yts.mx 0", "yts.mx 1", "episodefeed.com 0", "episodefeed.com 1"
+        ]
+        assert elapsed < sum(delays.values())
+        assert {call.args[2] for call in mock_feed_ingest.call_args_list} == {5}
+        assert {call.args[3] for call in mock_feed_ingest.call_args_list} == {None}
+        assert fetch_rss_feeds([], []) == []
+
+        # each feed gets its own validators
+        validators = {"slow_url": {'etag': '"a"'}}
+        fetch_rss_feeds(["slow_url", "fast_url"], ["yts.mx", "episodefeed.com"], validators=validators)
+        feed_validators = {call.args[0]: call.args[3] for call in mock_feed_ingest.call_args_list[-2:]}
+        assert feed_validators == {"slow_url": {'etag': '"a"'}, "fast_url": {}}
+        assert feed_validators["fast_url"] is validators["fast_url"]
+
+    def test_rss_feed_ingest_conditional_get(self):
+        """Test feed validators are sent, and an unchanged feed returns no entries."""
+        rss = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel><title>feed</title>'
+            b'<item><title>Movie (2020)</title><link>http://example.com/1</link></item>'
+            b'</channel></rss>'
+        )
+        requests_seen = []
+
+        class FeedHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_seen.append(dict(self.headers))
+                if self.headers.get('If-None-Match') == '"v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/rss+xml')
+                self.send_header('ETag', '"v1"')
+                self.send_header('Last-Modified', 'Mon, 05 Oct 2026 10:00:00 GMT')
+                self.end_headers()
+                self.wfile.write(rss)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), FeedHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        rss_url = f"http://127.0.0.1:{server.server_port}/rss"
+
+        try:
+            validators = {}
+            first = rss_feed_ingest(rss_url, "yts.mx", timeout=5, validators=validators)
+            assert [entry['title'] for entry in first] == ["Movie (2020)"]
+            assert validators == {'etag': '"v1"', 'modified': 'Mon, 05 Oct 2026 10:00:00 GMT'}
+
+            second = rss_feed_ingest(rss_url, "yts.mx", timeout=5, validators=validators)
+            assert second == []
+            assert requests_seen[1]['If-None-Match'] == '"v1"'
+            assert validators['etag'] == '"v1"'
+
+            # without validators the feed is fetched in full
+            assert len(rss_feed_ingest(rss_url, "yts.mx", timeout=5)) == 1
+            assert 'If-None-Match' not in requests_seen[2]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+    @patch.dict(os.environ, {'AT_RSS_SOURCES': "yts.mx,episodefeed.com", 'AT_RSS_URLS': "url_1,url_2"})
+    @patch('src.core._01_rss_ingest.utils.insert_items_to_db')
+    @patch('src.core._01_rss_ingest.utils.compare_hashes_to_db')
+    @patch('src.core._01_rss_ingest.fetch_rss_feeds')
+    def test_rss_ingest_validators(self, mock_fetch, mock_compare_hashes, mock_insert_db, tmp_path):
+        """Test unchanged feeds skip the db, and validators are stored after the insert."""
+        validator_path = tmp_path / 'rss-validators.json'
+        validator_path.write_text(json.dumps({
+            "url_1": {'etag': '"v1"', 'modified': None},
+            "removed_url": {'etag': '"v0"', 'modified': None}
+        }))
+
+        def fetch_side_effect(rss_urls, rss_sources, validators):
+            validators["url_2"].update({'etag': '"v2"', 'modified': None})
+            return entries
+
+        mock_fetch.side_effect = fetch_side_effect
+
+        with patch('src.utils.rss_validators.rss_validator_path', str(validator_path)):
+            # every feed unchanged, so nothing is compared or inserted
+            entries = []
+            rss_ingest()
+            mock_compare_hashes.assert_not_called()
+            assert mock_fetch.call_args.kwargs['validators']["url_1"] == {'etag': '"v1"', 'modified': None}
+            assert json.loads(validator_path.read_text()) == {
+                "url_1": {'etag': '"v1"', 'modified': None},
+                "url_2": {'etag': '"v2"', 'modified': None}
+            }
+
+            # a failed insert keeps the previous validators
+            validator_path.write_text(json.dumps({"url_1": {'etag': '"v1"', 'modified': None}}))
+            entries = [{
+                'title': "Movie (2020)",
+                'links': [{}, {'href': "http://yts.mx/torrent/download/" + "a" * 40}],
+                'rss_source': "yts.mx"
+            }]
+            mock_compare_hashes.side_effect = lambda hashes: hashes
+            mock_insert_db.side_effect = RuntimeError("db unavailable")
+            with pytest.raises(RuntimeError):
+                rss_ingest()
+            assert json.loads(validator_path.read_text()) == {"url_1": {'etag': '"v1"', 'modified': None}}
+
+
     @patch('src.core._01_rss_ingest.utils.extract_hash_from_direct_download_url')
     @patch('src.core._01_rss_ingest.utils.extract_hash_from_magnet_link')
     @patch('src.core._01_rss_ingest.utils.classify_media_type')
@@ -116,7 +251,7 @@ class TestRssIngest:
             os.environ.update(case["env_vars"])
             
             # Setup mock feed data
-            def parse_side_effect(url):
+            def parse_side_effect(url, **kwargs):
                 mock_feed = MagicMock()
                 # Find the index of this URL in the AT_RSS_URLS
                 urls = case["env_vars"]["AT_RSS_URLS"].split(',')
@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 import polars as pl
 from src.core._02_collect import *
 from src.data_models import *
+from src.utils.rpcf import media_items_to_frame
 from tests.fixtures.core._02_collect_fixtures import *
 
 class TestCollect:
@@ -11,7 +12,7 @@ class TestCollect:
     def test_process_new_items(self, process_new_items_cases):
         """Test all process_new_items scenarios from fixture."""
         for case in process_new_items_cases:
-            result = process_new_items(case["input"])
+            result = process_new_items(media_items_to_frame(case["input"]))
             expected_list = case["expected_fields"]
 
             assert isinstance(result, pl.DataFrame)
@@ -74,7 +75,7 @@ class TestCollect:
     @patch('src.core._02_collect.utils.get_media_by_hash')
     @patch('src.core._02_collect.utils.return_rejected_hashes')
     @patch('src.core._02_collect.utils.compare_hashes_to_db')
-    @patch('src.core._02_collect.utils.return_current_media_items')
+    @patch('src.core._02_collect.utils.return_current_media_frame')
     def test_collect_media_workflow_integration(self, mock_return_current,
                                                mock_compare_hashes,
                                                mock_return_rejected,
@@ -93,7 +94,7 @@ class TestCollect:
             mock_update_db.reset_mock()
 
             # Setup input mocks
-            mock_return_current.return_value = case["current_transmission_items"]
+            mock_return_current.return_value = media_items_to_frame(case["current_transmission_items"])
 
             if "new_hashes" in case:
                 mock_compare_hashes.return_value = case["new_hashes"]
@@ -34,6 +34,74 @@ class TestParseMediaItems:
                     )
 
 
+    def test_parse_media_items_cache(self, parse_media_items_cases, tmp_path):
+        """Test repeated titles are parsed once and then served from the parse cache."""
+        input_media = pl.concat([pl.DataFrame(case["input_data"]) for case in parse_media_items_cases])
+
+        with patch('src.utils.parse_cache.parse_cache_path', str(tmp_path / 'parse-cache.sqlite')), \
+                patch('src.core._03_parse.parse_titles', wraps=parse_titles) as parse_titles_mock:
+            first = parse_media_items(input_media)
+            second = parse_media_items(input_media)
+            uncached = parse_media_items(input_media, use_cache=False)
+
+        title_count = input_media.select('original_title', 'media_type').unique().height
+        parsed_counts = [call.args[0].height for call in parse_titles_mock.call_args_list]
+        assert parsed_counts == [title_count, 0, title_count]
+        assert second.equals(first)
+        assert uncached.equals(first)
+
+
+    def test_parse_titles_in_chunks(self, parse_media_items_cases):
+        """Test chunked parsing matches a single pass, in the same order."""
+        special_conditions = {'pre_processing_replacements': [["www.UIndex.org    -    ", ""]]}
+        titles = pl.concat([
+            pl.DataFrame(case["input_data"]).select('original_title', 'media_type')
+            for case in parse_media_items_cases
+        ])
+        expected = parse_titles(titles, special_conditions)
+
+        chunked = parse_titles_in_chunks(titles, special_conditions, workers=3, threshold=0)
+        assert chunked.equals(expected)
+
+        with patch('src.core._03_parse.pl.collect_all') as collect_all, \
+                patch.dict(os.environ, {'AT_PARSE_WORKERS': "4"}):
+            assert parse_titles_in_chunks(titles, special_conditions).equals(expected)
+        collect_all.assert_not_called()
+
+
+    def test_parse_titles_pre_processing(self):
+        """Test pre-processing replacements are literal and replace every occurrence."""
+        special_conditions = {'pre_processing_replacements': [["a.b - ", ""], ["[x]", "y"]]}
+        titles = pl.DataFrame({
+            'original_title': ["a.b - Movie a.b - (2020)", "axb Movie (2020)", "[x] Movie [x] (2020)"],
+            'media_type': ["movie", "movie", "movie"]
+        })
+
+        result = parse_titles(titles, special_conditions)
+        assert result['media_title'].to_list() == ["Movie", "axb Movie", "y Movie y"]
+
+        no_replacements = parse_titles(titles, {'pre_processing_replacements': []})
+        assert no_replacements['media_title'].to_list() == [
+            utils.extract_title(title, "movie") for title in titles['original_title']
+        ]
+
+
+    def test_load_special_conditions(self, tmp_path):
+        """Test the config is read once, and again only after it changes."""
+        config_path = tmp_path / 'string-special-conditions.yaml'
+        config_path.write_text('pre_processing_replacements:\n  - ["a", ""]\n')
+
+        with patch('src.core._03_parse.yaml.safe_load', wraps=yaml.safe_load) as safe_load:
+            first = load_special_conditions(config_path)
+            assert load_special_conditions(config_path) is first
+            assert safe_load.call_count == 1
+
+            config_path.write_text('pre_processing_replacements:\n  - ["b", ""]\n')
+            os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1_000_000_000))
+            assert load_special_conditions(config_path) == {'pre_processing_replacements': [["b", ""]]}
+            assert safe_load.call_count == 2
+
+
     def test_validate_parsed_media(self, validate_parsed_media_cases):
         """Test all validate_parsed_media scenarios from fixture."""
         for case in validate_parsed_media_cases:
@@ -58,6 +126,36 @@ class TestParseMediaItems:
                 )
 
 
+    def test_missing_fields_expr(self):
+        """Test custom mandatory field rules are checked in one expression."""
+        media = pl.DataFrame({
+            'media_type': ["movie", "tv_show", "tv_show", "unknown", "tv_season"],
+            'media_title': [None, "Show", None, None, "Season"],
+            'season': [None, None, 1, None, 1],
+            'error_condition': ["prior", None, None, None, None]
+        }, schema_overrides={'error_condition': pl.Utf8, 'season': pl.Int64})
+
+        # fields without a column are null
+        result = media.with_columns(missing_fields_expr(
+            fields_by_type={MediaType.TV_SHOW: ['season'], 'tv_season': ['episode']},
+            columns=media.columns
+        ))
+
+        assert result['error_condition'].to_list() == [
+            "prior; media_title is null",
+            "season is null",
+            "media_title is null",
+            "media_title is null",
+            "episode is null"
+        ]
+
+        lazy_result = media.lazy().with_columns(missing_fields_expr(
+            fields_by_type={MediaType.TV_SHOW: ['season'], 'tv_season': ['episode']},
+            columns=media.columns
+        ))
+        assert lazy_result.collect().equals(result)
+
+
     def test_update_status(self, update_status_cases):
         """Test all update_status scenarios from fixture."""
         for case in update_status_cases:
@@ -82,10 +180,25 @@ class TestParseMediaItems:
                 )
 
 
+    def test_lazy_transforms(self, validate_parsed_media_cases):
+        """Test validation and status updates give the same result on a LazyFrame."""
+        for case in validate_parsed_media_cases:
+            input_media = pl.DataFrame(case["input_data"])
+            if 'pipeline_status' not in input_media.columns:
+                input_media = input_media.with_columns(pipeline_status=pl.lit(PipelineStatus.INGESTED.value))
+
+            expected = update_status(validate_parsed_media(input_media))
+            result = update_status(validate_parsed_media(input_media.lazy()))
+
+            assert isinstance(result, pl.LazyFrame)
+            assert result.collect().equals(expected), f"Failed for {case['description']}"
+
+
+    @patch('src.core._03_parse.utils.has_pending_media', return_value=True)
     @patch('src.core._03_parse.utils.media_db_update')
     @patch('src.core._03_parse.utils.get_media_from_db')
     def test_parse_media_workflow_integration(self, mock_get_media, mock_db_update,
-                                            parse_media_workflow_cases):
+                                            mock_has_pending, parse_media_workflow_cases):
         """Test parse_media workflow integration scenarios from fixture."""
         for case in parse_media_workflow_cases:
             # Reset mocks for each test case
@@ -132,4 +245,15 @@ class TestParseMediaItems:
                         assert actual_value == expected_value, (
                             f"Failed for {case['description']} item {i}: "
                             f"expected {field}={expected_value}, got {actual_value}"
-                        )
\ No newline at end of file
+                        )
+
+    @patch('src.core._03_parse.utils.media_db_update')
+    @patch('src.core._03_parse.utils.get_media_from_db')
+    @patch('src.core._03_parse.utils.has_pending_media', return_value=False)
+    def test_parse_media_no_pending_media(self, mock_has_pending, mock_get_media, mock_db_update):
+        """Test parse_media exits before loading media when the status probe finds nothing."""
+        parse_media()
+
+        mock_has_pending.assert_called_once_with([PipelineStatus.INGESTED])
+        mock_get_media.assert_not_called()
+        mock_db_update.assert_not_called()
@@ -50,9 +50,11 @@ class TestFileFilteration:
                     f"expected pipeline_status={expected['pipeline_status']}, got {row['pipeline_status']}"
                 )
 
+    @patch('src.core._04_file_filtration.utils.has_pending_media', return_value=True)
     @patch('src.core._04_file_filtration.utils.media_db_update')
     @patch('src.core._04_file_filtration.utils.get_media_from_db')
-    def test_filter_files_workflow_integration(self, mock_get_media, mock_db_update, filter_files_workflow_cases):
+    def test_filter_files_workflow_integration(self, mock_get_media, mock_db_update, mock_has_pending,
+                                               filter_files_workflow_cases):
         """Test filter_files workflow integration scenarios from fixture."""
         for case in filter_files_workflow_cases:
             # Reset mocks for each test case
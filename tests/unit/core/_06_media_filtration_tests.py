@@ -55,6 +55,22 @@ class TestMediaFiltration:
                     f"expected rejection_reason={expected['rejection_reason']}, got {row['rejection_reason']}"
                 )
 
+    def test_lazy_transforms(self, reject_media_without_imdb_id_cases):
+        """Test the stage transforms give the same result on a LazyFrame."""
+        for case in reject_media_without_imdb_id_cases:
+            input_media = pl.DataFrame(case["input_data"])
+            if input_media.height == 0:
+                continue
+            if 'rejection_reason' not in input_media.columns:
+                input_media = input_media.with_columns(rejection_reason=pl.lit(None, dtype=pl.Utf8))
+
+            for transform in (process_exempt_items, reject_media_without_imdb_id):
+                expected = update_status(transform(input_media))
+                result = update_status(transform(input_media.lazy()))
+
+                assert isinstance(result, pl.LazyFrame)
+                assert result.collect().equals(expected), f"Failed for {case['description']}"
+
     def test_process_prelabeled_items(self, process_prelabeled_items_cases):
         """Test all process_prefiltered_items scenarios from fixture."""
         for case in process_prelabeled_items_cases:
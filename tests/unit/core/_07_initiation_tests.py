@@ -1,5 +1,6 @@
 import pytest
 import polars as pl
+from unittest.mock import patch
 from src.core._07_initiation import *
 from src.data_models import *
 from tests.fixtures.core._07_initiation_fixtures import *
@@ -29,3 +30,28 @@ class TestInitiation:
                     f"Failed for {case['description']}: "
                     f"expected pipeline_status={expected['pipeline_status']}, got {row['pipeline_status']}"
                 )
+
+    @patch('src.core._07_initiation.utils.add_media_items')
+    def test_initiate_media_items(self, mock_add_items, initiate_media_items_cases):
+        """Test all initiate_media_items scenarios from fixture."""
+        for case in initiate_media_items_cases:
+            mock_add_items.return_value = case["initiation_results"]
+            input_media = pl.DataFrame(case["input_data"], schema_overrides={"error_condition": pl.Utf8})
+            result = initiate_media_items(input_media)
+            expected_list = case["expected_fields"]
+
+            mock_add_items.assert_called_with(input_media["hash"].to_list())
+            assert result.height == len(expected_list), f"Row count mismatch for {case['description']}"
+
+            for i in range(result.height):
+                row = result.row(i, named=True)
+                expected = expected_list[i]
+
+                assert row["hash"] == expected["hash"], (
+                    f"Failed for {case['description']}: "
+                    f"expected hash {expected['hash']}, got {row['hash']}"
+                )
+                assert row["error_condition"] == expected["error_condition"], (
+                    f"Failed for {case['description']}: "
+                    f"expected error_condition={expected['error_condition']}, got {row['error_condition']}"
+                )
@@ -3,6 +3,9 @@ import polars as pl
 from unittest.mock import patch
 from src.core._08_download_check import *
 from src.data_models import *
+from src.utils import rpcf
+from src.utils.rpcf import media_items_to_frame
+from tests.tools.fake_transmission import start_fake_transmission
 from tests.fixtures.core._08_download_check_fixtures import *
 
 class TestDownloadCheck:
@@ -12,7 +15,7 @@ class TestDownloadCheck:
         """Test all confirm_downloading_status scenarios from fixture."""
         for case in confirm_downloading_status_cases:
             input_media = pl.DataFrame(case["input_media_data"])
-            current_media_items = case["current_media_items"]
+            current_media_items = media_items_to_frame(case["current_media_items"])
             result = confirm_downloading_status(input_media, current_media_items)
             expected_list = case["expected_fields"]
 
@@ -37,7 +40,7 @@ class TestDownloadCheck:
         """Test all extract_and_verify_filename scenarios from fixture."""
         for case in extract_and_verify_filename_cases:
             input_media = pl.DataFrame(case["input_media_data"])
-            downloaded_media_items = case["downloaded_media_items"]
+            downloaded_media_items = media_items_to_frame(case["downloaded_media_items"])
             result = extract_and_verify_filename(input_media, downloaded_media_items)
             expected_list = case["expected_fields"]
 
@@ -62,6 +65,19 @@ class TestDownloadCheck:
                 )
 
 
+    def test_lazy_transforms(self, extract_and_verify_filename_cases):
+        """Test filename extraction and status updates give the same result on a LazyFrame."""
+        for case in extract_and_verify_filename_cases:
+            input_media = pl.DataFrame(case["input_media_data"])
+            downloaded_media_items = media_items_to_frame(case["downloaded_media_items"])
+
+            expected = update_status(extract_and_verify_filename(input_media, downloaded_media_items))
+            result = update_status(extract_and_verify_filename(input_media.lazy(), downloaded_media_items))
+
+            assert isinstance(result, pl.LazyFrame)
+            assert result.collect().equals(expected), f"Failed for {case['description']}"
+
+
     def test_update_status(self, update_status_cases):
         """Test all update_status scenarios from fixture."""
         for case in update_status_cases:
@@ -103,14 +119,16 @@ class TestDownloadCheck:
                     )
 
 
+    @patch('src.core._08_download_check.utils.has_pending_media', return_value=True)
     @patch('src.core._08_download_check.utils.media_db_update')
-    @patch('src.core._08_download_check.utils.return_current_media_items')
+    @patch('src.core._08_download_check.utils.return_current_media_state')
     @patch('src.core._08_download_check.utils.get_media_by_hash')
     @patch('src.core._08_download_check.utils.get_media_from_db')
     def test_check_downloads_workflow_integration(self, mock_get_media,
                                                   mock_get_media_by_hash,
                                                   mock_return_current,
                                                   mock_db_update,
+                                                  mock_has_pending,
                                                   check_downloads_workflow_scenarios):
         """Test check_downloads workflow integration scenarios from fixture."""
         for case in check_downloads_workflow_scenarios:
@@ -158,7 +176,7 @@ class TestDownloadCheck:
             else:
                 mock_get_media_by_hash.return_value = None
 
-            mock_return_current.return_value = case["input_transmission_items"]
+            mock_return_current.return_value = (media_items_to_frame(case["input_transmission_items"]), [])
 
             # Execute the function
             check_downloads()
@@ -194,3 +212,43 @@ class TestDownloadCheck:
                             f"Failed for {case['description']}: "
                             f"expected {field}={expected_value}, got {actual_value}"
                         )
+
+    @patch('src.core._08_download_check.utils.has_pending_media', return_value=True)
+    @patch('src.core._08_download_check.utils.media_db_update')
+    @patch('src.core._08_download_check.utils.get_media_from_db')
+    def test_check_downloads_unreachable_daemon(self, mock_get_media, mock_db_update, mock_has_pending):
+        """Test items are not re-ingested while a daemon in the pool does not answer."""
+        up = start_fake_transmission(download_seconds=3600, seed=1)
+        down = start_fake_transmission(download_seconds=3600, seed=2)
+        up.daemon.populate(2)
+        down.daemon.populate(3)
+        endpoints = [('127.0.0.1', up.server_port), ('127.0.0.1', down.server_port)]
+        hashes = [
+            torrent['hash'] for server in (up, down) for torrent in server.daemon.torrents.values()
+        ]
+        mock_get_media.side_effect = lambda pipeline_status: pl.DataFrame({
+            'hash': hashes,
+            'media_type': ["movie"] * len(hashes),
+            'media_title': ["Movie"] * len(hashes),
+            'original_title': ["Movie"] * len(hashes),
+            'pipeline_status': ["downloading"] * len(hashes),
+            'rejection_status': ["accepted"] * len(hashes),
+            'error_status': [False] * len(hashes)
+        }) if pipeline_status == 'downloading' else None
+
+        down.shutdown()
+        down.server_close()
+        rpcf._transmission_clients.clear()
+        rpcf._media_item_snapshots.clear()
+
+        try:
+            with patch('src.utils.rpcf.transmission_endpoints', endpoints), \
+                    patch('src.utils.rpcf.snapshot_cache_path', None):
+                check_downloads()
+
+            mock_db_update.assert_not_called()
+        finally:
+            up.shutdown()
+            up.server_close()
+            rpcf._transmission_clients.clear()
+            rpcf._media_item_snapshots.clear()
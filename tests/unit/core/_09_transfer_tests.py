@@ -1,5 +1,6 @@
 import pytest
 import polars as pl
+from unittest.mock import patch, MagicMock
 from src.core._09_transfer import *
 from src.data_models import *
 from tests.fixtures.core._09_transfer_fixtures import *
@@ -78,3 +79,34 @@ class TestTransfer:
                     f"Failed for {case['description']}: "
                     f"expected pipeline_status={expected['pipeline_status']}, got {row['pipeline_status']}"
                 )
+
+    @patch('src.core._09_transfer.utils.MediaWriteBuffer')
+    @patch('src.core._09_transfer.transfer_item', side_effect=lambda media_item, download_dir: media_item)
+    @patch('src.core._09_transfer.utils.get_download_dirs')
+    @patch('src.core._09_transfer.utils.get_media_from_db')
+    @patch('src.core._09_transfer.utils.has_pending_media', return_value=True)
+    def test_transfer_media_unknown_download_dir(self, mock_has_pending, mock_get_media, mock_download_dirs,
+                                                 mock_transfer_item, mock_write_buffer, monkeypatch):
+        """Test items that may be on an unreachable daemon are left for the next run."""
+        monkeypatch.setenv('AT_MOVIE_DIR', '/k/media/video/movies/')
+        mock_get_media.return_value = pl.DataFrame({
+            'hash': ["a" * 40, "b" * 40],
+            'media_type': ["movie", "movie"],
+            'media_title': ["Movie A", "Movie B"],
+            'release_year': [2020, 2021],
+            'resolution': ["1080p", "1080p"],
+            'video_codec': ["x264", "x264"],
+            'original_path': ["Movie.A.2020", "Movie.B.2021"],
+            'pipeline_status': ["downloaded", "downloaded"],
+            'rejection_status': ["accepted", "accepted"],
+            'error_condition': [None, None]
+        }, schema_overrides={'error_condition': pl.Utf8})
+        mock_download_dirs.return_value = ({"a" * 40: "/mnt/node-a"}, ["b" * 40])
+        mock_write_buffer.return_value.__enter__.return_value = MagicMock()
+
+        transfer_media()
+
+        mock_transfer_item.assert_called_once()
+        media_item, download_dir = mock_transfer_item.call_args.args
+        assert media_item['hash'] == "a" * 40
+        assert download_dir == "/mnt/node-a"
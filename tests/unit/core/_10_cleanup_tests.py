@@ -50,11 +50,29 @@ class TestCleanup:
                 f"got '{str(exc_info.value)}'"
             )
 
+    def test_update_removed_items(self, update_removed_items_cases):
+        """Test all update_removed_items scenarios from fixture."""
+        for case in update_removed_items_cases:
+            input_media = pl.DataFrame(case["input_media"], schema_overrides={"error_condition": pl.Utf8})
+            result = update_removed_items(input_media, case["removal_results"], **case["removed_values"])
+            expected_list = case["expected_fields"]
+
+            assert result.height == len(expected_list), f"Row count mismatch for {case['description']}"
+
+            for i in range(result.height):
+                row = result.row(i, named=True)
+                for field, expected_value in expected_list[i].items():
+                    assert row[field] == expected_value, (
+                        f"Failed for {case['description']}: "
+                        f"expected {field}={expected_value}, got {row[field]}"
+                    )
+
+    @patch('src.core._10_cleanup.utils.has_pending_media', return_value=True)
     @patch('src.core._10_cleanup.utils.media_db_update')
-    @patch('src.core._10_cleanup.utils.remove_media_item')
+    @patch('src.core._10_cleanup.utils.remove_media_items')
     @patch('src.core._10_cleanup.utils.get_media_from_db')
     def test_cleanup_transferred_media(self, mock_get_media, mock_remove_item, mock_db_update,
-                                     cleanup_transferred_media_cases):
+                                     mock_has_pending, cleanup_transferred_media_cases):
         """Test all cleanup_transferred_media scenarios from fixture."""
         for case in cleanup_transferred_media_cases:
             # Reset mocks
@@ -75,11 +93,13 @@ class TestCleanup:
                     )
                 mock_get_media.return_value = df
 
-            # Setup removal exception if specified
+            # Setup removal results, failing every hash if an exception is specified
             if "removal_exception" in case:
-                mock_remove_item.side_effect = case["removal_exception"]
+                mock_remove_item.side_effect = lambda hashes: {
+                    hash: f"{case['removal_exception']}" for hash in hashes
+                }
             else:
-                mock_remove_item.side_effect = None
+                mock_remove_item.side_effect = lambda hashes: {hash: None for hash in hashes}
 
             # Execute the function
             cleanup_transferred_media(case["modulated_delay"])
@@ -107,7 +127,7 @@ class TestCleanup:
                 )
 
     @patch('src.core._10_cleanup.utils.media_db_update')
-    @patch('src.core._10_cleanup.utils.remove_media_item')
+    @patch('src.core._10_cleanup.utils.remove_media_items')
     @patch('src.core._10_cleanup.utils.get_media_by_hash')
     @patch('src.core._10_cleanup.utils.return_current_media_items')
     def test_cleanup_hung_items(self, mock_current_items, mock_get_media_by_hash,
@@ -135,11 +155,13 @@ class TestCleanup:
                     )
                 mock_get_media_by_hash.return_value = df
 
-            # Setup removal exception if specified
+            # Setup removal results, failing every hash if an exception is specified
             if "removal_exception" in case:
-                mock_remove_item.side_effect = case["removal_exception"]
+                mock_remove_item.side_effect = lambda hashes: {
+                    hash: f"{case['removal_exception']}" for hash in hashes
+                }
             else:
-                mock_remove_item.side_effect = None
+                mock_remove_item.side_effect = lambda hashes: {hash: None for hash in hashes}
 
             # Execute the function
             cleanup_hung_items(case["modulated_delay"])
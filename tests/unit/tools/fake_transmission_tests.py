@@ -0,0 +1,68 @@
+import pytest
+import time
+from unittest.mock import patch
+from transmission_rpc import Client
+from src.utils import rpcf
+from tests.tools.fake_transmission import *
+
+@pytest.fixture
+def fake_transmission():
+    server = start_fake_transmission(download_seconds=10, seed=0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestFakeTransmission:
+    """Test cases for the fake transmission daemon."""
+
+    def test_rpc_round_trip(self, fake_transmission):
+        """Test the real rpc client can add, list and remove torrents."""
+        client = Client(host='127.0.0.1', port=fake_transmission.server_port)
+
+        added = client.add_torrent(f"magnet:?xt=urn:btih:{'a' * 40}&dn=Some.Movie")
+        duplicate = client.add_torrent(f"magnet:?xt=urn:btih:{'a' * 40}")
+        torrents = client.get_torrents(arguments=['id', 'hashString', 'name', 'percentDone'])
+
+        assert added.id == duplicate.id
+        assert [t.hash_string for t in torrents] == ['a' * 40]
+        assert torrents[0].name == 'Some.Movie'
+        assert 'totalSize' not in torrents[0].fields
+
+        client.remove_torrent(['a' * 40], delete_data=True)
+        active, removed = client.get_recently_active_torrents(arguments=['id'])
+
+        assert client.get_torrents() == []
+        assert active == []
+        assert removed == [added.id]
+
+    def test_progress_curves(self):
+        """Test simulated progress follows the configured curve."""
+        now = time.time()
+        expected = {'linear': 0.5, 'front_loaded': 0.75, 'stalled': 0.5, 'instant': 1.0}
+
+        for curve, percent_done in expected.items():
+            daemon = FakeTransmissionDaemon(progress_curve=curve, download_seconds=100)
+            daemon.add('b' * 40, added_at=now - 50)
+            torrent = daemon.torrent_get({'fields': ['percentDone']})['torrents'][0]
+            assert torrent['percentDone'] == pytest.approx(percent_done, abs=0.01), curve
+
+        with pytest.raises(ValueError):
+            FakeTransmissionDaemon(progress_curve='unknown')
+
+    def test_rpcf_against_fake_daemon(self, fake_transmission):
+        """Test rpcf snapshot reads against a populated fake daemon."""
+        fake_transmission.daemon.populate(100, spread_seconds=20)
+        rpcf._transmission_clients.clear()
+        rpcf._media_item_snapshots.clear()
+
+        with patch('src.utils.rpcf.hostname', '127.0.0.1'):
+            port = fake_transmission.server_port
+            media_items = rpcf.return_current_media_items(port=port, max_age=0)
+            item_count = rpcf.return_current_item_count(port=port, max_age=0)
+
+        assert len(media_items) == 100
+        assert item_count == 100
+        assert sum(item['progress'] == 100.0 for item in media_items.values()) > 0
+        rpcf._transmission_clients.clear()
+        rpcf._media_item_snapshots.clear()
@@ -0,0 +1,62 @@
+import pytest
+import json
+from tests.tools.parse_benchmark import *
+
+
+class TestParseBenchmark:
+    """Test cases for the release title parser benchmark."""
+
+    def test_run_benchmark(self, tmp_path):
+        """Test the report covers throughput, accuracy, and mismatches."""
+        corpus_path = tmp_path / "corpus.jsonl"
+        corpus_path.write_text("\n".join(json.dumps(entry) for entry in [
+            {'original_title': "Bottoms (2023) [720p] [BluRay] [YTS.MX]", 'media_type': "movie",
+             'media_title': "Bottoms", 'release_year': 2023, 'resolution': "720p"},
+            {'original_title': "60.Minutes.S57E38.1080p.WEB.h264-MeGusta", 'season': 57, 'episode': 38,
+             'uploader': "FLUX"}
+        ]) + "\n")
+
+        report = run_benchmark(load_corpus(corpus_path), repeat=2)
+
+        assert report['titles'] == 2
+        assert set(report['functions']) == {*BENCHMARKED_FUNCTIONS, 'extract_title'}
+        assert all(rate > 0 for rate in report['functions'].values())
+        assert report['parse_media_items'] > 0
+        assert report['accuracy']['release_year'] == {'correct': 1, 'labeled': 1, 'accuracy': 1.0}
+        assert report['accuracy']['season']['correct'] == 1
+        assert report['accuracy']['video_codec'] == {'correct': 0, 'labeled': 0, 'accuracy': None}
+        assert report['mismatches'] == [{
+            'original_title': "60.Minutes.S57E38.1080p.WEB.h264-MeGusta",
+            'field': 'uploader',
+            'expected': "FLUX",
+            'actual': "MeGusta"
+        }]
+
+        text = format_report(report)
+        assert "parse_media_items" in text
+        assert "uploader: expected 'FLUX', got 'MeGusta'" in text
+
+    def test_default_corpus(self):
+        """Test the sample corpus only labels known fields."""
+        corpus = load_corpus()
+
+        assert len(corpus) > 100
+        for entry in corpus:
+            assert set(entry) <= {'original_title', *LABELED_FIELDS}
+
+    def test_run_adversarial_benchmark(self):
+        """Test adversarial titles are timed at each length for both title parsers."""
+        report = run_adversarial_benchmark(lengths=(100, 1000))
+
+        assert list(report) == ['extract_title', 'parse_titles']
+        for timings in report.values():
+            assert set(timings) == set(ADVERSARIAL_TITLES)
+            for name, seconds in timings.items():
+                assert list(seconds) == [100, 1000]
+                assert len(ADVERSARIAL_TITLES[name](1000)) == 1000
+
+        text = format_adversarial_report(report)
+        assert "extract_title seconds by title length" in text
+        assert "parse_titles seconds by title length" in text
+        assert "space run" in text
+        assert "1,000" in text
@@ -0,0 +1,64 @@
+import pytest
+import polars as pl
+from unittest.mock import patch
+from src.utils.parse_cache import *
+
+SCHEMA = {'resolution': pl.Utf8, 'season': pl.Int32}
+
+
+@pytest.fixture
+def parse_cache(tmp_path):
+    with patch('src.utils.parse_cache.parse_cache_path', str(tmp_path / 'parse-cache.sqlite')):
+        yield
+
+
+class TestParseCache:
+    """Test cases for the parse result cache."""
+
+    def test_parser_version(self, tmp_path):
+        """Test the parser version changes with the content of its files."""
+        source = tmp_path / 'parser.py'
+        source.write_text("a")
+        version = parser_version(source)
+
+        assert parser_version(source) == version
+        source.write_text("b")
+        assert parser_version(source) != version
+
+    def test_parse_cache_round_trip(self, parse_cache):
+        """Test cached results are returned per title and media type and version."""
+        parsed = pl.DataFrame({
+            'original_title': ["Show.S01E02.1080p", "Show.S01E02.1080p", "Movie.2020", None],
+            'media_type': ["tv_show", "unknown", "movie", "movie"],
+            'resolution': ["1080p", "1080p", None, None],
+            'season': [1, None, None, None]
+        }, schema_overrides=SCHEMA)
+        cache_parses(parsed, "v1")
+
+        titles = pl.DataFrame({
+            'original_title': ["Show.S01E02.1080p", "Movie.2020", "Other"],
+            'media_type': ["tv_show", "tv_show", "movie"]
+        })
+        cached = get_cached_parses(titles, "v1", SCHEMA)
+
+        assert cached.schema == pl.Schema({'original_title': pl.Utf8, 'media_type': pl.Utf8, **SCHEMA})
+        assert cached.rows() == [("Show.S01E02.1080p", "tv_show", "1080p", 1)]
+        assert get_cached_parses(titles, "v2", SCHEMA).height == 0
+
+        # a new parser version drops the results of the old one
+        cache_parses(parsed.head(1), "v2")
+        assert get_cached_parses(titles, "v1", SCHEMA).height == 0
+        assert get_cached_parses(titles, "v2", SCHEMA).height == 1
+
+    def test_parse_cache_disabled(self):
+        """Test the cache reads nothing and writes nothing when no path is set."""
+        titles = pl.DataFrame({'original_title': ["Movie.2020"], 'media_type': ["movie"]})
+
+        with patch('src.utils.parse_cache.parse_cache_path', None), \
+                patch('src.utils.parse_cache.sqlite3.connect') as connect:
+            cache_parses(titles.with_columns(resolution=pl.lit(None, pl.Utf8)), "v1")
+            cached = get_cached_parses(titles, "v1", SCHEMA)
+
+        connect.assert_not_called()
+        assert cached.height == 0
+        assert cached.columns == ['original_title', 'media_type', 'resolution', 'season']
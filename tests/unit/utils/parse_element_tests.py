@@ -1,5 +1,8 @@
 import pytest
+import polars as pl
+import time
 from src.utils.parse_element import *
+from src.utils.parse_element import _match_title_rule
 from tests.fixtures.utils.parse_elements_fixtures import *
 
 class TestParseElements:
@@ -129,4 +132,155 @@ class TestParseElements:
             assert result == case["expected"], (
                 f"Failed for {case['description']}: "
                 f"expected {case['expected']}, got {result}"
-            )
\ No newline at end of file
+            )
+
+        # vocabulary literals match literally on ascii and non-ascii titles
+        assert extract_uploader("Movie 2020 1080p YTSxMX") is None
+        assert extract_uploader("Movié 2020 1080p YTSxMX") is None
+        assert extract_uploader("Movié 2020 1080p YTS.MX") == "YTS.MX"
+
+    def test_title_expressions(
+        self,
+        classify_media_type_cases,
+        extract_year_cases,
+        extract_season_from_episode_cases,
+        extract_episode_from_episode_cases,
+        extract_season_from_season_cases,
+        extract_season_from_episode_pack_cases,
+        extract_resolution_cases,
+        extract_video_codec_cases,
+        extract_audio_codec_cases,
+        extract_upload_type_cases,
+        extract_uploader_cases
+    ):
+        """Test polars expressions match the fixture scenarios of their functions."""
+        expression_cases = [
+            (classify_media_type_expr, classify_media_type_cases),
+            (extract_year_expr, extract_year_cases),
+            (extract_season_from_episode_expr, extract_season_from_episode_cases),
+            (extract_episode_from_episode_expr, extract_episode_from_episode_cases),
+            (extract_season_from_season_expr, extract_season_from_season_cases),
+            (extract_season_from_episode_pack_expr, extract_season_from_episode_pack_cases),
+            (extract_resolution_expr, extract_resolution_cases),
+            (extract_video_codec_expr, extract_video_codec_cases),
+            (extract_audio_codec_expr, extract_audio_codec_cases),
+            (extract_upload_type_expr, extract_upload_type_cases),
+            (extract_uploader_expr, extract_uploader_cases)
+        ]
+
+        for expression, cases in expression_cases:
+            titles = pl.DataFrame({"title": [case["title"] for case in cases]}, schema={"title": pl.Utf8})
+            results = titles.select(expression("title")).to_series().to_list()
+
+            for case, result in zip(cases, results):
+                assert result == case["expected"], (
+                    f"Failed for {expression.__name__} {case['description']}: "
+                    f"expected {case['expected']}, got {result}"
+                )
+
+    def test_extract_title_expr(self, extract_title_cases):
+        """Test the title expression matches all title extraction scenarios."""
+        titles = pl.DataFrame({
+            "raw_title": [case["raw_title"] for case in extract_title_cases],
+            "media_type": [case["media_type"] for case in extract_title_cases]
+        })
+        results = titles.select(extract_title_expr("raw_title", "media_type")).to_series().to_list()
+
+        for case, result in zip(extract_title_cases, results):
+            assert result == case["expected"], (
+                f"Failed for {case['description']}: "
+                f"expected {case['expected']}, got {result}"
+            )
+
+    def test_parse_release_title_expr(self, extract_title_cases):
+        """Test the single parse expression matches the per-element functions."""
+        titles = pl.DataFrame({
+            "raw_title": [case["raw_title"] for case in extract_title_cases],
+            "media_type": [case["media_type"] for case in extract_title_cases]
+        })
+        results = titles.select(
+            parse_release_title_expr("raw_title", "media_type").struct.unnest()
+        ).to_dicts()
+
+        def as_int(value):
+            return int(value) if value is not None else None
+
+        for case, result in zip(extract_title_cases, results):
+            raw_title, media_type = case["raw_title"], case["media_type"]
+            season = {
+                "tv_show": extract_season_from_episode,
+                "tv_season": extract_season_from_season,
+                "tv_episode_pack": extract_season_from_episode_pack
+            }.get(media_type)
+            expected = {
+                "resolution": extract_resolution(raw_title),
+                "video_codec": extract_video_codec(raw_title),
+                "audio_codec": extract_audio_codec(raw_title),
+                "upload_type": extract_upload_type(raw_title),
+                "uploader": extract_uploader(raw_title),
+                "release_year": as_int(extract_year(raw_title)) if media_type == "movie" else None,
+                "season": as_int(season(raw_title)) if season else None,
+                "episode": as_int(extract_episode_from_episode(raw_title)) if media_type == "tv_show" else None,
+                "media_title": extract_title(raw_title, media_type)
+            }
+            assert result == expected, (
+                f"Failed for {case['description']}: "
+                f"expected {expected}, got {result}"
+            )
+
+    def test_expand_vocabulary_entry(self):
+        """Test brace alternatives expand in the order a regex tries them."""
+        assert expand_vocabulary_entry("FLUX") == ["FLUX"]
+        assert expand_vocabulary_entry("h{., ,}264") == ["h.264", "h 264", "h264"]
+        assert expand_vocabulary_entry("DTS{-HD,}{{., }5.1,}") == [
+            "DTS-HD.5.1", "DTS-HD 5.1", "DTS-HD", "DTS.5.1", "DTS 5.1", "DTS"
+        ]
+
+        with pytest.raises(ValueError):
+            expand_vocabulary_entry("h{.,264")
+
+    def test_load_vocabularies(self, tmp_path):
+        """Test vocabularies load from yaml as expanded literals."""
+        path = tmp_path / "release-vocabularies.yaml"
+        path.write_text("uploaders:\n  - FLUX\n  - \"YTS{.,}MX\"\n")
+
+        assert load_vocabularies(path) == {'uploaders': ["FLUX", "YTS.MX", "YTSMX"]}
+        assert set(VOCABULARIES) == {'video_codecs', 'audio_codecs', 'upload_types', 'uploaders'}
+
+    def test_title_rules_match_patterns(self):
+        """Test the linear title rules capture what the title patterns capture."""
+        titles = [
+            "Movie (2020) 1080p", "Movie.Name.2020.1080p", "Movie 1080p", "(2020) 1080p",
+            " (2020)", "\n\n(2020) (2021)", "Show (2019) extra\nS01E02", "Show.2019..S01E02",
+            "Show 2019 S01E02-05", "Show.S01E02", "Show 2020 Season 1", "Show.s03", "s01e02",
+            "Show - 2019 - sE", " \n Show\t2020  s1e2"
+        ]
+        for title in titles:
+            for media_type, patterns in title_patterns.items():
+                expected = None
+                for pattern in patterns:
+                    match = pattern.search(title)
+                    if match:
+                        expected = match.group(1)
+                        break
+                result = None
+                for rule in compiled_title_rules[media_type]:
+                    result = _match_title_rule(title, rule)
+                    if result is not None:
+                        break
+                assert result == expected, f"Failed for {title!r} as {media_type}"
+
+    def test_extract_title_linear_time(self):
+        """Test long junk-filled titles do not stall title extraction."""
+        titles = [
+            "a" + " " * 20000 + "b",
+            "Title" + ".-_ " * 5000,
+            "s1" * 10000,
+            "(2020)" * 5000,
+            "2020 " * 5000 + "\nS01E02"
+        ]
+        start = time.perf_counter()
+        for title in titles:
+            for media_type in title_patterns:
+                extract_title(title, media_type)
+        assert time.perf_counter() - start < 5
@@ -0,0 +1,357 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from transmission_rpc import Torrent
+from transmission_rpc.error import TransmissionConnectError
+from src.utils import rpcf
+from src.utils.rpcf import *
+from tests.tools.fake_transmission import start_fake_transmission
+
+class TestRpcf:
+    """Test cases for rpcf functions."""
+
+    def setup_method(self):
+        rpcf._transmission_clients.clear()
+        rpcf._media_item_snapshots.clear()
+
+    @staticmethod
+    def _torrent(id: int, hash: str, **fields) -> Torrent:
+        return Torrent(fields={
+            'id': id,
+            'hashString': hash,
+            'name': f'item.{id}',
+            'status': 4,
+            'magnetLink': f'magnet:?xt=urn:btih:{hash}',
+            'percentDone': 0.0,
+            'totalSize': 1000,
+            'rateUpload': 0,
+            'rateDownload': 0,
+            'peersConnected': 0,
+            'eta': -1,
+            'downloadDir': '/downloads',
+            **fields
+        })
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_get_transmission_client_reused(self, mock_client_class):
+        """Test a single client is constructed per port and reused."""
+        mock_client_class.side_effect = lambda **kwargs: MagicMock()
+
+        first = get_transmission_client(9091)
+        second = get_transmission_client(9091)
+        other = get_transmission_client(9092)
+
+        assert first is second
+        assert first is not other
+        assert mock_client_class.call_count == 2
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_reconnect_on_connection_error(self, mock_client_class):
+        """Test a lost connection discards the cached client and retries once."""
+        stale_client = MagicMock()
+        stale_client.remove_torrent.side_effect = TransmissionConnectError("connection refused")
+        fresh_client = MagicMock()
+        mock_client_class.side_effect = [stale_client, fresh_client]
+
+        remove_media_item("a" * 40)
+
+        stale_client.remove_torrent.assert_called_once_with("a" * 40, delete_data=True)
+        fresh_client.remove_torrent.assert_called_once_with("a" * 40, delete_data=True)
+        assert get_transmission_client() is fresh_client
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_return_current_media_items_projection(self, mock_client_class):
+        """Test media items are built from only the projected torrent fields."""
+        fields = {
+            'id': 1,
+            'hashString': 'a' * 40,
+            'name': 'Some.Movie.2020.1080p',
+            'status': 4,
+            'magnetLink': 'magnet:?xt=urn:btih:' + 'a' * 40,
+            'percentDone': 0.5,
+            'totalSize': 1000,
+            'rateUpload': 10,
+            'rateDownload': 20,
+            'peersConnected': 3,
+            'eta': 60,
+            'downloadDir': '/downloads'
+        }
+        assert set(fields) == set(MEDIA_ITEM_FIELDS)
+
+        mock_client = MagicMock()
+        mock_client.get_torrents.return_value = [Torrent(fields=fields)]
+        mock_client_class.return_value = mock_client
+
+        result = return_current_media_items()
+
+        mock_client.get_torrents.assert_called_once_with(arguments=MEDIA_ITEM_FIELDS)
+        assert result['a' * 40]['name'] == 'Some.Movie.2020.1080p'
+        assert result['a' * 40]['progress'] == 50.0
+        assert result['a' * 40]['download_dir'] == '/downloads'
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_incremental_snapshot_sync(self, mock_client_class):
+        """Test polls after a full sync only apply recently-active deltas."""
+        mock_client = MagicMock()
+        mock_client.get_torrents.return_value = [
+            self._torrent(1, 'a' * 40),
+            self._torrent(2, 'b' * 40)
+        ]
+        mock_client.get_recently_active_torrents.return_value = (
+            [self._torrent(1, 'a' * 40, percentDone=1.0), self._torrent(3, 'c' * 40)],
+            [2]
+        )
+        mock_client_class.return_value = mock_client
+
+        first = return_current_media_items(max_age=0)
+        second = return_current_media_items(max_age=0)
+
+        assert set(first) == {'a' * 40, 'b' * 40}
+        assert set(second) == {'a' * 40, 'c' * 40}
+        assert second['a' * 40]['progress'] == 100.0
+        assert return_current_item_count(max_age=0) == 2
+        mock_client.get_torrents.assert_called_once_with(arguments=MEDIA_ITEM_FIELDS)
+        assert mock_client.get_recently_active_torrents.call_count == 2
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_snapshot_full_resync(self, mock_client_class):
+        """Test a stale or explicitly refreshed snapshot is fully resynced."""
+        mock_client = MagicMock()
+        mock_client.get_torrents.return_value = [self._torrent(1, 'a' * 40)]
+        mock_client_class.return_value = mock_client
+
+        return_current_media_items(max_age=0)
+        return_current_media_items(full=True)
+        with patch('src.utils.rpcf.torrent_resync_interval', 0):
+            return_current_media_items(max_age=0)
+
+        assert mock_client.get_torrents.call_count == 3
+        mock_client.get_recently_active_torrents.assert_not_called()
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_snapshot_shared_until_invalidated(self, mock_client_class):
+        """Test reads within max_age reuse one listing until items change."""
+        mock_client = MagicMock()
+        mock_client.get_torrents.return_value = [self._torrent(1, 'a' * 40)]
+        mock_client.get_recently_active_torrents.return_value = ([self._torrent(2, 'b' * 40)], [])
+        mock_client_class.return_value = mock_client
+
+        return_current_media_items(max_age=60)
+        assert return_current_item_count(max_age=60) == 1
+        assert mock_client.get_torrents.call_count == 1
+
+        add_media_item('b' * 40)
+        result = return_current_media_items(max_age=60)
+
+        assert set(result) == {'a' * 40, 'b' * 40}
+        mock_client.get_recently_active_torrents.assert_called_once()
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_snapshot_shared_across_processes(self, mock_client_class, tmp_path):
+        """Test a snapshot written to the cache file is reused by another process."""
+        mock_client = MagicMock()
+        mock_client.get_torrents.return_value = [self._torrent(1, 'a' * 40)]
+        mock_client_class.return_value = mock_client
+
+        with patch('src.utils.rpcf.snapshot_cache_path', str(tmp_path / 'snapshot.json')):
+            return_current_media_items(max_age=60)
+            # simulate a fresh process with no in-memory snapshot
+            rpcf._media_item_snapshots.clear()
+            result = return_current_media_items(max_age=60)
+
+        assert result['a' * 40]['id'] == 1
+        assert mock_client.get_torrents.call_count == 1
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_return_current_media_frame(self, mock_client_class):
+        """Test the snapshot is returned as a typed DataFrame keyed by hash."""
+        mock_client = MagicMock()
+        mock_client.get_torrents.return_value = [
+            self._torrent(1, 'a' * 40, percentDone=1.0),
+            self._torrent(2, 'b' * 40, eta=120)
+        ]
+        mock_client_class.return_value = mock_client
+
+        result = return_current_media_frame(max_age=0)
+
+        assert result.schema == MEDIA_ITEM_SCHEMA
+        assert result['hash'].to_list() == ['a' * 40, 'b' * 40]
+        assert result['progress'].to_list() == [100.0, 0.0]
+        assert result['status'].to_list() == ['downloading', 'downloading']
+        assert result['eta'].to_list() == [-1, 120]
+
+        mock_client.get_torrents.return_value = []
+        empty = return_current_media_frame(full=True)
+
+        assert empty.height == 0
+        assert empty.schema == MEDIA_ITEM_SCHEMA
+
+    @patch('src.utils.rpcf.add_media_item')
+    def test_add_media_items(self, mock_add_item):
+        """Test bulk initiation captures a result for every item."""
+        def add_or_fail(media_item_source, port, host):
+            if media_item_source == "bad":
+                raise ValueError("invalid magnet")
+
+        mock_add_item.side_effect = add_or_fail
+
+        result = add_media_items(["a" * 40, "bad", "b" * 40], max_workers=2)
+
+        assert result == {"a" * 40: None, "bad": "invalid magnet", "b" * 40: None}
+        assert mock_add_item.call_count == 3
+        assert add_media_items([]) == {}
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_get_media_item_info(self, mock_client_class):
+        """Test item info is read from the daemon holding the item."""
+        mock_client = MagicMock()
+        mock_client.get_torrent.return_value = self._torrent(1, "a" * 40)
+        mock_client.get_torrents.return_value = [self._torrent(1, "a" * 40)]
+        mock_client_class.return_value = mock_client
+
+        media_item = get_media_item_info("a" * 40, arguments=['id', 'hashString'])
+
+        assert media_item.hash_string == "a" * 40
+        mock_client.get_torrent.assert_called_once_with("a" * 40, arguments=['id', 'hashString'])
+
+        endpoints = [('node-a', '9091'), ('node-b', '9091')]
+        with patch('src.utils.rpcf.transmission_endpoints', endpoints):
+            assert get_media_item_info("a" * 40).hash_string == "a" * 40
+            with pytest.raises(ValueError):
+                get_media_item_info("b" * 40)
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_remove_media_items_single_request(self, mock_client_class):
+        """Test batched removal sends one torrent-remove for all hashes."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        hashes = ["a" * 40, "b" * 40]
+
+        result = remove_media_items(hashes)
+
+        mock_client.remove_torrent.assert_called_once_with(hashes, delete_data=True)
+        assert result == {"a" * 40: None, "b" * 40: None}
+        assert remove_media_items([]) == {}
+
+    @patch('src.utils.rpcf.Transmission_client')
+    def test_remove_media_items_fallback(self, mock_client_class):
+        """Test a failed batch is retried per hash to isolate failures."""
+        def remove(ids, delete_data):
+            if isinstance(ids, list) or ids == "b" * 40:
+                raise ValueError("invalid torrent id")
+
+        mock_client = MagicMock()
+        mock_client.remove_torrent.side_effect = remove
+        mock_client_class.return_value = mock_client
+
+        result = remove_media_items(["a" * 40, "b" * 40])
+
+        assert result == {"a" * 40: None, "b" * 40: "invalid torrent id"}
+        assert mock_client.remove_torrent.call_count == 3
+
+    def test_parse_endpoints(self):
+        """Test endpoint lists parse hosts, ports and optional download dirs."""
+        assert rpcf._parse_endpoints("node-a:9091@/mnt/a,node-b:9092") == [
+            ("node-a", "9091", "/mnt/a"),
+            ("node-b", "9092", None)
+        ]
+        assert rpcf._parse_endpoints(None) == [(rpcf.hostname, rpcf.transmission_port, None)]
+        with pytest.raises(ValueError):
+            rpcf._parse_endpoints("node-a")
+
+    def test_daemon_pool(self):
+        """Test new items go to the least loaded daemon and removals are routed."""
+        busy = start_fake_transmission(download_seconds=3600, seed=1)
+        idle = start_fake_transmission(download_seconds=3600, seed=2)
+        busy.daemon.populate(3)
+        endpoints = [('127.0.0.1', busy.server_port), ('127.0.0.1', idle.server_port)]
+
+        try:
+            with patch('src.utils.rpcf.transmission_endpoints', endpoints), \
+                    patch('src.utils.rpcf.endpoint_download_dirs', {endpoints[1]: '/mnt/idle'}):
+                hashes = [c * 40 for c in 'abcde']
+
+                assert assign_daemons(5) == [endpoints[1]] * 3 + [endpoints[0], endpoints[1]]
+
+                results = add_media_items(hashes)
+                locations, unlocated = locate_media_items(hashes)
+                download_dirs, unknown_dirs = get_download_dirs(hashes)
+                item_count = return_current_item_count()
+                removals = remove_media_items(hashes)
+                remaining = return_current_media_items()
+
+            assert all(error is None for error in results.values())
+            assert locations == dict(zip(hashes, [endpoints[1]] * 3 + [endpoints[0], endpoints[1]]))
+            assert unlocated == []
+            assert download_dirs == {hash: '/mnt/idle' for hash, endpoint in locations.items() if endpoint == endpoints[1]}
+            assert unknown_dirs == []
+            assert item_count == 8
+            assert all(error is None for error in removals.values())
+            assert len(remaining) == 3
+            assert len(idle.daemon.torrents) == 0
+        finally:
+            for server in (busy, idle):
+                server.shutdown()
+                server.server_close()
+
+    def test_daemon_pool_unavailable_daemon(self):
+        """Test an unreachable daemon neither fails pool reads nor has its items removed elsewhere."""
+        up = start_fake_transmission(download_seconds=3600, seed=1)
+        down = start_fake_transmission(download_seconds=3600, seed=2)
+        up.daemon.populate(2)
+        down.daemon.populate(3)
+        endpoints = [('127.0.0.1', up.server_port), ('127.0.0.1', down.server_port)]
+        down_hashes = [torrent['hash'] for torrent in down.daemon.torrents.values()]
+
+        try:
+            with patch('src.utils.rpcf.transmission_endpoints', endpoints):
+                assert return_current_item_count(max_age=0) == 5
+
+                # items on no daemon are already removed while every daemon answers
+                assert locate_media_items(["f" * 40], max_age=0) == ({}, [])
+                assert remove_media_items(["f" * 40]) == {"f" * 40: None}
+
+                down.shutdown()
+                down.server_close()
+
+                # the unreachable daemon is reported, and its items left out
+                media_items = return_current_media_items(max_age=0)
+                media_frame, unreachable_endpoints = return_current_media_state(max_age=0)
+                locations, unlocated = locate_media_items(down_hashes + ["f" * 40], max_age=0)
+                rpcf._media_item_snapshots.clear()
+                removals = remove_media_items(down_hashes + ["f" * 40])
+
+                up.shutdown()
+                up.server_close()
+                with pytest.raises(Exception):
+                    return_current_media_items(max_age=0)
+
+            assert len(media_items) == 2
+            assert media_frame.height == 2
+            assert unreachable_endpoints == [endpoints[1]]
+            assert locations == {}
+            assert unlocated == down_hashes + ["f" * 40]
+            assert set(removals) == set(down_hashes) | {"f" * 40}
+            assert all(error == "not found on any reachable transmission daemon" for error in removals.values())
+            assert len(up.daemon.torrents) == 2
+        finally:
+            for server in (up, down):
+                server.shutdown()
+                server.server_close()
+
+    def test_purge_media_item_queue(self):
+        """Test every daemon's queue is purged without locating items across the pool."""
+        servers = [start_fake_transmission(download_seconds=3600, seed=seed) for seed in (1, 2)]
+        for server in servers:
+            server.daemon.populate(3)
+        endpoints = [('127.0.0.1', server.server_port) for server in servers]
+
+        try:
+            with patch('src.utils.rpcf.transmission_endpoints', endpoints), \
+                    patch('src.utils.rpcf.locate_media_items', side_effect=AssertionError):
+                purge_media_item_queue()
+
+            assert all(len(server.daemon.torrents) == 0 for server in servers)
+        finally:
+            for server in servers:
+                server.shutdown()
+                server.server_close()
@@ -0,0 +1,39 @@
+import pytest
+import json
+from unittest.mock import patch
+from src.utils.rss_validators import *
+
+
+class TestRssValidators:
+    """Test cases for the rss feed validator store."""
+
+    def test_rss_validators_round_trip(self, tmp_path):
+        """Test stored validators are loaded back per feed url."""
+        validator_path = tmp_path / 'rss-validators.json'
+        validators = {
+            "https://yts.mx/rss/": {'etag': '"v1"', 'modified': "Mon, 05 Oct 2026 10:00:00 GMT"},
+            "https://episodefeed.com/rss/1": {'etag': None, 'modified': None}
+        }
+
+        with patch('src.utils.rss_validators.rss_validator_path', str(validator_path)):
+            assert load_rss_validators() == {}
+            save_rss_validators(validators)
+            assert load_rss_validators() == validators
+
+        assert not (tmp_path / 'rss-validators.json.tmp').exists()
+
+    def test_rss_validators_disabled_or_unreadable(self, tmp_path):
+        """Test a disabled store is a no-op, and an unreadable one starts empty."""
+        with patch('src.utils.rss_validators.rss_validator_path', None):
+            assert load_rss_validators() is None
+            save_rss_validators({"url": {'etag': '"v1"'}})
+
+        validator_path = tmp_path / 'rss-validators.json'
+        validator_path.write_text("{not json")
+        with patch('src.utils.rss_validators.rss_validator_path', str(validator_path)):
+            assert load_rss_validators() == {}
+
+        # a failed write leaves the previous validators in place
+        with patch('src.utils.rss_validators.rss_validator_path', str(tmp_path / 'missing' / 'rss-validators.json')):
+            save_rss_validators({"url": {'etag': '"v1"'}})
+            assert load_rss_validators() == {}
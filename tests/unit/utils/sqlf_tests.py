@@ -0,0 +1,79 @@
+import pytest
+import polars as pl
+from unittest.mock import patch, MagicMock
+from src.utils.sqlf import MediaWriteBuffer
+from tests.fixtures.utils.sqlf_fixtures import *
+
+class TestMediaWriteBuffer:
+    """Test cases for the MediaWriteBuffer write-behind buffer."""
+
+    @patch('src.utils.sqlf.media_db_update')
+    def test_media_write_buffer(self, mock_db_update, media_write_buffer_cases):
+        """Test all MediaWriteBuffer scenarios from fixture."""
+        for case in media_write_buffer_cases:
+            mock_db_update.reset_mock()
+
+            with MediaWriteBuffer(max_items=case["max_items"], max_age=3600) as write_buffer:
+                for row in case["rows"]:
+                    write_buffer.add_row(row)
+
+            writes = [call.kwargs['media'].to_dicts() for call in mock_db_update.call_args_list]
+            assert writes == case["expected_writes"], (
+                f"Failed for {case['description']}: "
+                f"expected {case['expected_writes']}, got {writes}"
+            )
+            assert len(write_buffer) == 0
+
+    @patch('src.utils.sqlf.media_db_update')
+    def test_media_write_buffer_failed_rows(self, mock_db_update):
+        """Test a failing row is isolated and the remaining rows are still written."""
+        def fail_on_b(media):
+            if 'b' in media['hash'].to_list():
+                raise ValueError("invalid row")
+
+        mock_db_update.side_effect = fail_on_b
+
+        write_buffer = MediaWriteBuffer(max_items=10, max_age=3600)
+        write_buffer.add(pl.DataFrame({
+            'hash': ['a', 'b', 'c'],
+            'pipeline_status': ['transferred'] * 3
+        }))
+
+        assert write_buffer.flush() == ['b']
+        written = [call.kwargs['media']['hash'].to_list() for call in mock_db_update.call_args_list]
+        assert written == [['a', 'b', 'c'], ['a'], ['b'], ['c']]
+        assert write_buffer.failed_hashes == ['b']
+        assert write_buffer.flush() == []
+        assert len(write_buffer) == 0
+
+    @patch('src.utils.sqlf.media_db_update')
+    def test_media_write_buffer_validator(self, mock_db_update):
+        """Test the validator is applied once to each added row."""
+        validator = MagicMock(side_effect=lambda media: media.with_columns(validated=pl.lit(True)))
+        write_buffer = MediaWriteBuffer(max_items=10, max_age=3600, validator=validator)
+        write_buffer.add_row({'hash': 'a', 'pipeline_status': 'complete'})
+        write_buffer.add(pl.DataFrame([{'hash': 'b', 'pipeline_status': 'complete'}]))
+        write_buffer.flush()
+
+        media = mock_db_update.call_args.kwargs['media']
+        assert media['validated'].to_list() == [True, True]
+        assert validator.call_count == 2
+
+    @patch('src.utils.sqlf.media_db_update')
+    def test_media_write_buffer_invalid_row(self, mock_db_update):
+        """Test an invalid row raises when added and is never buffered."""
+        def reject_b(media):
+            if 'b' in media['hash'].to_list():
+                raise ValueError("invalid record")
+            return media
+
+        write_buffer = MediaWriteBuffer(max_items=10, max_age=3600, validator=reject_b)
+        write_buffer.add_row({'hash': 'a', 'pipeline_status': 'complete'})
+        with pytest.raises(ValueError):
+            write_buffer.add(pl.DataFrame([{'hash': 'b', 'pipeline_status': 'complete'}]))
+        with pytest.raises(ValueError):
+            write_buffer.add_row({'hash': 'b', 'pipeline_status': 'complete'})
+
+        assert len(write_buffer) == 1
+        write_buffer.flush()
+        assert mock_db_update.call_args.kwargs['media']['hash'].to_list() == ['a']
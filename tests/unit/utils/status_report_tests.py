@@ -0,0 +1,42 @@
+import pytest
+import polars as pl
+from unittest.mock import patch
+from src.data_models import PipelineStatus
+from src.utils.status_report import *
+from src.utils import status_report
+from tests.fixtures.utils.status_report_fixtures import *
+
+class TestStatusReport:
+    """Test cases for status_report functions."""
+
+    def test_build_status_report(self, build_status_report_cases):
+        """Test all build_status_report scenarios from fixture."""
+        for case in build_status_report_cases:
+            summary = pl.DataFrame(case["summary"]) if case["summary"] is not None else None
+            result = build_status_report(summary)
+
+            assert result["pipeline_status"].to_list() == [status.value for status in PipelineStatus], (
+                f"Failed for {case['description']}: statuses missing or out of order"
+            )
+
+            rows = {row["pipeline_status"]: row for row in result.iter_rows(named=True)}
+            for pipeline_status, expected in case["expected"].items():
+                for field, expected_value in expected.items():
+                    actual_value = rows[pipeline_status][field]
+                    assert actual_value == expected_value, (
+                        f"Failed for {case['description']}: "
+                        f"expected {pipeline_status} {field}={expected_value}, got {actual_value}"
+                    )
+
+    @patch('src.utils.status_report.get_pipeline_status_summary', return_value=None)
+    def test_get_status_report_cache(self, mock_summary):
+        """Test that reports are reused within max_age and refreshed after."""
+        status_report._status_cache.update({'fetched_at': None, 'report': None})
+
+        first = get_status_report(max_age=60)
+        second = get_status_report(max_age=60)
+        assert first is second
+        assert mock_summary.call_count == 1
+
+        get_status_report(max_age=0)
+        assert mock_summary.call_count == 2